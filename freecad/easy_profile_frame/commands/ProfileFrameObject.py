@@ -3,7 +3,12 @@ from freecad.easy_profile_frame import ICONPATH
 from FreeCAD import Units as FCUnits
 import os
 from freecad.easy_profile_frame.typing import SketchObject, AppPart, Body, Feature, Edge
-from .utils import GetExistent, CopyObj
+from .utils import GetExistent, CopyObj, CopyGeometry, GetObject
+from .lod import DETAIL_MODES, resolve_detail, make_detail_shape
+from .profile_cache import get_section
+from .invalidation import invalidation
+from .sweep_cache import IsCurved, attached_frame, get_sweep
+from .machining import GetHolePattern, hole_tool
 import Part
 import math
 
@@ -113,6 +118,8 @@ class ProfileFrameObject:
             "Extended length of the right side. \
                         (When Chanfer Angle is set, this property will be determined automatically)",
         ).ExtendedLengthR = 0.0
+        self.add_display_properties(obj)
+        self.add_machining_properties(obj)
 
         # Initialize state variables(Needs to be stored when the document is saved)
         self._last_offset_x = obj.OffsetX
@@ -122,6 +129,13 @@ class ProfileFrameObject:
         self.chamfer_sketch_cache: list = [None, None]
         self.sketchLableL = None
         self.sketchR: tuple[str, str] | None = None  # (Label, Name)
+        # Objects the copied sketches were made from, None once they changed.
+        self.sketch_source: tuple[str, str] | None = None  # (Document, Name)
+        self.sketchR_source: str | None = None  # Name of the left sketch
+        self.tip_name: str | None = None
+        self.detail_range = (0.0, 0.0)  # (z_start, z_end) of the member in the sketch
+        self.shown_detail: str | None = None
+        self.curved = False  # Swept along an arc or a spline
 
         obj.addExtension("Part::AttachExtensionPython")
         obj.addExtension("App::GroupExtensionPython")
@@ -130,6 +144,52 @@ class ProfileFrameObject:
         if hasattr(obj, "ViewObject"):
             obj.ViewObject.Proxy = CustomObjectViewProvider(obj.ViewObject)
 
+    def add_display_properties(self, obj):
+        if hasattr(obj, "DisplayDetail"):
+            return
+        obj.addProperty(
+            "App::PropertyEnumeration",
+            "DisplayDetail",
+            "EasyProfileFrame",
+            "Representation of the member. Simplified ones are much faster to display in huge frames",
+        )
+        obj.DisplayDetail = DETAIL_MODES
+        obj.DisplayDetail = "Full"
+
+    def add_machining_properties(self, obj):
+        if hasattr(obj, "Holes"):
+            return
+        obj.addProperty(
+            "App::PropertyStringList",
+            "Holes",
+            "EasyProfileFrame",
+            "End machining, e.g. 'Tap L' or 'Access R 1 20', see the hole patterns of the profile",
+        )
+
+    def onChanged(self, obj, prop):
+        if prop == "DisplayDetail" and getattr(self, "tip_name", None):
+            self.update_display(obj)
+
+    def update_display(self, obj, force=False):
+        """Show the full or a simplified representation according to DisplayDetail."""
+        tip = obj.getObject(self.tip_name) if self.tip_name else None
+        if tip is None:
+            return
+        # Simplified representations are straight
+        detail = "Full" if self.curved else resolve_detail(obj)
+        if detail == self.shown_detail and not force:
+            return
+        if detail == "Full":
+            shape = tip.Shape
+        else:
+            sketchL = obj.getObject(obj.Sketch)
+            shape = make_detail_shape(get_section(sketchL), detail, *self.detail_range)
+            shape.Placement = sketchL.Placement
+        placement = obj.Placement
+        obj.Shape = shape
+        obj.Placement = placement
+        self.shown_detail = detail
+
     def apply_offset_and_rotation(
         self, obj, offset_x, offset_y, angle, offset_z=FCUnits.Quantity(0)
     ):
@@ -166,6 +226,8 @@ class ProfileFrameObject:
     def onDocumentRestored(self, obj):
         """Initialize when restoring from a file"""
         obj.Proxy = self
+        self.add_display_properties(obj)
+        self.add_machining_properties(obj)
         if hasattr(obj, "ViewObject"):
             obj.ViewObject.Proxy = CustomObjectViewProvider(obj.ViewObject)
 
@@ -183,17 +245,21 @@ class ProfileFrameObject:
             raise ValueError("Invalid edge name format. Use 'SketchName:EdgeN'")
 
         sketchL = obj.getObject(obj.Sketch)
-        edge_sketch: SketchObject = App.ActiveDocument.getObject(edge_sketch_name)
+        edge_sketch: SketchObject = GetObject(obj.Document, edge_sketch_name)
 
         # Perform the sweep
         edge: Edge = edge_sketch.getSubObject(subedge)
+        if IsCurved(edge):
+            self.sweep(obj, sketchL, edge_sketch, subedge, edge)
+            return
+        self.curved = False
         pad_length = edge.Length
         if obj.ChamferAngleR == 0:
             pad_length += obj.ExtendedLengthR.Value
         if obj.ChamferAngleL == 0:
             pad_length += obj.ExtendedLengthL.Value  # Then set offset below
             _offset_z = obj.ExtendedLengthL
-        baseObj = self.pad(sketchL, pad_length, obj, obj.EdgeName, reversed=True)
+        baseObj = self.pad(sketchL, pad_length, obj, f"pad_{obj.Name}", reversed=True)
 
         # Chamfer
         if obj.ChamferAngleL > 0:
@@ -208,7 +274,7 @@ class ProfileFrameObject:
             obj.ExtendedLengthL = FCUnits.Quantity(extended_length)
             obj.setEditorMode("ExtendedLengthL", 1)
         else:
-            self.clean_chamfer(obj, f"Chamfer_{obj.Name}_L")
+            self.park_chamfer(obj, f"Chamfer_{obj.Name}_L")
         if obj.ChamferAngleR > 0:
             sketchR = self.getSketchR(obj, pad_length)
             baseObj, extended_length = self.create_chamfer(
@@ -224,7 +290,7 @@ class ProfileFrameObject:
             obj.ExtendedLengthR = FCUnits.Quantity(extended_length)
             obj.setEditorMode("ExtendedLengthR", 1)
         else:
-            self.clean_chamfer(obj, f"Chamfer_{obj.Name}_R", right=True)
+            self.park_chamfer(obj, f"Chamfer_{obj.Name}_R", right=True)
             # Extend the right side
             # if obj.ExtendedLengthR > 0:
             #     sketchR = self.getSketchR(obj, pad_length)
@@ -234,7 +300,14 @@ class ProfileFrameObject:
             pad_length + obj.ExtendedLengthL.Value + obj.ExtendedLengthR.Value
         )
 
-        obj.Shape = baseObj.Shape
+        self.drop_edge_pads(obj, baseObj)
+        baseObj = self.machine(obj, sketchL, baseObj)
+        self.tip_name = baseObj.Name
+        self.detail_range = (
+            obj.ExtendedLengthL.Value if obj.ChamferAngleL > 0 else 0.0,
+            -pad_length - (obj.ExtendedLengthR.Value if obj.ChamferAngleR > 0 else 0.0),
+        )
+        self.update_display(obj, force=True)
 
         # Apply offset and rotation to the obj
         self.apply_offset_and_rotation(
@@ -247,6 +320,82 @@ class ProfileFrameObject:
         # Ensure the geometry is visible
         obj.purgeTouched()
 
+    def sweep(self, obj, sketchL, edge_sketch, subedge: str, edge: Edge):
+        """
+        Sweep the profile along a curved edge. The solid is shared by the members with the
+        same profile and bend. Chamfers and extensions are not applied to curved members.
+        """
+        ignored = (
+            obj.ChamferAngleL.Value,
+            obj.ChamferAngleR.Value,
+            obj.ExtendedLengthL.Value,
+            obj.ExtendedLengthR.Value,
+        )
+        # Warn once for each change, not on every recompute
+        if any(ignored) and ignored != getattr(self, "_ignored_treatments", None):
+            App.Console.PrintWarning(
+                f"{obj.Label}: chamfers and extensions are ignored on curved edges \n"
+            )
+        self._ignored_treatments = ignored
+        self.park_chamfer(obj, f"Chamfer_{obj.Name}_L")
+        self.park_chamfer(obj, f"Chamfer_{obj.Name}_R", right=True)
+
+        self.apply_offset_and_rotation(obj, obj.OffsetX, obj.OffsetY, obj.Angle)
+        frame = attached_frame(edge_sketch, subedge, obj.AttachmentOffset)
+        path = edge.copy()
+        path.Placement = frame.inverse().multiply(path.Placement)
+        feature = GetExistent(f"frame_sweep_{obj.Name}", "Part::Feature", obj)
+        feature.Shape = get_sweep(sketchL.Shape, path)
+        feature.Visibility = False
+        sketchL.Visibility = False
+        feature.purgeTouched()
+
+        obj.Length = FCUnits.Quantity(edge.Length)
+        self.tip_name = feature.Name
+        self.curved = True
+        self.update_display(obj, force=True)
+
+        obj.AttachmentSupport = [(edge_sketch, subedge)]
+        obj.MapMode = "NormalToEdge"
+        obj.purgeTouched()
+
+    def machine(self, obj, sketchL, baseObj):
+        """Drill the holes of the Holes property with a single cut, return the new tip."""
+        feature = obj.getObject(f"frame_holes_{obj.Name}")
+        pattern = GetHolePattern(self.sketchLableL)
+        if not obj.Holes or pattern is None:
+            if feature is not None:
+                obj.Document.removeObject(feature.Name)
+            return baseObj
+        section = get_section(sketchL)
+        # The left end face is at z = 0, the right one at the bottom of the solid
+        length = -baseObj.Shape.BoundBox.ZMin
+        tools = [
+            tool
+            for tool in (hole_tool(section, pattern, hole, length) for hole in obj.Holes)
+            if tool is not None
+        ]
+        if feature is None:
+            feature = GetExistent(f"frame_holes_{obj.Name}", "Part::Feature", obj)
+        feature.Shape = baseObj.Shape.cut(Part.makeCompound(tools)) if tools else baseObj.Shape
+        feature.Visibility = False
+        feature.purgeTouched()
+        return feature
+
+    def drop_edge_pads(self, body: Body, pad_obj):
+        """
+        Remove the pads named after an edge (frame_Sketch_EdgeN), left by older versions and by
+        members rebound to another edge. The chamfers are re-linked to pad_obj beforehand.
+        """
+        for feature in body.Group:
+            if (
+                feature.TypeId == "PartDesign::Pad"
+                and feature.Name.startswith("frame_")
+                and not feature.Name.startswith(("frame_pad_", "frame_Chamfer_extend_"))
+                and feature != pad_obj
+            ):
+                body.Document.removeObject(feature.Name)
+
     def pad(
         self,
         sketch: SketchObject,
@@ -284,6 +433,11 @@ class ProfileFrameObject:
             "chamfer_sketch_cache": self.chamfer_sketch_cache,
             "sketchLableL": self.sketchLableL,
             "sketchR": self.sketchR,
+            "sketch_source": self.sketch_source,
+            "sketchR_source": self.sketchR_source,
+            "tip_name": self.tip_name,
+            "detail_range": self.detail_range,
+            "curved": self.curved,
         }
         return state
 
@@ -295,24 +449,42 @@ class ProfileFrameObject:
         self.chamfer_sketch_cache = state["chamfer_sketch_cache"]
         self.sketchLableL = state["sketchLableL"]
         self.sketchR = state["sketchR"]
+        sketch_source = state.get("sketch_source")
+        self.sketch_source = tuple(sketch_source) if sketch_source else None
+        self.sketchR_source = state.get("sketchR_source")
+        self.tip_name = state.get("tip_name")
+        self.detail_range = tuple(state.get("detail_range", (0.0, 0.0)))
+        self.shown_detail = None
+        self.curved = state.get("curved", False)
         self.Type = "ProfileFrameObject"
 
-    def clean_chamfer(self, body: Body, name, right=False):
-        pocket_obj = body.getObject(f"Chamfer_{name}")
-        if pocket_obj is not None:
-            App.ActiveDocument.removeObject(pocket_obj.Name)
+    def park_chamfer(self, body: Body, name, right=False):
+        """
+        Detach the chamfer features instead of deleting them, so switching the joint mode back
+        only has to re-link them.
+        """
+        extended_obj = body.getObject(f"frame_Chamfer_extend_{name}")
+        if extended_obj is None or extended_obj.BaseFeature is None:
+            return  # Not created or already parked
+        # Cut the dependency on the base pad, so parked features are not recomputed with the member.
+        extended_obj.BaseFeature = None
         chamfer_sketch = body.getObject(f"chamferCuttingSketch_{name}")
         if chamfer_sketch is not None:
-            App.ActiveDocument.removeObject(chamfer_sketch.Name)
-        extended_obj = body.getObject(f"frame_Chamfer_extend_{name}")
-        if extended_obj is not None:
-            App.ActiveDocument.removeObject(extended_obj.Name)
-            if right:
-                body.ExtendedLengthR = FCUnits.Quantity(0)
-                body.setEditorMode("ExtendedLengthR", 0)
-            else:
-                body.ExtendedLengthL = FCUnits.Quantity(0)
-                body.setEditorMode("ExtendedLengthL", 0)
+            chamfer_sketch.MapMode = "Deactivated"
+            chamfer_sketch.AttachmentSupport = None
+        for feature in (
+            extended_obj,
+            chamfer_sketch,
+            body.getObject(f"Chamfer_{name}"),
+        ):
+            if feature is not None:
+                feature.purgeTouched()
+        if right:
+            body.ExtendedLengthR = FCUnits.Quantity(0)
+            body.setEditorMode("ExtendedLengthR", 0)
+        else:
+            body.ExtendedLengthL = FCUnits.Quantity(0)
+            body.setEditorMode("ExtendedLengthL", 0)
 
     def create_chamfer(
         self,
@@ -353,16 +525,9 @@ class ProfileFrameObject:
         chamfer_sketch: SketchObject = GetExistent(
             f"chamferCuttingSketch_{name}", "Sketcher::SketchObject", body
         )
-        if self.chamfer_sketch_cache[right] != (
-            extended_length,
-            width,
-            baseFeature.Name,
-            direction,
-        ):
-            print(
-                f"{self.chamfer_sketch_cache[right]} != {(extended_length, width, baseFeature.Name, direction)}, redrawing"
-            )
-            if self.chamfer_sketch_cache[right] is not None:
+        cache_key = (extended_length, width, baseFeature.Name, direction, offset)
+        if self.chamfer_sketch_cache[right] != cache_key:
+            if chamfer_sketch.Geometry:
                 chamfer_sketch.Geometry = []
                 chamfer_sketch.Constraints = []
             self.draw_chamfer_sketch(
@@ -374,12 +539,17 @@ class ProfileFrameObject:
                 offset,
                 right=right,
             )
-            self.chamfer_sketch_cache[right] = (
-                extended_length,
-                width,
-                baseFeature.Name,
-                direction,
+            self.chamfer_sketch_cache[right] = cache_key
+            # Redraw if the cutting sketch is edited or deleted
+            invalidation.depend(
+                chamfer_sketch,
+                "chamfer_sketch",
+                (body.Document.Name, body.Name, right),
+                {"Geometry"},
             )
+        elif chamfer_sketch.MapMode == "Deactivated":
+            # Parked by park_chamfer, the geometry is still valid.
+            self.attach_chamfer_sketch(chamfer_sketch, baseFeature, direction, offset)
 
         # Create Pocket
         pocket_obj = GetExistent(f"Chamfer_{name}", "PartDesign::Pocket", body)
@@ -399,6 +569,17 @@ class ProfileFrameObject:
         extended_obj.purgeTouched()
         return pocket_obj, extended_length
 
+    def attach_chamfer_sketch(
+        self, chamfer_sketch: SketchObject, baseFeature, direction, offset
+    ):
+        chamfer_sketch.AttachmentSupport = [(baseFeature, "")]
+        chamfer_sketch.MapMode = "ObjectXY"
+        chamfer_sketch.AttachmentOffset = App.Placement(
+            App.Vector(0, 0, offset), App.Rotation(0, 90, direction * 90)
+        )
+        chamfer_sketch.Visibility = False
+        chamfer_sketch.recompute()
+
     def draw_chamfer_sketch(
         self,
         chamfer_sketch: SketchObject,
@@ -409,13 +590,7 @@ class ProfileFrameObject:
         offset,
         right,
     ):
-        chamfer_sketch.AttachmentSupport = [(baseFeature, "")]
-        chamfer_sketch.MapMode = "ObjectXY"
-        chamfer_sketch.AttachmentOffset = App.Placement(
-            App.Vector(0, 0, offset), App.Rotation(0, 90, direction * 90)
-        )
-        chamfer_sketch.Visibility = False
-        chamfer_sketch.recompute()
+        self.attach_chamfer_sketch(chamfer_sketch, baseFeature, direction, offset)
 
         tx = length
         ty = width / 2
@@ -448,42 +623,106 @@ class ProfileFrameObject:
         chamfer_sketch.recompute()
 
     def getSketchR(self, obj, pad_length):
+        offset = App.Placement(App.Vector(0, 0, -pad_length), App.Rotation())
+        sketchL = obj.getObject(obj.Sketch)
         if self.sketchR is not None:
-            if self.sketchR[0].startswith(f"{self.sketchLableL}_R"):
-                return obj.getObject(self.sketchR[1])
-            App.ActiveDocument.removeObject(self.sketchR[1])
-
-        sketchR: SketchObject = CopyObj(obj.getObject(obj.Sketch), obj)
-        sketchR.AttachmentSupport = obj.getObject(obj.Sketch)
+            sketchR = obj.getObject(self.sketchR[1])
+            if sketchR is not None and self.sketchR_source == obj.Sketch:
+                if sketchR.AttachmentOffset != offset:
+                    sketchR.AttachmentOffset = offset
+                    sketchR.recompute()
+                return sketchR
+            if sketchR is not None and sketchR.AttachmentSupport[0][0] == sketchL:
+                # The profile changed: update the copy, it stays attached to the left sketch
+                CopyGeometry(sketchL, sketchR)
+                sketchR.AttachmentOffset = offset
+                self.sketchR_source = sketchL.Name
+                # The previous entry was consumed by the change that brought us here
+                invalidation.depend(
+                    sketchL, "sketchR", (obj.Document.Name, obj.Name), {"Geometry"}
+                )
+                sketchR.recompute()
+                return sketchR
+            if sketchR is not None:
+                obj.Document.removeObject(self.sketchR[1])
+
+        sketchR: SketchObject = CopyObj(sketchL, obj)
+        sketchR.AttachmentSupport = sketchL
         sketchR.MapMode = "ObjectXY"
-        sketchR.AttachmentOffset.Base = App.Vector(0, 0, -pad_length)
+        sketchR.AttachmentOffset = offset
         sketchR.Label = f"{sketchR.Label}_R"
         self.sketchR = (sketchR.Label, sketchR.Name)
+        self.sketchR_source = sketchL.Name
+        # The copy has to be made again when the left sketch is edited
+        invalidation.depend(
+            sketchL, "sketchR", (obj.Document.Name, obj.Name), {"Geometry"}
+        )
         sketchR.recompute()
         return sketchR
 
     def setSketch(self, obj, sketch: SketchObject):
-        if sketch.Label == self.sketchLableL:
+        source = (sketch.Document.Name, sketch.Name)
+        if source == self.sketch_source and obj.getObject(obj.Sketch) is not None:
             return
-        if self.sketchLableL is not None:
-            App.ActiveDocument.removeObject(obj.Sketch)
-            self.sketchLableL = None  # Unnecessary
-        obj.Sketch = CopyObj(sketch, obj).Name
+        copy = obj.getObject(obj.Sketch) if obj.Sketch else None
+        if copy is not None:
+            # Swap the profile in place, the pads and the right sketch keep their links.
+            CopyGeometry(sketch, copy)
+            copy.Label = sketch.Label
+            # Same name, but the profile changed for whoever watches the property
+            obj.Sketch = copy.Name
+        else:
+            obj.Sketch = CopyObj(sketch, obj).Name
         self.sketchLableL = sketch.Label
+        self.sketch_source = source
+        invalidation.depend(
+            sketch, "profile_copy", (obj.Document.Name, obj.Name), {"Geometry"}
+        )
+
+
+def _member_proxy(key) -> "ProfileFrameObject | None":
+    doc = App.listDocuments().get(key[0])
+    obj = doc.getObject(key[1]) if doc is not None else None
+    if obj is None or not isinstance(getattr(obj, "Proxy", None), ProfileFrameObject):
+        return None
+    return obj.Proxy
+
+
+def _evict_member_state(attribute: str, value=None):
+    def evict(key):
+        proxy = _member_proxy(key[:2])
+        if proxy is None:
+            return
+        if attribute == "chamfer_sketch_cache":
+            proxy.chamfer_sketch_cache[key[2]] = None
+        else:
+            setattr(proxy, attribute, value)
+
+    return evict
+
 
+invalidation.register_cache("profile_copy", _evict_member_state("sketch_source"))
+invalidation.register_cache("sketchR", _evict_member_state("sketchR_source"))
+invalidation.register_cache(
+    "chamfer_sketch", _evict_member_state("chamfer_sketch_cache")
+)
 
 def CreateProfileFrameBody(
     Sketch: SketchObject,
     EdgeName: str,
     doc: App.Document | AppPart = None,
     name="ProfileFrameBody",
+    reuse=True,
 ):
-    """Note: The sketch and edge must be in the current document."""
+    """
+    Note: The edge must be in the same document as `doc`, the active one by default.
+    The member named `name` is reused if any, unless `reuse` is False.
+    """
     if doc is None:
         doc = App.activeDocument()
 
     name = name.replace(":", "_")
-    obj = doc.getObject(name)
+    obj = doc.getObject(name) if reuse else None
     if obj is None:
         if isinstance(doc, App.Document):
             obj = doc.addObject("PartDesign::FeatureAdditivePython", name)
@@ -0,0 +1,172 @@
+"""
+BOM computation. Section properties are taken from the profile cache once per profile,
+then per-member and total values are computed from member lengths with NumPy.
+"""
+
+import FreeCAD as App
+import numpy as np
+from .profile_cache import get_section
+from .utils import GetParams
+
+MEMBER_HEADER = (
+    "Profile Label",
+    "Profile model",
+    "Profile length",
+    "Left chamfer angle",
+    "Right chamfer angle",
+    "Weight (kg)",
+    "Surface area (m²)",
+    "Cost",
+    "Quantity",
+)
+TOTAL_HEADER = ("Count", "Total length (mm)", "Weight (kg)", "Surface area (m²)", "Cost")
+
+
+class ProfileProperties:
+    __slots__ = ("area", "perimeter", "mass_per_m", "price_per_m")
+
+    def __init__(self, area, perimeter, mass_per_m, price_per_m):
+        self.area = area  # mm²
+        self.perimeter = perimeter  # mm
+        self.mass_per_m = mass_per_m  # kg/m
+        self.price_per_m = price_per_m
+
+
+def GetProfileProperties(obj: App.DocumentObject) -> ProfileProperties:
+    """
+    Density (kg/m³) is the "Density" parameter, prices per metre are in the
+    "ProfilePrices" parameter group, by profile model.
+    """
+    params = GetParams()
+    section = get_section(obj.getObject(obj.Sketch))
+    return ProfileProperties(
+        section.area,
+        section.perimeter,
+        section.area * 1e-6 * params.GetFloat("Density", 2700.0),
+        params.GetGroup("ProfilePrices").GetFloat(obj.Proxy.sketchLableL or "", 0.0),
+    )
+
+
+def assembly_of(obj: App.DocumentObject) -> str:
+    parent = obj.getParentGeoFeatureGroup()
+    return parent.Label if parent is not None else "-"
+
+
+class Bom:
+    """Values of a list of members, and totals by profile and by assembly."""
+
+    def __init__(self, objs: list[App.DocumentObject], counts: list[int] | None = None):
+        """counts: how many times each member is used, 1 by default."""
+        self.objs = objs
+        self.profiles: list[str] = []
+        self.assemblies: list[str] = []
+        profile_index: dict[str, int] = {}
+        assembly_index: dict[str, int] = {}
+        properties: list[ProfileProperties] = []
+        profile_ids = []
+        assembly_ids = []
+        for obj in objs:
+            model = obj.Proxy.sketchLableL or ""
+            if model not in profile_index:
+                profile_index[model] = len(self.profiles)
+                self.profiles.append(model)
+                properties.append(GetProfileProperties(obj))
+            profile_ids.append(profile_index[model])
+            assembly = assembly_of(obj)
+            if assembly not in assembly_index:
+                assembly_index[assembly] = len(self.assemblies)
+                self.assemblies.append(assembly)
+            assembly_ids.append(assembly_index[assembly])
+
+        self.profile_ids = np.array(profile_ids, dtype=int)
+        self.assembly_ids = np.array(assembly_ids, dtype=int)
+        self.counts = np.array(counts if counts is not None else [1] * len(objs), dtype=float)
+        self.lengths = np.array([obj.Length.Value for obj in objs], dtype=float)
+        area = np.array([p.area for p in properties], dtype=float)
+        perimeter = np.array([p.perimeter for p in properties], dtype=float)
+        mass = np.array([p.mass_per_m for p in properties], dtype=float)
+        price = np.array([p.price_per_m for p in properties], dtype=float)
+
+        # Per member (one piece)
+        ids = self.profile_ids
+        self.weights = self.lengths / 1000 * mass[ids]
+        # Sides plus both ends, chamfers are ignored
+        self.surfaces = (self.lengths * perimeter[ids] + 2 * area[ids]) / 1e6
+        self.costs = self.lengths / 1000 * price[ids]
+
+    def _totals(self, ids: np.ndarray, size: int) -> np.ndarray:
+        """Rows of TOTAL_HEADER values, one per group."""
+        c = self.counts
+        return np.column_stack(
+            [
+                np.bincount(ids, weights=c, minlength=size),
+                np.bincount(ids, weights=self.lengths * c, minlength=size),
+                np.bincount(ids, weights=self.weights * c, minlength=size),
+                np.bincount(ids, weights=self.surfaces * c, minlength=size),
+                np.bincount(ids, weights=self.costs * c, minlength=size),
+            ]
+        )
+
+    def profile_totals(self) -> np.ndarray:
+        return self._totals(self.profile_ids, len(self.profiles))
+
+    def assembly_totals(self) -> np.ndarray:
+        return self._totals(self.assembly_ids, len(self.assemblies))
+
+    def member_row(self, i: int) -> tuple:
+        """Values of one piece, with the number of pieces."""
+        obj = self.objs[i]
+        return (
+            obj.Label,
+            obj.Proxy.sketchLableL,
+            obj.Length.toStr(),
+            obj.ChamferAngleR.toStr(),
+            obj.ChamferAngleL.toStr(),
+            f"{self.weights[i]:.3f}",
+            f"{self.surfaces[i]:.4f}",
+            f"{self.costs[i]:.2f}",
+            f"{self.counts[i]:g}",
+        )
+
+
+def _column(i: int) -> str:
+    return chr(ord("A") + i)
+
+
+def _write_row(sheet, row: int, values):
+    for i, value in enumerate(values):
+        sheet.set(f"{_column(i)}{row}", str(value) if value is not None else "")
+
+
+def _format_totals(totals: np.ndarray) -> list[tuple]:
+    return [
+        (f"{t[0]:g}", f"{t[1]:.1f}", f"{t[2]:.3f}", f"{t[3]:.4f}", f"{t[4]:.2f}")
+        for t in totals
+    ]
+
+
+def WriteBom(sheet, bom: Bom, rows: list[int] | None = None):
+    """
+    Write the BOM to a spreadsheet.
+    If `rows` is given, only these member rows are written again (with the totals), the sheet
+    must already hold a BOM with the same members, profiles and assemblies.
+    Return the first row after the BOM.
+    """
+    if rows is None:
+        _write_row(sheet, 1, MEMBER_HEADER)
+        rows = range(len(bom.objs))
+    for i in rows:
+        _write_row(sheet, i + 2, bom.member_row(i))
+
+    row = len(bom.objs) + 3
+    _write_row(sheet, row, ("Totals by profile",) + TOTAL_HEADER)
+    for name, values in zip(bom.profiles, _format_totals(bom.profile_totals())):
+        row += 1
+        _write_row(sheet, row, (name,) + values)
+
+    row += 2
+    _write_row(sheet, row, ("Totals by assembly",) + TOTAL_HEADER)
+    for name, values in zip(bom.assemblies, _format_totals(bom.assembly_totals())):
+        row += 1
+        _write_row(sheet, row, (name,) + values)
+    return row + 1
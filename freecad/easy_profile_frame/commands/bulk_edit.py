@@ -0,0 +1,275 @@
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+from freecad.easy_profile_frame import ICONPATH
+from freecad.easy_profile_frame.typing import SelectionObject, SketchObject
+from PySide.QtWidgets import (
+    QDialog,
+    QFormLayout,
+    QComboBox,
+    QCheckBox,
+    QDialogButtonBox,
+)
+from FreeCAD import Units as FCUnits
+from .frame_model import rescale_extension, rescale_hole, rotate_chamfer_direction
+from .member_joints import ResolveJoints
+from .profile_cache import get_section
+from .utils import GetProfileFrames, IsProfileFrame, Transaction
+
+translate = App.Qt.translate
+QT_TRANSLATE_NOOP = App.Qt.QT_TRANSLATE_NOOP
+
+# Property name: unit
+BULK_PROPERTIES = {
+    "OffsetX": "mm",
+    "OffsetY": "mm",
+    "Angle": "deg",
+    "ExtendedLengthL": "mm",
+    "ExtendedLengthR": "mm",
+}
+
+
+def SelectMembers(
+    doc: App.Document,
+    selection: list[SelectionObject] | None = None,
+    profile: str | None = None,
+    part: App.DocumentObject | None = None,
+) -> list[App.DocumentObject]:
+    """
+    Select members by selection, by profile (the label of the library sketch) or by Part.
+    The filters are combined, an omitted one matches everything.
+    """
+    if selection is not None:
+        members = GetProfileFrames(selection, doc)
+    elif part is not None:
+        members = [obj for obj in part.Group if IsProfileFrame(obj) and obj.EdgeName]
+    else:
+        members = [obj for obj in doc.Objects if IsProfileFrame(obj) and obj.EdgeName]
+    if part is not None:
+        members = [obj for obj in members if obj.getParentGeoFeatureGroup() == part]
+    if profile is not None:
+        members = [obj for obj in members if obj.Proxy.sketchLableL == profile]
+    return members
+
+
+def BulkEdit(
+    members: list[App.DocumentObject], changes: dict, name: str = "Bulk edit"
+) -> list[App.DocumentObject]:
+    """
+    Apply the same property changes to all members, then recompute them once.
+    changes: {property name: value}, see BULK_PROPERTIES. Plain numbers are in the unit of
+    BULK_PROPERTIES. The joints of rotated members are solved again with their neighbours,
+    extensions given in changes are kept over the solved ones.
+    Return the recomputed members.
+    """
+    for prop in changes:
+        if prop not in BULK_PROPERTIES:
+            raise ValueError(f"{prop} can't be bulk edited")
+    if not members:
+        return []
+    doc = members[0].Document
+    quantities = {
+        prop: FCUnits.Quantity(
+            f"{value} {BULK_PROPERTIES[prop]}" if isinstance(value, (int, float)) else value
+        )
+        for prop, value in changes.items()
+    }
+    extensions = {p: q for p, q in quantities.items() if p.startswith("ExtendedLength")}
+
+    with Transaction(doc, name):
+        for obj in members:
+            for prop, value in quantities.items():
+                if prop in extensions:
+                    continue
+                if prop == "Angle":
+                    delta = (value - obj.Angle).getValueAs("deg").Value
+                    steps = delta / 90
+                    if abs(steps - round(steps)) <= 1e-6:
+                        for side in ("L", "R"):
+                            if getattr(obj, f"ChamferAngle{side}") > 0:
+                                setattr(
+                                    obj,
+                                    f"ChamferDirection{side}",
+                                    rotate_chamfer_direction(
+                                        getattr(obj, f"ChamferDirection{side}"), delta
+                                    ),
+                                )
+                setattr(obj, prop, value)
+        # Offsets are not part of the joints, the angle decides the directions of the profile.
+        changed = ResolveJoints(members, doc) if "Angle" in quantities else []
+        for obj in members:
+            for prop, value in extensions.items():
+                # Auto-alignment binds extensions with expressions
+                obj.setExpression(prop, None)
+                setattr(obj, prop, value)
+        # Joints are stored per member, the members around the edited ones may need a recompute.
+        names = {obj.Name for obj in members}
+        members = members + [obj for obj in changed if obj.Name not in names]
+        doc.recompute(members)
+    return members
+
+
+def SwapProfile(
+    members: list[App.DocumentObject],
+    sketch: SketchObject,
+    name: str = "Swap profile",
+) -> list[App.DocumentObject]:
+    """
+    Replace the profile of the members by sketch, keeping their features, then recompute them once.
+    Auto alignment extensions and access holes are rescaled from the dimensions of the profiles,
+    miter extensions are computed again from the new profile by the members themselves.
+    """
+    source = (sketch.Document.Name, sketch.Name)
+    members = [obj for obj in members if obj.Proxy.sketch_source != source]
+    if not members:
+        return []
+    doc = members[0].Document
+    bound_box = get_section(sketch).bound_box
+    new = (bound_box.XLength, bound_box.YLength)
+
+    with Transaction(doc, name):
+        for obj in members:
+            bound_box = get_section(obj.getObject(obj.Sketch)).bound_box
+            old = (bound_box.XLength, bound_box.YLength)
+            obj.Proxy.setSketch(obj, sketch)
+            for side in ("L", "R"):
+                prop = f"ExtendedLength{side}"
+                if getattr(obj, f"ChamferAngle{side}") > 0:
+                    continue
+                if prop not in dict(obj.ExpressionEngine):
+                    continue
+                value = rescale_extension(getattr(obj, prop).Value, old, new)
+                if value is not None:
+                    obj.setExpression(prop, str(value))
+            # Access holes are drilled half the width of the member from the end
+            holes = [rescale_hole(hole, old, new) for hole in obj.Holes]
+            if holes != obj.Holes:
+                obj.Holes = holes
+        # The joints don't change, members that were not swapped don't need a recompute.
+        doc.recompute(members)
+    return members
+
+
+class BulkEditDialog(QDialog):
+    SCOPES = (
+        QT_TRANSLATE_NOOP("BulkEdit", "Selected members"),
+        QT_TRANSLATE_NOOP("BulkEdit", "Members with the same profile"),
+        QT_TRANSLATE_NOOP("BulkEdit", "Members in the same Part"),
+        QT_TRANSLATE_NOOP("BulkEdit", "All members"),
+    )
+
+    def __init__(self, parent=None, has_selection: bool = True):
+        super().__init__(parent)
+        self.setWindowTitle(translate("BulkEdit", "Bulk edit members"))
+        layout = QFormLayout(self)
+
+        self.scope = QComboBox(self)
+        self.scope.addItems([translate("BulkEdit", s) for s in self.SCOPES])
+        if not has_selection:
+            # The other scopes are relative to the selected members
+            for i in range(len(self.SCOPES) - 1):
+                self.scope.model().item(i).setEnabled(False)
+            self.scope.setCurrentIndex(len(self.SCOPES) - 1)
+        layout.addRow(translate("BulkEdit", "Apply to:"), self.scope)
+
+        self.fields = {}
+        for prop, unit in BULK_PROPERTIES.items():
+            check = QCheckBox(prop, self)
+            box = Gui.UiLoader().createWidget("Gui::QuantitySpinBox")
+            box.setProperty("unit", unit)
+            box.setEnabled(False)
+            check.toggled.connect(box.setEnabled)
+            layout.addRow(check, box)
+            self.fields[prop] = (check, box)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, parent=self
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def changes(self) -> dict:
+        return {
+            prop: box.property("value")
+            for prop, (check, box) in self.fields.items()
+            if check.isChecked()
+        }
+
+
+class BulkEditCommand:
+    """Edit offsets, angle and extensions of many members at once"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Bulk edit",
+            "ToolTip": "Edit offsets, angle and extensions of the selected members at once",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        doc = App.ActiveDocument
+        selected = GetProfileFrames(Gui.Selection.getSelectionEx(), doc, fallback=False)
+        dialog = BulkEditDialog(Gui.getMainWindow(), bool(selected))
+        if not dialog.exec_():
+            return
+        changes = dialog.changes()
+        if not changes:
+            return
+
+        scope = dialog.scope.currentIndex()
+        if scope == 0:
+            members = selected
+        elif scope == 1:
+            profiles = {obj.Proxy.sketchLableL for obj in selected}
+            members = [
+                obj for p in profiles for obj in SelectMembers(doc, profile=p)
+            ]
+        elif scope == 2:
+            parts = {obj.getParentGeoFeatureGroup() for obj in selected} - {None}
+            members = [obj for p in parts for obj in SelectMembers(doc, part=p)]
+        else:
+            members = SelectMembers(doc)
+        BulkEdit(members, changes, translate("Command", "Bulk edit"))
+
+
+Gui.addCommand("EPF_BulkEdit", BulkEditCommand())
+
+
+class SwapProfileCommand:
+    """Replace the profile of the selected members (or the whole frame) by the selected sketch"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Swap profile",
+            "ToolTip": "Replace the profile of the selected members by the selected profile sketch",
+        }
+
+    def IsActive(self):
+        return self.profile_sketch() is not None
+
+    @staticmethod
+    def profile_sketch() -> SketchObject | None:
+        for sel in Gui.Selection.getSelectionEx():
+            obj = sel.Object
+            parent = obj.getParentGeoFeatureGroup()
+            # Sketches inside a member are its own copies
+            if obj.TypeId == "Sketcher::SketchObject" and not (
+                parent is not None and IsProfileFrame(parent)
+            ):
+                return obj
+        return None
+
+    def Activated(self):
+        doc = App.ActiveDocument
+        sketch = self.profile_sketch()
+        members = GetProfileFrames(Gui.Selection.getSelectionEx(), doc)
+        swapped = SwapProfile(members, sketch, translate("Command", "Swap profile"))
+        App.Console.PrintMessage(f"{len(swapped)} members use {sketch.Label} \n")
+
+
+Gui.addCommand("EPF_SwapProfile", SwapProfileCommand())
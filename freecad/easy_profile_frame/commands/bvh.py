@@ -0,0 +1,108 @@
+"""
+Bounding volume hierarchy over axis aligned boxes, to find the pairs of boxes that overlap
+without testing every pair.
+
+This module doesn't depend on FreeCAD.
+"""
+
+import numpy as np
+
+
+class AabbTree:
+    """
+    Static AABB tree built by median splits along the longest axis. Nodes are stored as
+    arrays, leaves hold up to `leaf_size` boxes: index[start:start + count].
+    """
+
+    __slots__ = ("lower", "upper", "left", "right", "start", "count", "index", "boxes")
+
+    def __init__(self, lower, upper, leaf_size: int = 4):
+        """lower, upper: (n, 3) corners of the boxes."""
+        boxes_lower = np.asarray(lower, dtype=float).reshape(-1, 3)
+        boxes_upper = np.asarray(upper, dtype=float).reshape(-1, 3)
+        self.boxes = (boxes_lower, boxes_upper)
+        n = len(boxes_lower)
+        centers = (boxes_lower + boxes_upper) / 2
+        self.index = np.arange(n)
+        node_lower, node_upper, left, right, start, count = [], [], [], [], [], []
+
+        def add_node(s, e):
+            items = self.index[s:e]
+            node_lower.append(boxes_lower[items].min(0))
+            node_upper.append(boxes_upper[items].max(0))
+            left.append(-1)
+            right.append(-1)
+            start.append(s)
+            count.append(e - s)
+            return len(start) - 1
+
+        stack = [add_node(0, n)] if n else []
+        while stack:
+            node = stack.pop()
+            s, c = start[node], count[node]
+            if c <= leaf_size:
+                continue
+            items = self.index[s : s + c]
+            item_centers = centers[items]
+            axis = int(np.argmax(item_centers.max(0) - item_centers.min(0)))
+            half = c // 2
+            order = np.argpartition(item_centers[:, axis], half)
+            self.index[s : s + c] = items[order]
+            left[node] = add_node(s, s + half)
+            right[node] = add_node(s + half, s + c)
+            stack += [left[node], right[node]]
+
+        self.lower = np.array(node_lower).reshape(-1, 3)
+        self.upper = np.array(node_upper).reshape(-1, 3)
+        self.left = np.array(left, dtype=np.intp)
+        self.right = np.array(right, dtype=np.intp)
+        self.start = np.array(start, dtype=np.intp)
+        self.count = np.array(count, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.index)
+
+    def _overlap(self, a: int, b: int) -> bool:
+        return bool(
+            np.all(self.lower[a] <= self.upper[b]) and np.all(self.lower[b] <= self.upper[a])
+        )
+
+    def _leaf_pairs(self, a: int, b: int) -> np.ndarray:
+        lower, upper = self.boxes
+        items_a = self.index[self.start[a] : self.start[a] + self.count[a]]
+        items_b = self.index[self.start[b] : self.start[b] + self.count[b]]
+        hit = np.all(
+            (lower[items_a, None] <= upper[None, items_b])
+            & (lower[None, items_b] <= upper[items_a, None]),
+            axis=2,
+        )
+        i, j = np.nonzero(hit)
+        pairs = np.stack([items_a[i], items_b[j]], 1)
+        if a == b:
+            pairs = pairs[pairs[:, 0] < pairs[:, 1]]
+        return pairs
+
+    def self_pairs(self) -> np.ndarray:
+        """(k, 2) indices i < j of the overlapping boxes, touching boxes included."""
+        found = [np.empty((0, 2), dtype=np.intp)]
+        stack = [(0, 0)] if len(self) else []
+        while stack:
+            a, b = stack.pop()
+            leaf_a, leaf_b = self.left[a] < 0, self.left[b] < 0
+            if a == b:
+                if leaf_a:
+                    found.append(self._leaf_pairs(a, a))
+                else:
+                    l, r = self.left[a], self.right[a]
+                    stack += [(l, l), (r, r), (l, r)]
+                continue
+            if not self._overlap(a, b):
+                continue
+            if leaf_a and leaf_b:
+                found.append(self._leaf_pairs(a, b))
+            elif leaf_a or (not leaf_b and self.count[b] > self.count[a]):
+                stack += [(a, self.left[b]), (a, self.right[b])]
+            else:
+                stack += [(self.left[a], b), (self.right[a], b)]
+        pairs = np.concatenate(found)
+        return np.sort(pairs, axis=1)
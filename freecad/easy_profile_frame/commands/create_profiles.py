@@ -1,7 +1,8 @@
 import FreeCADGui as Gui
 import FreeCAD as App
 import os
-from freecad.easy_profile_frame import ICONPATH, RESSOURCESPATH
+import re
+from freecad.easy_profile_frame import ICONPATH
 from freecad.easy_profile_frame.resources.ui import (
     CreateProfilesBySketchPanel as CreateProfilesBySketchPanelUI,
 )
@@ -10,22 +11,44 @@ from freecad.easy_profile_frame.typing import (
     SketchObject,
     Body,
     AppPart,
-    Edge,
 )
 from PySide.QtWidgets import QWidget, QButtonGroup
-from PySide.QtCore import Signal
+from PySide.QtCore import Signal, Qt
+from PySide.QtGui import QIcon
 from FreeCAD import Units as FCUnits
 from .ProfileFrameObject import CreateProfileFrameBody
-from .utils import GetAllWireNames, GetSubEdges, IsAllWires, calculate_edges_angle
+from .frame_model import (
+    FrameModel,
+    NO_PROCESSING,
+    MITER_CUT,
+    AUTO_ALIGN_A,
+    AUTO_ALIGN_B,
+)
+from .profile_cache import get_section
+from .wire_model import WireListModel
+from .gui_utils import AddSelections
+from .library import LibraryIndex, LibraryPaths, LibraryScanner
+from .lint import LintMembers, PrintLintReport
+from .member_joints import ApplyFrameModel, JointModel
+from .memory_profile import MemoryStage
+from .utils import (
+    GetAllWireNames,
+    GetSubEdges,
+    IsWireElement,
+    GetObject,
+    GetParams,
+    EdgeOrigins,
+    PreprocessEdges,
+    Transaction,
+)
 
 translate = App.Qt.translate
 QT_TRANSLATE_NOOP = App.Qt.QT_TRANSLATE_NOOP
-LIB_PATH = os.path.join(RESSOURCESPATH, "PartLib")
 
 
-def getObjectFromName(name: str, doc: App.Document | Body):
+def getObjectFromName(name: str, doc: App.Document):
     obj, subname = name.split(":")
-    return doc.getObject(obj).getSubObject(subname)
+    return GetObject(doc, obj).getSubObject(subname)
 
 
 class CreateProfilesBySketchWidget(QWidget, CreateProfilesBySketchPanelUI.Ui_Form):
@@ -34,9 +57,11 @@ class CreateProfilesBySketchWidget(QWidget, CreateProfilesBySketchPanelUI.Ui_For
     def __init__(self, parent=None):
         super().__init__()
         self.setupUi(self)
+        self.wire_model = WireListModel(self)
+        self.wire_list.setModel(self.wire_model)
         self.radioBtn_custom.toggled.connect(self.on_radioBtn_custom_toggled)
         self.radioBtn_lib.toggled.connect(self.on_radioBtn_lib_toggled)
-        self.lib_files.currentTextChanged.connect(self.update_sketch_list)
+        self.lib_files.currentIndexChanged.connect(self.on_lib_file_changed)
         self.frame_wire_selector_add.clicked.connect(self.add_wires)
         self.frame_wire_selector_rm.clicked.connect(self.remove_wires)
         self.frame_wire_selector_show.clicked.connect(self.show_all_wires)
@@ -56,6 +81,7 @@ class CreateProfilesBySketchWidget(QWidget, CreateProfilesBySketchPanelUI.Ui_For
 
         self.custom_sketch: SketchObject | None = None
         self.current_lib: App.Document | None = None
+        self.current_lib_path: str | None = None
         self.setup_offsetBox()
 
         self.angle = 0
@@ -97,39 +123,96 @@ class CreateProfilesBySketchWidget(QWidget, CreateProfilesBySketchPanelUI.Ui_For
             self.custom_group.setEnabled(False)
 
     def read_lib_list(self):
-        App.Console.PrintLog(f"Reading library from { LIB_PATH } \n")
-        files = [f for f in os.listdir(LIB_PATH) if f.endswith(".FCStd")]
+        """Show the cached library at once, then scan the library directories in the background."""
+        self.library = LibraryIndex()
+        paths = LibraryPaths()
+        App.Console.PrintLog(f"Reading library from { paths } \n")
         self.lib_files.clear()
-        self.lib_files.addItems(files)
+        for path in self.library.files(paths):
+            self.add_lib_file(path, self.library.entries[path])
+
+        self.lib_scanner = LibraryScanner(paths, self.library.entries, self)
+        self.lib_scanner.fileScanned.connect(self.on_lib_file_scanned)
+        self.lib_scanner.fileRemoved.connect(self.on_lib_file_removed)
+        self.lib_scanner.scanFailed.connect(
+            lambda path, error: App.Console.PrintWarning(
+                f"Can't read library {path}: {error} \n"
+            )
+        )
+        self.lib_scanner.finished.connect(self.library.save)
+        self.lib_scanner.start()
+
+    def add_lib_file(self, path: str, entry: dict):
+        index = self.lib_files.findData(path)
+        icon = QIcon(entry["thumbnail"]) if entry["thumbnail"] else QIcon()
+        if index < 0:
+            self.lib_files.addItem(icon, os.path.basename(path), path)
+            index = self.lib_files.count() - 1
+        else:
+            self.lib_files.setItemIcon(index, icon)
+        self.lib_files.setItemData(index, path, Qt.ToolTipRole)
+
+    def on_lib_file_scanned(self, path: str, entry: dict):
+        self.library.entries[path] = entry
+        self.add_lib_file(path, entry)
+        if path == self.lib_files.currentData():
+            # Changed on disk: list its sketches again, and open it again when it is drawn
+            self.close_lib()
+            self.update_sketch_list(path)
+
+    def on_lib_file_removed(self, path: str):
+        self.library.entries.pop(path, None)
+        index = self.lib_files.findData(path)
+        if index >= 0:
+            self.lib_files.removeItem(index)
+
+    def on_lib_file_changed(self, index: int):
+        if index >= 0:
+            self.update_sketch_list(self.lib_files.itemData(index))
 
     def read_lib(self, path):
         App.Console.PrintLog(f"Reading library from { path } \n")
-        if self.current_lib is not None:
-            App.closeDocument(self.current_lib.Name)
+        self.close_lib()
         current_doc = App.ActiveDocument
         self.current_lib = App.openDocument(path, True)
+        self.current_lib_path = path
         App.setActiveDocument(current_doc.Name)
         return self.current_lib
 
-    def update_sketch_list(self, file_name):
-        file_path = os.path.join(LIB_PATH, file_name)
-
+    def close_lib(self):
+        if self.current_lib is not None:
+            App.closeDocument(self.current_lib.Name)
+        self.current_lib = None
+        self.current_lib_path = None
+
+    def update_sketch_list(self, file_path):
+        """List the sketches of a library file from the cache, the file is opened when drawing."""
+        entry = self.library.entries.get(file_path, {"profiles": []})
+        current = self.lib_sketches.currentText()
+        self.lib_sketches.clear()
+        for profile in entry["profiles"]:
+            self.lib_sketches.addItem(profile["label"], profile["name"])
+        index = self.lib_sketches.findText(current)
+        if index >= 0:
+            self.lib_sketches.setCurrentIndex(index)
+
+    def lib_sketch(self) -> SketchObject | None:
+        """The selected library sketch, its file is opened on first use."""
+        path, name = self.lib_files.currentData(), self.lib_sketches.currentData()
+        if path is None or name is None:
+            return None
         try:
-            doc = self.read_lib(file_path)
-            self.lib_sketches.clear()
-            self.lib_sketches.addItems(
-                [
-                    obj.Label
-                    for obj in doc.Objects
-                    if obj.isDerivedFrom("Sketcher::SketchObject")
-                ]
-            )
+            if self.current_lib is None or self.current_lib_path != path:
+                self.read_lib(path)
         except Exception as e:
             App.Console.PrintError(f"Error reading library: {e} \n")
+            return None
+        return self.current_lib.getObject(name)
 
     def cleanup(self):
-        if self.current_lib is not None:
-            App.closeDocument(self.current_lib.Name)
+        self.lib_scanner.requestInterruption()
+        self.lib_scanner.wait()
+        self.close_lib()
 
     def closeEvent(self, event):
         self.cleanup()
@@ -137,36 +220,22 @@ class CreateProfilesBySketchWidget(QWidget, CreateProfilesBySketchPanelUI.Ui_For
 
     def add_wires(self):
         selected_objects: list[SelectionObject] = Gui.Selection.getSelectionEx()
-        self.wire_list.addItems(GetAllWireNames(selected_objects))
-        self.remove_repetitions()
+        self.wire_model.add_names(GetAllWireNames(selected_objects))
         if self.realtime_update.isChecked():
             self.redraw.emit()
 
     def remove_wires(self):
-        for item in self.wire_list.selectedItems():
-            self.wire_list.takeItem(self.wire_list.row(item))
+        rows = [index.row() for index in self.wire_list.selectionModel().selectedRows()]
+        self.wire_model.remove_rows(rows)
         if self.realtime_update.isChecked():
             self.redraw.emit()
 
     def show_all_wires(self):
-        AllItems: list[str] = [
-            self.wire_list.item(i).text() for i in range(self.wire_list.count())
-        ]
-        for obj in AllItems:
-            Gui.Selection.addSelection(App.ActiveDocument.Name, *obj.split(":"))
+        AddSelections(App.ActiveDocument, self.wire_model.names())
 
-    def remove_repetitions(self):
-        AllItems: list[str] = [
-            self.wire_list.item(i).text() for i in range(self.wire_list.count())
-        ]
-        AllItems = list(set(AllItems))
-        AllItems = [
-            obj
-            for obj in AllItems
-            if (":" not in obj) or (obj.split(":")[0] not in AllItems)
-        ]
-        self.wire_list.clear()
-        self.wire_list.addItems(AllItems)
+    def selected_wires(self) -> list[str]:
+        names = self.wire_model.names()
+        return [names[index.row()] for index in self.wire_list.selectionModel().selectedRows()]
 
     def select_sketch(self):
         selected_object: SketchObject = Gui.Selection.getSelection()[0]
@@ -195,44 +264,140 @@ class CreateProfilesBySketchPanel:
     def __init__(self):
         self.form = CreateProfilesBySketchWidget()
         self.form.add_wires()
+        # Members by origin of their edge, see PreprocessEdges
         self.drew: dict[str, Body] = {}
+        # Members that are no longer listed, waiting to be rebound to new edges.
+        self.pool: list[Body] = []
 
         # self.body:Body = App.ActiveDocument.addObject('PartDesign::Body', 'Body')
         self.part: AppPart = App.ActiveDocument.addObject("App::Part", "Part")
 
         self._draw()
         self.form.redraw.connect(self._draw)
+        self.form.wire_list.selectionModel().selectionChanged.connect(
+            self.highlight_members
+        )
 
     def cleanup(self):
+        self.flush_pool()
         self.form.close()
 
+    def accept(self):
+        self.cleanup()
+        Gui.Control.closeDialog()
+        return True
+
+    def reject(self):
+        self.cleanup()
+        Gui.Control.closeDialog()
+        return True
+
+    def highlight_members(self, *_):
+        """Select the members (with their joint features) generated from the picked wires."""
+        picked = set(self.form.selected_wires())
+        if not picked:
+            return
+        members = [
+            obj.Name
+            for origin, obj in self.drew.items()
+            if any(
+                name in picked or name.partition(":")[0] in picked
+                for name in EdgeOrigins(origin)
+            )
+        ]
+        AddSelections(self.part.Document, members, clear=True)
+
+    def get_member(self, sketch: SketchObject, origin: str, name: str) -> Body:
+        """
+        Return the member of the edge `name` coming from `origin`, rebinding a pooled one before
+        creating a new one.
+        """
+        obj = self.drew.get(origin)
+        own_name = re.sub(r"\W", "_", f"Frame_{origin}")
+        if obj is None and self.pool:
+            # Prefer the member that was created for this edge, so it can't be created twice.
+            index = next(
+                (i for i, o in enumerate(self.pool) if o.Name == own_name), -1
+            )
+            obj = self.pool.pop(index)
+            obj.Label = f"Frame_{origin}"
+            obj.Visibility = True
+        if obj is None:
+            # A member keeps the name of its first edge when rebound, don't take it back from
+            # the edge it is drawn on now.
+            taken = any(o.Name == own_name for o in self.drew.values())
+            obj = CreateProfileFrameBody(sketch, name, self.part, own_name, reuse=not taken)
+            obj.Label = f"Frame_{origin}"
+        else:
+            obj.Proxy.setSketch(obj, sketch)
+            if obj.EdgeName != name:
+                obj.EdgeName = name
+        self.drew[origin] = obj
+        return obj
+
+    def park_member(self, obj: Body):
+        """Keep an unused member (and its chamfer features) for later reuse instead of deleting it."""
+        obj.EdgeName = ""  # execute() does nothing without an edge
+        obj.ChamferAngleL = 0
+        obj.ChamferAngleR = 0
+        obj.Holes = []
+        for prop in ("ExtendedLengthL", "ExtendedLengthR"):
+            obj.setExpression(prop, None)
+            setattr(obj, prop, 0)
+        obj.MapMode = "Deactivated"
+        obj.AttachmentSupport = None
+        obj.Visibility = False
+        obj.purgeTouched()
+        self.pool.append(obj)
+
+    def flush_pool(self):
+        for obj in self.pool:
+            obj.removeObjectsFromDocument()
+            obj.Document.removeObject(obj.Name)
+        self.pool.clear()
+
     def _draw(self):
         # Get the sketch
         sketch: SketchObject | None = None
         if self.form.radioBtn_lib.isChecked():
-            sketch = self.form.current_lib.getObjectsByLabel(
-                self.form.lib_sketches.currentText()
-            )[0]
+            sketch = self.form.lib_sketch()
         elif self.form.radioBtn_custom.isChecked():
             sketch = self.form.custom_sketch
 
         # Get the lines
-        lineNames: list[str] = [
-            self.form.wire_list.item(i).text()
-            for i in range(self.form.wire_list.count())
-        ]
-        lines: list[str] = GetSubEdges(lineNames)
+        lineNames: list[str] = self.form.wire_model.names()
+        lines: dict[str, str] = {
+            n: n for n in GetSubEdges(lineNames, self.part.Document)
+        }
 
         if sketch is None:
             return
+        joint_type = None
         if self.form.no_processing.isChecked():
-            self.draw(sketch, lines, "NoProcessing")
+            joint_type = NO_PROCESSING
         elif self.form.miter_cut.isChecked():
-            self.draw(sketch, lines, "MiterCut")
+            joint_type = MITER_CUT
         elif self.form.auto_alignA.isChecked():
-            self.draw(sketch, lines, "AutoAlignA")
+            joint_type = AUTO_ALIGN_A
         elif self.form.auto_alignB.isChecked():
-            self.draw(sketch, lines, "AutoAlignB")
+            joint_type = AUTO_ALIGN_B
+        if joint_type is None:
+            return
+        params = GetParams()
+        # Real time preview may redraw many times, recording undo for each of them is costly.
+        with MemoryStage("Draw", self.part.Document), Transaction(
+            self.part.Document,
+            translate("Command", "Draw frame"),
+            undo=params.GetBool("RecordPreviewUndo", True),
+        ):
+            if params.GetBool("PreprocessWires", True):
+                lines = PreprocessEdges(
+                    list(lines),
+                    self.part.Document,
+                    f"{self.part.Name}_Wires",
+                    params.GetFloat("WireTolerance", 1e-6),
+                )
+            self.draw(sketch, lines, joint_type)
 
     def set_offset(self, obj):
         # Set offset and rotation
@@ -240,189 +405,119 @@ class CreateProfilesBySketchPanel:
         obj.OffsetY = self.form.offsetBoxY.property("value")
         obj.Angle = self.form.angle
 
-    def no_processing(self, sketch: SketchObject, lines: list[str]):
-        for name in lines:
-            # Create new body
-            obj = CreateProfileFrameBody(sketch, name, self.part, f"Frame_{name}")
-            obj.ChamferAngleL = 0
-            obj.ChamferAngleR = 0
-            self.drew[name] = obj
-            self.set_offset(obj)
-            obj.recompute()
-
-    def getInteract_vector(
-        self, vertex1, vertex2
-    ) -> tuple[App.Vector, int, int] | None:
-        points1 = [i.Point for i in vertex1]
-        points2 = [i.Point for i in vertex2]
-        for j, p in enumerate(points1):
-            for k, p2 in enumerate(points2):
-                if p == p2:
-                    return (p, j, k)
-
-    def getChamferDirection(
-        self, rotation: App.Rotation, edge: Edge, interact_vector: App.Vector
-    ):
-        # dire = edge.Placement.Rotation * edge.Curve.Direction
-        p = (
-            edge.Vertexes[0].Point
-            if edge.Vertexes[0].Point != interact_vector
-            else edge.Vertexes[1].Point
+    def frame_model(self, sketch: SketchObject, lines: dict[str, str]) -> FrameModel:
+        """
+        Model of the members, in the order of lines ({origin: edge name}). Their axes come from
+        the edges and the angle, the members don't need to be recomputed first.
+        """
+        doc = self.part.Document
+        edges = []
+        for name in lines.values():
+            sketch_name, sub_name = name.split(":")
+            edges.append((GetObject(doc, sketch_name), sub_name))
+        bound_box = get_section(sketch).bound_box
+        return JointModel(
+            edges,
+            [(bound_box.XLength, bound_box.YLength)] * len(edges),
+            [self.form.angle] * len(edges),
         )
-        dire = p - interact_vector
-        dire = dire.normalize()
-        dire2 = rotation.inverted() * dire
-        if dire2.x > 0 and dire2.y == 0:
-            return 1
-        elif dire2.x < 0 and dire2.y == 0:
-            return 3
-        elif dire2.y > 0 and dire2.x == 0:
-            return 4
-        elif dire2.y < 0 and dire2.x == 0:
-            return 2
-        else:
-            return None
 
-    def miter_cut(self, sketch: SketchObject, lines: list[str]):
-        for name in lines:
-            # Create new body
-            obj = CreateProfileFrameBody(sketch, name, self.part, f"Frame_{name}")
-            self.drew[name] = obj
+    def draw(
+        self,
+        sketch: SketchObject,
+        lines: dict[str, str],
+        joint_type: str,
+        remove_old: bool = True,
+    ):
+        """lines: {origin: edge name}, see PreprocessEdges."""
+        if remove_old:
+            remove_list = set(self.drew.keys()) - set(lines)
+            for origin in remove_list:
+                self.park_member(self.drew.pop(origin))
+
+        members = []
+        for origin, name in lines.items():
+            obj = self.get_member(sketch, origin, name)
+            if joint_type != MITER_CUT:
+                obj.ChamferAngleL = 0
+                obj.ChamferAngleR = 0
+            if joint_type not in (AUTO_ALIGN_A, AUTO_ALIGN_B) and obj.Holes:
+                obj.Holes = []
             self.set_offset(obj)
+            members.append(obj)
+        # The joints are solved before the members are built, each of them is recomputed once.
+        if joint_type != NO_PROCESSING and members:
+            ApplyFrameModel(self.frame_model(sketch, lines).solve(joint_type), members)
+        for obj in members:
             obj.recompute()
-        for i, line1N in enumerate(lines):
-            for line2N in lines[i + 1 :]:
-                line1_obj: Edge = getObjectFromName(line1N, App.ActiveDocument)
-                line2_obj: Edge = getObjectFromName(line2N, App.ActiveDocument)
-
-                frame_obj = self.drew[line1N]
-                frame_obj2 = self.drew[line2N]
-
-                interact_vertex = self.getInteract_vector(
-                    line1_obj.Vertexes, line2_obj.Vertexes
-                )
-                if interact_vertex is None:
-                    continue
+        if members and GetParams().GetBool("LintOnDraw", True):
+            PrintLintReport(members, LintMembers(members, joint_type))
 
-                chamfer_angle = calculate_edges_angle(line1_obj, line2_obj) / 2
-                dire1 = self.getChamferDirection(
-                    frame_obj.Placement.Rotation, line2_obj, interact_vertex[0]
-                )
-                dire2 = self.getChamferDirection(
-                    frame_obj2.Placement.Rotation, line1_obj, interact_vertex[0]
-                )
-                if dire1 is None or dire2 is None:
-                    continue
-                setattr(
-                    frame_obj,
-                    f"ChamferAngle{'R' if interact_vertex[1] else 'L'}",
-                    chamfer_angle,
-                )
-                setattr(
-                    frame_obj2,
-                    f"ChamferAngle{'R' if interact_vertex[2] else 'L'}",
-                    chamfer_angle,
-                )
 
-                setattr(
-                    frame_obj,
-                    f"ChamferDirection{'R' if interact_vertex[1] else 'L'}",
-                    dire1,
-                )
-                setattr(
-                    frame_obj2,
-                    f"ChamferDirection{'R' if interact_vertex[2] else 'L'}",
-                    dire2,
-                )
+class WireSelectionGate:
+    """
+    FreeCAD polls IsActive very often, so whether the selection only contains wires is
+    maintained from selection events instead of being computed from the selection each time.
+    """
 
-                frame_obj.recompute()
-                frame_obj2.recompute()
+    def __init__(self):
+        self.dirty = True
+        self.count = 0
+        self.invalid: set[tuple[str, str, str]] = set()  # (Document, Object, SubElement)
+
+    def refresh(self):
+        self.count = 0
+        self.invalid.clear()
+        # Unresolved, like the selection events: top level object and sub-object path
+        selected_objects: list[SelectionObject] = Gui.Selection.getSelectionEx("", 0)
+        for sel in selected_objects:
+            for sub_name in sel.SubElementNames or ("",):
+                self.add(sel.DocumentName, sel.Object, sub_name)
+        self.dirty = False
+
+    def add(self, doc_name: str, obj: App.DocumentObject, sub_name: str):
+        self.count += 1
+        if not IsWireElement(obj, sub_name):
+            self.invalid.add((doc_name, obj.Name, sub_name))
+
+    def addSelection(self, doc, obj, sub, pnt):
+        if self.dirty:
+            return
+        document = App.getDocument(doc)
+        obj = document.getObject(obj) if document is not None else None
+        if obj is None:
+            self.dirty = True
+            return
+        self.add(doc, obj, sub)
 
-    def auto_align(self, sketch: SketchObject, lines: list[str], mode: int):
-        self.no_processing(sketch, lines)
-        for i, line1N in enumerate(lines):
-            for line2N in lines[i + 1 :]:
-                line1_obj: Edge = getObjectFromName(line1N, App.ActiveDocument)
-                line2_obj: Edge = getObjectFromName(line2N, App.ActiveDocument)
-                frame_obj = self.drew[line1N]
-                frame_obj2 = self.drew[line2N]
+    def removeSelection(self, doc, obj, sub):
+        if self.dirty:
+            return
+        self.count -= 1
+        self.invalid.discard((doc, obj, sub))
 
-                interact_vertex = self.getInteract_vector(
-                    line1_obj.Vertexes, line2_obj.Vertexes
-                )
-                if interact_vertex is None:
-                    continue
-                if calculate_edges_angle(line1_obj, line2_obj) != 90:
-                    continue
-
-                boundBox = sketch.Shape.BoundBox
-                dire1 = self.getChamferDirection(
-                    frame_obj.Placement.Rotation, line2_obj, interact_vertex[0]
-                )
-                dire2 = self.getChamferDirection(
-                    frame_obj2.Placement.Rotation, line1_obj, interact_vertex[0]
-                )
+    def setSelection(self, doc):
+        self.dirty = True
 
-                extend1 = (
-                    (boundBox.XMax - boundBox.XMin)
-                    if dire1 in (1, 3)
-                    else (boundBox.YMax - boundBox.YMin)
-                )
-                extend2 = (
-                    (boundBox.XMax - boundBox.XMin)
-                    if dire2 in (1, 3)
-                    else (boundBox.YMax - boundBox.YMin)
-                )
-                extend1 = extend1 / 2
-                extend2 = extend2 / 2
-                if mode:
-                    extend2 = -extend2
-                else:
-                    extend1 = -extend1
-                print(extend1, extend2)
-                # Allow negative value
-                frame_obj.setExpression(
-                    f"ExtendedLength{'R' if interact_vertex[1] else 'L'}", str(extend1)
-                )
-                frame_obj2.setExpression(
-                    f"ExtendedLength{'R' if interact_vertex[2] else 'L'}", str(extend2)
-                )
+    def clearSelection(self, doc):
+        self.count = 0
+        self.invalid.clear()
+        self.dirty = False
 
-                frame_obj.recompute()
-                frame_obj2.recompute()
+    def is_active(self) -> bool:
+        if self.dirty:
+            self.refresh()
+        return self.count > 0 and not self.invalid
 
-    def draw(
-        self,
-        sketch: SketchObject,
-        lines: list[str],
-        joint_type: str,
-        remove_old: bool = True,
-    ):
-        if remove_old:
-            remove_list = set(self.drew.keys()) - set(lines)
-            for name in remove_list:
-                self.drew[name].removeObjectsFromDocument()
-                App.ActiveDocument.removeObject(self.drew[name].Name)
-                self.drew.pop(name)
 
-        if joint_type == "NoProcessing":
-            self.no_processing(sketch, lines)
-        elif joint_type == "MiterCut":
-            self.miter_cut(sketch, lines)
-        elif joint_type == "AutoAlignA":
-            self.auto_align(sketch, lines, 0)
-        elif joint_type == "AutoAlignB":
-            self.auto_align(sketch, lines, 1)
+wire_selection_gate = WireSelectionGate()
+Gui.Selection.addObserver(wire_selection_gate)
 
 
 class CreateProfilesCommandBase:
     def IsActive(self):
-        selected_objects: list[SelectionObject] = Gui.Selection.getSelectionEx()
         # Check if all selected objects are edges
-        if not IsAllWires(selected_objects):
-            return False
-
-        return selected_objects != []
+        return wire_selection_gate.is_active()
 
 
 class CreateProfilesBySketchCommand(CreateProfilesCommandBase):
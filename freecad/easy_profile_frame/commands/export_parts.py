@@ -0,0 +1,228 @@
+"""
+Export of the cut members for the saw and CNC: one file per distinct part, with a manifest.
+
+Members are grouped by a fingerprint (profile section, length, chamfers). BREP files are written
+directly; STEP files are converted by FreeCADCmd worker processes, in parallel.
+"""
+
+import csv
+import os
+import subprocess
+import tempfile
+import FreeCAD as App
+import FreeCADGui as Gui
+from PySide.QtWidgets import QFileDialog, QInputDialog
+from freecad.easy_profile_frame import ICONPATH
+from .modules import GetMemberCounts
+from .profile_cache import get_section
+from .utils import GetParams, MemberShape
+
+translate = App.Qt.translate
+
+MANIFEST_HEADER = (
+    "File",
+    "Quantity",
+    "Profile model",
+    "Length",
+    "Left chamfer angle",
+    "Left chamfer direction",
+    "Right chamfer angle",
+    "Right chamfer direction",
+    "Members",
+)
+
+# Run by FreeCADCmd: convert "brep step" pairs read from a list file. The list is passed by
+# the environment, FreeCADCmd would open any extra argument as a document.
+_LIST_VARIABLE = "EPF_CONVERT_LIST"
+_CONVERT_SCRIPT = f"""
+import os
+import Part
+for line in open(os.environ["{_LIST_VARIABLE}"]):
+    brep, step = line.rstrip("\\n").split("\\t")
+    shape = Part.Shape()
+    shape.read(brep)
+    shape.exportStep(step)
+"""
+
+
+def PartFingerprint(obj: App.DocumentObject) -> tuple:
+    """Members with the same fingerprint are the same physical part."""
+    section = get_section(obj.getObject(obj.Sketch))
+    angle_l = round(obj.ChamferAngleL.Value, 3)
+    angle_r = round(obj.ChamferAngleR.Value, 3)
+    bend = ()
+    if getattr(obj.Proxy, "curved", False):
+        # Curved members of the same length differ by their bend
+        bb = MemberShape(obj).BoundBox
+        bend = (round(bb.XLength, 3), round(bb.YLength, 3), round(bb.ZLength, 3))
+    return (
+        (
+            section.key,
+            round(obj.Length.Value, 3),
+            angle_l,
+            obj.ChamferDirectionL if angle_l else 0,
+            angle_r,
+            obj.ChamferDirectionR if angle_r else 0,
+        )
+        + bend
+        # Machined members are distinct parts
+        + tuple(sorted(getattr(obj, "Holes", [])))
+    )
+
+
+def GroupParts(
+    objs: list[App.DocumentObject], counts: list[int] | None = None
+) -> dict[tuple, tuple[list[App.DocumentObject], int]]:
+    """{fingerprint: (members, quantity)}"""
+    if counts is None:
+        counts = [1] * len(objs)
+    groups: dict[tuple, tuple[list, int]] = {}
+    for obj, count in zip(objs, counts):
+        fingerprint = PartFingerprint(obj)
+        members, quantity = groups.get(fingerprint, ([], 0))
+        members.append(obj)
+        groups[fingerprint] = (members, quantity + count)
+    return groups
+
+
+def _freecad_cmd() -> str | None:
+    bin_dir = os.path.join(App.getHomePath(), "bin")
+    for name in ("FreeCADCmd", "freecadcmd", "FreeCADCmd.exe"):
+        path = os.path.join(bin_dir, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _convert_parallel(pairs: list[tuple[str, str]], workers: int):
+    """Convert BREP files to STEP with worker processes, in process if FreeCADCmd is missing."""
+    freecad_cmd = _freecad_cmd()
+    if freecad_cmd is None or workers <= 1 or len(pairs) <= 1:
+        import Part
+
+        for brep, step in pairs:
+            shape = Part.Shape()
+            shape.read(brep)
+            shape.exportStep(step)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "convert.py")
+        with open(script, "w") as f:
+            f.write(_CONVERT_SCRIPT)
+        processes = []
+        errors = []
+        try:
+            for w in range(min(workers, len(pairs))):
+                chunk = pairs[w::workers]
+                list_file = os.path.join(tmp, f"list{w}.txt")
+                with open(list_file, "w") as f:
+                    f.writelines(f"{brep}\t{step}\n" for brep, step in chunk)
+                processes.append(
+                    subprocess.Popen(
+                        [freecad_cmd, script],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        env={**os.environ, _LIST_VARIABLE: list_file},
+                    )
+                )
+            for p in processes:
+                _, err = p.communicate()
+                if p.returncode != 0:
+                    errors.append(err.decode(errors="replace"))
+        finally:
+            # Don't leave workers writing to the temporary directory
+            for p in processes:
+                if p.poll() is None:
+                    p.kill()
+                    p.wait()
+        if errors:
+            raise RuntimeError(f"STEP export failed: {errors[0]}")
+
+
+def ExportParts(
+    objs: list[App.DocumentObject],
+    directory: str,
+    counts: list[int] | None = None,
+    file_format: str = "step",
+    workers: int | None = None,
+) -> str:
+    """
+    Export one file per distinct part to directory, and write manifest.csv with quantities.
+    Return the path of the manifest.
+    """
+    if file_format not in ("step", "brep"):
+        raise ValueError(f"Unknown format: {file_format}")
+    if workers is None:
+        workers = GetParams().GetInt("ExportWorkers", os.cpu_count() or 1)
+    os.makedirs(directory, exist_ok=True)
+
+    rows = []
+    conversions = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (fingerprint, (members, quantity)) in enumerate(
+            GroupParts(objs, counts).items()
+        ):
+            first = members[0]
+            model = (first.Proxy.sketchLableL or "part").replace(os.sep, "_")
+            base = f"{i + 1:04d}_{model}_{fingerprint[1]:g}"
+            file_name = f"{base}.{file_format}"
+            target = os.path.join(directory, file_name)
+            if file_format == "brep":
+                MemberShape(first).exportBrep(target)
+            else:
+                brep = os.path.join(tmp, f"{base}.brep")
+                MemberShape(first).exportBrep(brep)
+                conversions.append((brep, target))
+            rows.append(
+                (file_name, quantity, first.Proxy.sketchLableL) + fingerprint[1:6]
+                + (" ".join(m.Label for m in members),)
+            )
+        if conversions:
+            _convert_parallel(conversions, workers)
+
+    manifest = os.path.join(directory, "manifest.csv")
+    with open(manifest, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(MANIFEST_HEADER)
+        writer.writerows(rows)
+    return manifest
+
+
+class ExportPartsCommand:
+    """Export distinct cut members as STEP or BREP files"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Export parts",
+            "ToolTip": "Export one file per distinct member with a manifest of quantities",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        directory = QFileDialog.getExistingDirectory(
+            Gui.getMainWindow(), translate("Export", "Export parts to")
+        )
+        if not directory:
+            return
+        file_format, ok = QInputDialog.getItem(
+            Gui.getMainWindow(),
+            translate("Export", "Export parts"),
+            translate("Export", "Format:"),
+            ["step", "brep"],
+            0,
+            False,
+        )
+        if not ok:
+            return
+        objs, counts = GetMemberCounts(
+            Gui.Selection.getSelectionEx(), App.ActiveDocument
+        )
+        manifest = ExportParts(objs, directory, counts, file_format)
+        App.Console.PrintMessage(f"Parts exported, see {manifest} \n")
+
+
+Gui.addCommand("EPF_ExportParts", ExportPartsCommand())
@@ -0,0 +1,337 @@
+"""
+Frame model: the members and joints of a frame as NumPy arrays, solved before any
+ProfileFrameObject is touched.
+
+Members are stored as a struct of arrays (end points, tangents, local axes, profile id, end
+treatments), joints are the pairs of member ends meeting at the same point. Solving a frame of
+thousands of members is a handful of vectorized operations.
+
+This module doesn't depend on FreeCAD.
+"""
+
+import numpy as np
+
+NO_PROCESSING = "NoProcessing"
+MITER_CUT = "MiterCut"
+AUTO_ALIGN_A = "AutoAlignA"
+AUTO_ALIGN_B = "AutoAlignB"
+
+# Chamfer directions of ProfileFrameObject: the side of the profile (in its local XY plane)
+# where the other member of the joint lies. 0 when it is not along an axis.
+DIRECTION_NONE = 0
+DIRECTION_X = 1
+DIRECTION_MINUS_Y = 2
+DIRECTION_MINUS_X = 3
+DIRECTION_Y = 4
+
+
+def _normalize(v: np.ndarray) -> np.ndarray:
+    length = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.where(length == 0, 1, length)
+
+
+def default_axes(tangents: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Local X and Y axes of profiles normal to `tangents`, with the convention of OCC
+    (gp_Ax2 built from a main direction only). Used when the real placements are not known.
+    """
+    t = _normalize(tangents)
+    a, b, c = t[:, 0], t[:, 1], t[:, 2]
+    aa, ba, ca = np.abs(a), np.abs(b), np.abs(c)
+    zero = np.zeros_like(a)
+    x = np.where(
+        ((ba <= aa) & (ba <= ca))[:, None],
+        np.where((aa > ca)[:, None], np.stack([-c, zero, a], 1), np.stack([c, zero, -a], 1)),
+        np.where(
+            ((aa <= ba) & (aa <= ca))[:, None],
+            np.where((ba > ca)[:, None], np.stack([zero, -c, b], 1), np.stack([zero, c, -b], 1)),
+            np.where((aa > ba)[:, None], np.stack([-b, a, zero], 1), np.stack([b, -a, zero], 1)),
+        ),
+    )
+    x = _normalize(x)
+    return x, np.cross(t, x)
+
+
+class Joints:
+    """Pairs of member ends meeting at the same point, member_a < member_b."""
+
+    __slots__ = ("member_a", "member_b", "end_a", "end_b", "point", "angle", "node")
+
+    def __init__(self, member_a, member_b, end_a, end_b, point, angle, node):
+        self.member_a: np.ndarray = member_a
+        self.member_b: np.ndarray = member_b
+        self.end_a: np.ndarray = end_a  # 0 for the start of the member, 1 for its end
+        self.end_b: np.ndarray = end_b
+        self.point: np.ndarray = point  # (m, 3)
+        self.angle: np.ndarray = angle  # Angle between the tangents, in degrees
+        self.node: np.ndarray = node  # Index of the point, see FrameModel.end_node
+
+    def __len__(self):
+        return len(self.member_a)
+
+
+class FrameModel:
+    """
+    Members of a frame and their end treatments. Index 0 of the (n, 2) arrays is the start
+    ("L" side of a ProfileFrameObject), index 1 the end ("R" side).
+    """
+
+    __slots__ = (
+        "starts",
+        "ends",
+        "tangents",
+        "x_axes",
+        "y_axes",
+        "profile",
+        "profile_sizes",
+        "tolerance",
+        "chamfer_angle",
+        "chamfer_direction",
+        "extension",
+        "end_node",
+        "joints",
+        "butt_joints",
+    )
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        profile_sizes,
+        profile=None,
+        tangents=None,
+        x_axes=None,
+        y_axes=None,
+        tolerance: float = 1e-7,
+    ):
+        """
+        starts, ends: (n, 3) end points of the members.
+        profile_sizes: (p, 2) width and height of the profiles, profile: (n,) profile index.
+        tangents: (n, 3) directions at the start, by default from start to end.
+        x_axes, y_axes: (n, 3) local axes of the profiles, see default_axes.
+        """
+        self.starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        n = len(self.starts)
+        self.tangents = _normalize(
+            np.asarray(tangents, dtype=float).reshape(-1, 3)
+            if tangents is not None
+            else self.ends - self.starts
+        )
+        if x_axes is None or y_axes is None:
+            x_axes, y_axes = default_axes(self.tangents)
+        self.x_axes = np.asarray(x_axes, dtype=float).reshape(-1, 3)
+        self.y_axes = np.asarray(y_axes, dtype=float).reshape(-1, 3)
+        self.profile_sizes = np.asarray(profile_sizes, dtype=float).reshape(-1, 2)
+        self.profile = (
+            np.asarray(profile, dtype=np.intp)
+            if profile is not None
+            else np.zeros(n, dtype=np.intp)
+        )
+        self.tolerance = tolerance
+        self.chamfer_angle = np.zeros((n, 2))
+        self.chamfer_direction = np.zeros((n, 2), dtype=np.int8)  # 0: unchanged
+        self.extension = np.full((n, 2), np.nan)  # nan: unchanged
+        self.end_node = np.empty(0, dtype=np.intp)  # Set by find_joints
+        self.joints = self.find_joints()
+        # Set by auto_align: (through member, its end, butting member, its end,
+        # direction of the butting member around the through member, extension of the through member)
+        self.butt_joints: tuple[np.ndarray, ...] | None = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def find_joints(self) -> Joints:
+        """
+        Hash the end points on a grid of `tolerance`, and pair the ends sharing a cell.
+        A pair of members touching at both ends only keeps its first joint (start before end).
+        The points are numbered in end_node, indexed by end * n + member.
+        """
+        n = len(self)
+        points = np.concatenate([self.starts, self.ends])  # index: end * n + member
+        cells = np.round(points / self.tolerance).astype(np.int64)
+        _, node = np.unique(cells, axis=0, return_inverse=True)
+        node = node.reshape(-1)
+        self.end_node = node
+        order = np.argsort(node, kind="stable")
+        sorted_node = node[order]
+        bounds = np.flatnonzero(np.diff(sorted_node)) + 1
+        starts = np.concatenate([[0], bounds])
+        counts = np.diff(np.concatenate([starts, [len(order)]]))
+
+        # Every pair of ends of each node, one batch per node degree
+        first, second = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+        for count in np.unique(counts[counts > 1]):
+            groups = order[starts[counts == count][:, None] + np.arange(count)]
+            i, j = np.triu_indices(count, 1)
+            first.append(groups[:, i].ravel())
+            second.append(groups[:, j].ravel())
+        p = np.concatenate(first).astype(np.intp)
+        q = np.concatenate(second).astype(np.intp)
+
+        m_p, e_p = p % n, p // n
+        m_q, e_q = q % n, q // n
+        swap = m_p > m_q
+        member_a = np.where(swap, m_q, m_p)
+        member_b = np.where(swap, m_p, m_q)
+        end_a = np.where(swap, e_q, e_p)
+        end_b = np.where(swap, e_p, e_q)
+        pair_node = node[p]
+        keep = member_a != member_b
+        member_a, member_b = member_a[keep], member_b[keep]
+        end_a, end_b, pair_node = end_a[keep], end_b[keep], pair_node[keep]
+
+        # Same order as comparing every pair of members in turn
+        order = np.lexsort((end_b, end_a, member_b, member_a))
+        member_a, member_b = member_a[order], member_b[order]
+        end_a, end_b, pair_node = end_a[order], end_b[order], pair_node[order]
+        if len(member_a):
+            first_pair = np.ones(len(member_a), dtype=bool)
+            first_pair[1:] = (member_a[1:] != member_a[:-1]) | (
+                member_b[1:] != member_b[:-1]
+            )
+            member_a, member_b = member_a[first_pair], member_b[first_pair]
+            end_a, end_b = end_a[first_pair], end_b[first_pair]
+            pair_node = pair_node[first_pair]
+
+        point = np.where(end_a[:, None] == 0, self.starts[member_a], self.ends[member_a])
+        cos = np.einsum("ij,ij->i", self.tangents[member_a], self.tangents[member_b])
+        angle = np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+        return Joints(member_a, member_b, end_a, end_b, point, angle, pair_node)
+
+    def neighbourhood(self, members) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Members with an end at a point where an end of `members` is (`members` included), and
+        (k, 2) which of their ends are at these points.
+        """
+        nodes = self.end_node.reshape(2, -1).T
+        at = np.isin(nodes, nodes[np.asarray(members, dtype=np.intp)])
+        around = np.flatnonzero(at.any(1))
+        return around, at[around]
+
+    def chamfer_directions(self, member, other, other_end, point) -> np.ndarray:
+        """Direction (1~4) of `other`, seen in the profile plane of `member` at `point`."""
+        far = np.where(other_end[:, None] == 0, self.ends[other], self.starts[other])
+        d = _normalize(far - point)
+        x = np.einsum("ij,ij->i", d, self.x_axes[member])
+        y = np.einsum("ij,ij->i", d, self.y_axes[member])
+        on_x = np.abs(y) <= self.tolerance
+        on_y = np.abs(x) <= self.tolerance
+        return np.select(
+            [on_x & (x > 0), on_x & (x < 0), on_y & (y > 0), on_y & (y < 0)],
+            [DIRECTION_X, DIRECTION_MINUS_X, DIRECTION_Y, DIRECTION_MINUS_Y],
+            DIRECTION_NONE,
+        ).astype(np.int8)
+
+    def _assign(self, target: np.ndarray, joints_mask, values_a, values_b):
+        """
+        Write values at both ends of the masked joints. When an end takes part in several
+        joints, the last joint wins.
+        """
+        j = self.joints
+        members = np.stack([j.member_a[joints_mask], j.member_b[joints_mask]], 1).ravel()
+        ends = np.stack([j.end_a[joints_mask], j.end_b[joints_mask]], 1).ravel()
+        values = np.stack([values_a, values_b], 1).ravel()
+        flat = (members * 2 + ends)[::-1]
+        _, last = np.unique(flat, return_index=True)
+        target.reshape(-1)[flat[last]] = values[::-1][last]
+
+    def no_processing(self):
+        self.chamfer_angle[:] = 0
+        self.butt_joints = None
+
+    def miter_cut(self):
+        """Both members of a joint are cut at half the angle between them."""
+        self.no_processing()
+        j = self.joints
+        dir_a = self.chamfer_directions(j.member_a, j.member_b, j.end_b, j.point)
+        dir_b = self.chamfer_directions(j.member_b, j.member_a, j.end_a, j.point)
+        valid = (dir_a != DIRECTION_NONE) & (dir_b != DIRECTION_NONE)
+        half = j.angle[valid] / 2
+        self._assign(self.chamfer_angle, valid, half, half)
+        self._assign(self.chamfer_direction, valid, dir_a[valid], dir_b[valid])
+
+    def auto_align(self, mode: int, shortened: np.ndarray | None = None):
+        """
+        At right angle joints, one member is extended by half the width of the profile and the
+        other is shortened by as much. mode selects which one of the pair is shortened.
+        shortened: (n, 2) ends shortened by a previous solve, the same member of a joint is
+        shortened again whatever mode is.
+        """
+        self.no_processing()
+        j = self.joints
+        right = np.abs(j.angle - 90) <= 1e-9
+        dir_a = self.chamfer_directions(j.member_a, j.member_b, j.end_b, j.point)[right]
+        dir_b = self.chamfer_directions(j.member_b, j.member_a, j.end_a, j.point)[right]
+        sizes_a = self.profile_sizes[self.profile[j.member_a[right]]]
+        sizes_b = self.profile_sizes[self.profile[j.member_b[right]]]
+        along_x_a = (dir_a == DIRECTION_X) | (dir_a == DIRECTION_MINUS_X)
+        along_x_b = (dir_b == DIRECTION_X) | (dir_b == DIRECTION_MINUS_X)
+        extend_a = np.where(along_x_a, sizes_a[:, 0], sizes_a[:, 1]) / 2
+        extend_b = np.where(along_x_b, sizes_b[:, 0], sizes_b[:, 1]) / 2
+        ja, jb = j.member_a[right], j.member_b[right]
+        ea, eb = j.end_a[right], j.end_b[right]
+        shorten_a = np.full(len(ja), not mode)
+        if shortened is not None:
+            was_a, was_b = shortened[ja, ea], shortened[jb, eb]
+            shorten_a = np.where(was_a != was_b, was_a, shorten_a)
+        self.butt_joints = (
+            np.where(shorten_a, jb, ja),
+            np.where(shorten_a, eb, ea),
+            np.where(shorten_a, ja, jb),
+            np.where(shorten_a, ea, eb),
+            np.where(shorten_a, dir_b, dir_a),
+            np.where(shorten_a, extend_b, extend_a),
+        )
+        extend_a = np.where(shorten_a, -extend_a, extend_a)
+        extend_b = np.where(shorten_a, extend_b, -extend_b)
+        self._assign(self.extension, right, extend_a, extend_b)
+
+    def solve(self, joint_type: str, shortened: np.ndarray | None = None) -> "FrameModel":
+        """shortened: see auto_align."""
+        if joint_type == NO_PROCESSING:
+            self.no_processing()
+        elif joint_type == MITER_CUT:
+            self.miter_cut()
+        elif joint_type == AUTO_ALIGN_A:
+            self.auto_align(0, shortened)
+        elif joint_type == AUTO_ALIGN_B:
+            self.auto_align(1, shortened)
+        else:
+            raise ValueError(f"Unknown joint type: {joint_type}")
+        return self
+
+
+def rotate_chamfer_direction(direction: int, delta_angle: float) -> int:
+    """
+    Chamfer directions (1~4) are relative to the rotation of the member,
+    rotating the member by 90° moves them by one step.
+    """
+    return (direction - 1 + round(delta_angle / 90)) % 4 + 1
+
+
+def rescale_extension(
+    value: float, old: tuple[float, float], new: tuple[float, float], tolerance: float = 1e-6
+) -> float | None:
+    """
+    Auto alignment extends or shortens a member by half the width of the profile it meets.
+    Return the extension for the new profile, None if value isn't such a half width.
+    old, new: width and height of the profiles.
+    """
+    for old_length, new_length in zip(old, new):
+        if abs(abs(value) * 2 - old_length) <= tolerance:
+            return float(np.copysign(new_length / 2, value))
+    return None
+
+
+def rescale_hole(hole: str, old: tuple[float, float], new: tuple[float, float]) -> str:
+    """Move an "Access <side> <direction> <distance>" hole for the new profile."""
+    kind, *args = hole.split()
+    if kind != "Access" or len(args) != 3:
+        return hole
+    try:
+        distance = float(args[2])
+    except ValueError:
+        return hole
+    value = rescale_extension(distance, old, new)
+    return hole if value is None else f"{kind} {args[0]} {args[1]} {value:g}"
@@ -0,0 +1,310 @@
+"""
+Frame spec: a small JSON description of a frame, enough to build it again in one batch.
+
+It holds the profile geometries, and for each member its edge (source name and end points),
+profile, offsets, angle and end treatments. Files ending with ".gz" are compressed.
+Members are rebuilt on their source edge when it still exists unchanged in the document,
+otherwise on straight edges made from the saved end points.
+"""
+
+import gzip
+import json
+import os
+import FreeCAD as App
+import FreeCADGui as Gui
+import Part
+from PySide.QtWidgets import QFileDialog
+from freecad.easy_profile_frame import ICONPATH
+from freecad.easy_profile_frame.typing import SketchObject, AppPart
+from .ProfileFrameObject import CreateProfileFrameBody
+from .profile_cache import local_shape, section_key
+from .utils import GetParams, GetProfileFrames, Transaction
+
+translate = App.Qt.translate
+
+SPEC_FORMAT = "EasyProfileFrame frame"
+SPEC_VERSION = 1
+FILE_FILTER = "Frame spec (*.json *.json.gz)"
+
+
+def _vector(v: App.Vector) -> list[float]:
+    return [round(v.x, 6), round(v.y, 6), round(v.z, 6)]
+
+
+def _geometry_to_dicts(geometry) -> list[dict]:
+    """Entries of one sketch geometry, curves other than lines and circles are discretized."""
+    if isinstance(geometry, Part.LineSegment):
+        return [
+            {
+                "type": "Line",
+                "start": _vector(geometry.StartPoint),
+                "end": _vector(geometry.EndPoint),
+            }
+        ]
+    if isinstance(geometry, (Part.ArcOfCircle, Part.Circle)):
+        # Arc parameters are measured from the X axis of the circle
+        circle = {
+            "center": _vector(geometry.Center),
+            "axis": _vector(geometry.Axis),
+            "x_axis": _vector(geometry.XAxis),
+            "radius": round(geometry.Radius, 6),
+        }
+        if isinstance(geometry, Part.ArcOfCircle):
+            return [
+                {
+                    "type": "Arc",
+                    **circle,
+                    "range": [geometry.FirstParameter, geometry.LastParameter],
+                }
+            ]
+        return [{"type": "Circle", **circle}]
+    if isinstance(geometry, Part.Point):
+        return []
+    try:
+        points = geometry.toShape().discretize(
+            QuasiDeflection=GetParams().GetFloat("SpecDeflection", 0.01)
+        )
+    except Exception:
+        App.Console.PrintWarning(
+            f"Profile geometry {type(geometry).__name__} is skipped in the frame spec \n"
+        )
+        return []
+    App.Console.PrintWarning(
+        f"Profile geometry {type(geometry).__name__} is written as {len(points) - 1} lines \n"
+    )
+    return [
+        {"type": "Line", "start": _vector(a), "end": _vector(b)}
+        for a, b in zip(points, points[1:])
+    ]
+
+
+def _geometry_from_dict(data: dict):
+    """Sketch geometry of an entry, None (with a warning) for an unknown entry."""
+    if data["type"] == "Line":
+        return Part.LineSegment(App.Vector(*data["start"]), App.Vector(*data["end"]))
+    if data["type"] not in ("Circle", "Arc"):
+        App.Console.PrintWarning(f"Profile geometry {data['type']} is skipped \n")
+        return None
+    circle = Part.Circle(App.Vector(*data["center"]), App.Vector(*data["axis"]), data["radius"])
+    if "x_axis" in data:
+        circle.XAxis = App.Vector(*data["x_axis"])
+    if data["type"] == "Circle":
+        return circle
+    return Part.ArcOfCircle(circle, *data["range"])
+
+
+def _profile_spec(sketch: SketchObject, label: str) -> dict:
+    return {
+        "label": label,
+        "geometry": [
+            entry
+            for i, geometry in enumerate(sketch.Geometry)
+            if not sketch.getConstruction(i)
+            for entry in _geometry_to_dicts(geometry)
+        ],
+    }
+
+
+def _end_spec(obj: App.DocumentObject, side: str) -> dict:
+    end = {
+        "chamfer_angle": round(getattr(obj, f"ChamferAngle{side}").Value, 6),
+        "chamfer_direction": getattr(obj, f"ChamferDirection{side}"),
+    }
+    expressions = dict(obj.ExpressionEngine)
+    prop = f"ExtendedLength{side}"
+    if prop in expressions:
+        end["extension_expression"] = expressions[prop]
+    else:
+        end["extension"] = round(getattr(obj, prop).Value, 6)
+    return end
+
+
+def FrameSpec(members: list[App.DocumentObject]) -> dict:
+    """Describe members, profiles are shared by members with the same section."""
+    profiles: list[dict] = []
+    profile_index: dict[tuple, int] = {}
+    member_specs = []
+    for obj in members:
+        sketch = obj.getObject(obj.Sketch)
+        key = section_key(local_shape(sketch))
+        if key not in profile_index:
+            profile_index[key] = len(profiles)
+            profiles.append(_profile_spec(sketch, obj.Proxy.sketchLableL or sketch.Label))
+        sketch_name, sub_name = obj.EdgeName.split(":")
+        edge = obj.Document.getObject(sketch_name).getSubObject(sub_name)
+        part = obj.getParentGeoFeatureGroup()
+        member_specs.append(
+            {
+                "label": obj.Label,
+                "part": part.Label if part is not None else None,
+                "edge": obj.EdgeName,
+                "start": _vector(edge.Vertexes[0].Point),
+                "end": _vector(edge.Vertexes[-1].Point),
+                "profile": profile_index[key],
+                "offset": [round(obj.OffsetX.Value, 6), round(obj.OffsetY.Value, 6)],
+                "angle": round(obj.Angle.Value, 6),
+                "ends": [_end_spec(obj, "L"), _end_spec(obj, "R")],
+                "holes": list(obj.Holes),
+            }
+        )
+    return {
+        "format": SPEC_FORMAT,
+        "version": SPEC_VERSION,
+        "profiles": profiles,
+        "members": member_specs,
+    }
+
+
+def WriteFrameSpec(path: str, spec: dict):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        json.dump(spec, f, indent=1)
+        f.write("\n")
+
+
+def ReadFrameSpec(path: str) -> dict:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        spec = json.load(f)
+    if spec.get("format") != SPEC_FORMAT:
+        raise ValueError(f"{path} is not a frame spec")
+    if spec.get("version", 0) > SPEC_VERSION:
+        raise ValueError(f"Frame spec version {spec['version']} is not supported")
+    return spec
+
+
+def _source_edge(doc: App.Document, member: dict, tolerance: float) -> str | None:
+    """The saved edge name, if the edge is still there with the same end points."""
+    sketch_name, _, sub_name = member["edge"].partition(":")
+    source = doc.getObject(sketch_name)
+    if source is None:
+        return None
+    try:
+        edge = source.getSubObject(sub_name)
+    except Exception:
+        return None
+    if not isinstance(edge, Part.Edge):
+        return None
+    ends = (edge.Vertexes[0].Point, edge.Vertexes[-1].Point)
+    saved = (App.Vector(*member["start"]), App.Vector(*member["end"]))
+    if all((a - b).Length <= tolerance for a, b in zip(ends, saved)):
+        return member["edge"]
+    return None
+
+
+def BuildFrame(
+    spec: dict, doc: App.Document, tolerance: float = 1e-6
+) -> list[App.DocumentObject]:
+    """Create the members of a spec in doc, with a single recompute. Return the members."""
+    parts: dict[str | None, AppPart] = {}
+
+    def get_part(label: str | None) -> AppPart:
+        if label not in parts:
+            part = doc.addObject("App::Part", "Part")
+            if label:
+                part.Label = label
+            parts[label] = part
+        return parts[label]
+
+    sketches: list[SketchObject] = []
+    for profile in spec["profiles"]:
+        sketch = doc.addObject("Sketcher::SketchObject", "Profile")
+        sketch.Label = profile["label"]
+        geometries = (_geometry_from_dict(g) for g in profile["geometry"])
+        sketch.addGeometry([g for g in geometries if g is not None])
+        sketch.Visibility = False
+        sketches.append(sketch)
+
+    edge_names = [_source_edge(doc, m, tolerance) for m in spec["members"]]
+    missing = [i for i, name in enumerate(edge_names) if name is None]
+    if missing:
+        # A new object for each import, the members of earlier imports keep their edges
+        wires = doc.addObject("Part::Feature", "FrameSpecWires")
+        wires.Shape = Part.Compound(
+            [
+                Part.LineSegment(
+                    App.Vector(*spec["members"][i]["start"]),
+                    App.Vector(*spec["members"][i]["end"]),
+                ).toShape()
+                for i in missing
+            ]
+        )
+        wires.Visibility = False
+        for n, i in enumerate(missing):
+            edge_names[i] = f"{wires.Name}:Edge{n + 1}"
+
+    members = []
+    for member, edge_name in zip(spec["members"], edge_names):
+        part = get_part(member.get("part"))
+        # CreateProfileFrameBody reuses an object of the same name, members already built on
+        # the same edge are left alone.
+        name = base = f"Frame_{edge_name}".replace(":", "_")
+        while doc.getObject(name) is not None:
+            name = f"{base}_{len(members)}" if name == base else f"{name}_"
+        obj = CreateProfileFrameBody(sketches[member["profile"]], edge_name, part, name)
+        obj.Label = member["label"]
+        obj.OffsetX = member["offset"][0]
+        obj.OffsetY = member["offset"][1]
+        obj.Angle = member["angle"]
+        for side, end in zip("LR", member["ends"]):
+            setattr(obj, f"ChamferAngle{side}", end["chamfer_angle"])
+            setattr(obj, f"ChamferDirection{side}", end["chamfer_direction"])
+            if "extension_expression" in end:
+                obj.setExpression(f"ExtendedLength{side}", end["extension_expression"])
+            else:
+                setattr(obj, f"ExtendedLength{side}", end["extension"])
+        obj.Holes = member.get("holes", [])
+        members.append(obj)
+    doc.recompute()
+    return members
+
+
+class ExportFrameSpecCommand:
+    """Save the selected members (or the whole frame) as a frame spec"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Export frame spec",
+            "ToolTip": "Save the members as a small JSON file, to rebuild the frame later",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        path, _ = QFileDialog.getSaveFileName(
+            Gui.getMainWindow(), translate("FrameSpec", "Export frame spec"), "", FILE_FILTER
+        )
+        if not path:
+            return
+        members = GetProfileFrames(Gui.Selection.getSelectionEx(), App.ActiveDocument)
+        WriteFrameSpec(path, FrameSpec(members))
+
+
+class ImportFrameSpecCommand:
+    """Build a frame from a frame spec"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Import frame spec",
+            "ToolTip": "Build the members of a frame spec in the active document",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        path, _ = QFileDialog.getOpenFileName(
+            Gui.getMainWindow(), translate("FrameSpec", "Import frame spec"), "", FILE_FILTER
+        )
+        if not path:
+            return
+        doc = App.ActiveDocument
+        with Transaction(doc, translate("Command", "Import frame spec")):
+            BuildFrame(ReadFrameSpec(path), doc)
+
+
+Gui.addCommand("EPF_ExportFrameSpec", ExportFrameSpecCommand())
+Gui.addCommand("EPF_ImportFrameSpec", ImportFrameSpecCommand())
@@ -0,0 +1,38 @@
+import FreeCAD as App
+import FreeCADGui as Gui
+
+
+def _selection_path(obj: App.DocumentObject, sub_name: str) -> tuple[App.DocumentObject, str]:
+    """Top level parent of obj and the sub-object path of obj (and its element) in it."""
+    path = sub_name
+    parent = obj.getParentGeoFeatureGroup()
+    while parent is not None:
+        path = f"{obj.Name}.{path}"
+        obj = parent
+        parent = obj.getParentGeoFeatureGroup()
+    return obj, path
+
+
+def AddSelections(doc: App.Document, names: list[str], clear: bool = False):
+    """
+    Select many objects or sub-elements ("Sketch" or "Sketch:Edge1") at once.
+    Elements are selected by their path in their top level parent (e.g. members in their Part),
+    and pushed with a single call per parent, instead of one call (and one view update) per
+    element.
+    """
+    grouped: dict[str, tuple[App.DocumentObject, list[str]]] = {}
+    for name in names:
+        obj_name, _, sub_name = name.partition(":")
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            continue
+        root, path = _selection_path(obj, sub_name)
+        grouped.setdefault(root.Name, (root, []))[1].append(path)
+    if clear:
+        Gui.Selection.clearSelection()
+    for root, paths in grouped.values():
+        sub_paths = [p for p in paths if p]
+        if sub_paths:
+            Gui.Selection.addSelection(root, sub_paths, False)
+        if len(sub_paths) < len(paths):
+            Gui.Selection.addSelection(root)
@@ -0,0 +1,75 @@
+"""
+Connectors and fasteners of a frame, counted from its joint graph.
+
+Every point where member ends meet is classified (see joint_types), each joint type is mapped
+to a hardware kit, kits are read from the "HardwareKits" parameter group:
+
+    key: joint type, or "<joint type>.<profile model>" for one profile only
+    value: "Item:quantity;Item:quantity", an empty string for no hardware
+"""
+
+import numpy as np
+import FreeCAD as App
+from .joint_types import DEFAULT_KITS, classify_nodes, parse_kit
+from .utils import GetParams, MemberFrameModel
+
+HARDWARE_HEADER = ("Hardware", "Quantity")
+_UNSET = "<default>"
+
+
+def GetHardwareKit(joint_type: str, model: str) -> list[tuple[str, float]]:
+    kits = GetParams().GetGroup("HardwareKits")
+    for key in (f"{joint_type}.{model}", joint_type):
+        text = kits.GetString(key, _UNSET)
+        if text != _UNSET:
+            return parse_kit(text)
+    return parse_kit(DEFAULT_KITS.get(joint_type, ""))
+
+
+def HardwareBom(
+    objs: list[App.DocumentObject], counts: list[int] | None = None
+) -> list[tuple[str, float]]:
+    """
+    Aggregated hardware of the members, joints of linked modules are counted once per instance.
+    Return (item, quantity) sorted by item.
+    """
+    if not objs:
+        return []
+    model, _ = MemberFrameModel(objs)
+    n = len(objs)
+    if counts is None:
+        counts = [1] * n
+    # A member of each point, for its profile model and its number of instances
+    node_member = np.empty(int(model.end_node.max()) + 1, dtype=np.intp)
+    node_member[model.end_node] = np.arange(2 * n) % n
+
+    kits: dict[tuple[str, str], list[tuple[str, float]]] = {}
+    totals: dict[str, float] = {}
+    unclassified: list[str] = []
+    for node, joint_type in zip(*classify_nodes(model)):
+        member = int(node_member[node])
+        profile = objs[member].Proxy.sketchLableL or ""
+        kit = kits.get((joint_type, profile))
+        if kit is None:
+            kit = kits[(joint_type, profile)] = GetHardwareKit(joint_type, profile)
+        if not kit and joint_type not in DEFAULT_KITS:
+            unclassified.append(f"{joint_type} at {objs[member].Label}")
+        for item, quantity in kit:
+            totals[item] = totals.get(item, 0.0) + quantity * counts[member]
+    if unclassified:
+        App.Console.PrintWarning(
+            f"No hardware for {len(unclassified)} joints, add a kit to the HardwareKits "
+            f"parameters: {', '.join(unclassified)} \n"
+        )
+    return sorted(totals.items())
+
+
+def WriteHardware(sheet, hardware: list[tuple[str, float]], row: int) -> int:
+    """Write hardware lines to a spreadsheet from row, return the next free row."""
+    sheet.set(f"A{row}", HARDWARE_HEADER[0])
+    sheet.set(f"B{row}", HARDWARE_HEADER[1])
+    for item, quantity in hardware:
+        row += 1
+        sheet.set(f"A{row}", item)
+        sheet.set(f"B{row}", f"{quantity:g}")
+    return row + 1
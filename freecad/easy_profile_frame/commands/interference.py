@@ -0,0 +1,108 @@
+"""
+Interference and clearance check of the members of a frame.
+
+Candidate pairs are found with an AABB tree over the member bounding boxes (grown by the
+clearance), exact boolean and distance checks are only run on them.
+"""
+
+import os
+import FreeCAD as App
+import FreeCADGui as Gui
+import Part
+from freecad.easy_profile_frame import ICONPATH
+from .bvh import AabbTree
+from .gui_utils import AddSelections
+from .utils import GetParams, GetProfileFrames, MemberFrameModel, MemberShape
+
+translate = App.Qt.translate
+
+OVERLAP = "Overlap"
+CLEARANCE = "Clearance"
+
+# (member, other member, OVERLAP or CLEARANCE, common volume or distance)
+Interference = tuple[App.DocumentObject, App.DocumentObject, str, float]
+
+
+def member_solid(obj: App.DocumentObject) -> Part.Shape:
+    """Full detail shape of a member in global coordinates."""
+    shape = MemberShape(obj).copy()
+    shape.Placement = obj.getGlobalPlacement()
+    return shape
+
+
+def joined_pairs(members: list[App.DocumentObject], tolerance: float = 1e-7) -> set:
+    """Index pairs (i < j) of the members joined by an end, they touch by design."""
+    joints = MemberFrameModel(members, tolerance)[0].joints
+    return set(zip(joints.member_a.tolist(), joints.member_b.tolist()))
+
+
+def CheckInterference(
+    members: list[App.DocumentObject],
+    clearance: float = 0.0,
+    volume_tolerance: float = 1e-3,
+) -> list[Interference]:
+    """
+    Report the members overlapping by more than volume_tolerance (mm³), and the members closer
+    than clearance (mm) to each other. Members joined by an end are only checked for overlaps.
+    """
+    solids = [member_solid(obj) for obj in members]
+    lower, upper = [], []
+    for solid in solids:
+        bb = solid.BoundBox
+        # Boxes closer than the clearance overlap once grown by it
+        lower.append((bb.XMin - clearance, bb.YMin - clearance, bb.ZMin - clearance))
+        upper.append((bb.XMax, bb.YMax, bb.ZMax))
+    joined = joined_pairs(members) if clearance > 0 else set()
+
+    found: list[Interference] = []
+    for i, j in AabbTree(lower, upper).self_pairs().tolist():
+        volume = solids[i].common(solids[j]).Volume
+        if volume > volume_tolerance:
+            found.append((members[i], members[j], OVERLAP, volume))
+        elif clearance > 0 and (i, j) not in joined:
+            distance = solids[i].distToShape(solids[j])[0]
+            if distance < clearance:
+                found.append((members[i], members[j], CLEARANCE, distance))
+    return found
+
+
+class CheckInterferenceCommand:
+    """Check the selected members (or the whole frame) for overlaps and clearance"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Check interference",
+            "ToolTip": "Find overlapping members and members closer than the clearance",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        doc = App.ActiveDocument
+        members = GetProfileFrames(Gui.Selection.getSelectionEx(), doc)
+        params = GetParams()
+        found = CheckInterference(
+            members,
+            params.GetFloat("Clearance", 0.0),
+            params.GetFloat("OverlapVolumeTolerance", 1e-3),
+        )
+        if not found:
+            App.Console.PrintMessage(f"No interference between {len(members)} members \n")
+            return
+        for a, b, kind, value in found:
+            if kind == OVERLAP:
+                App.Console.PrintWarning(
+                    f"{a.Label} and {b.Label} overlap: {value:.3f} mm³ \n"
+                )
+            else:
+                App.Console.PrintWarning(
+                    f"{a.Label} and {b.Label} are {value:.3f} mm apart \n"
+                )
+        AddSelections(
+            doc, [obj.Name for a, b, _, _ in found for obj in (a, b)], clear=True
+        )
+
+
+Gui.addCommand("EPF_CheckInterference", CheckInterferenceCommand())
@@ -0,0 +1,64 @@
+"""
+Central invalidation of cached data derived from document objects.
+
+A cache registers an evict function, then declares which source objects (and optionally which
+of their properties) each entry depends on. When a source changes or is deleted, the dependent
+entries are evicted and forgotten; the cache declares them again when it recomputes them.
+"""
+
+import FreeCAD as App
+from typing import Callable, Hashable
+
+ObjectKey = tuple[str, str]  # (Document name, Object name)
+
+
+class InvalidationService:
+    def __init__(self):
+        self.evictors: dict[str, Callable[[Hashable], None]] = {}
+        # {source: {(cache, key): properties or None for any property}}
+        self.dependents: dict[ObjectKey, dict[tuple[str, Hashable], frozenset | None]] = {}
+
+    def register_cache(self, cache: str, evict: Callable[[Hashable], None]):
+        self.evictors[cache] = evict
+
+    def depend(
+        self,
+        source: App.DocumentObject,
+        cache: str,
+        key: Hashable,
+        properties: set[str] | None = None,
+    ):
+        """Evict `key` of `cache` when one of `properties` of `source` changes."""
+        entries = self.dependents.setdefault((source.Document.Name, source.Name), {})
+        entries[(cache, key)] = frozenset(properties) if properties is not None else None
+
+    def invalidate(self, source: ObjectKey, prop: str | None = None):
+        """Evict what depends on source. prop is None when the source is deleted."""
+        entries = self.dependents.get(source)
+        if not entries:
+            return
+        evicted = [
+            entry
+            for entry, properties in entries.items()
+            if prop is None or properties is None or prop in properties
+        ]
+        for entry in evicted:
+            del entries[entry]
+        if not entries:
+            del self.dependents[source]
+        for cache, key in evicted:
+            self.evictors[cache](key)
+
+    def slotChangedObject(self, obj, prop):
+        self.invalidate((obj.Document.Name, obj.Name), prop)
+
+    def slotDeletedObject(self, obj):
+        self.invalidate((obj.Document.Name, obj.Name))
+
+    def slotDeletedDocument(self, doc):
+        for source in [s for s in self.dependents if s[0] == doc.Name]:
+            self.invalidate(source)
+
+
+invalidation = InvalidationService()
+App.addDocumentObserver(invalidation)
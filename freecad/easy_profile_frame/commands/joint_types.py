@@ -0,0 +1,71 @@
+"""
+Joint types of a frame, from its joint graph, and the hardware kits they need.
+
+Every point where member ends meet is classified by the number of ends and how many of them
+continue each other in a straight line. A kit is written "Item:quantity;Item:quantity".
+
+This module doesn't depend on FreeCAD.
+"""
+
+import numpy as np
+from .frame_model import FrameModel
+
+SPLICE = "Splice"  # Two collinear members
+CORNER = "Corner"  # Two members at an angle
+T_JOINT = "T"  # Two collinear members and a third one
+CORNER3 = "Corner3"  # Three members, none collinear (box corner)
+CROSS = "Cross"  # Two pairs of collinear members
+T_CORNER = "TCorner"  # Two collinear members and two other ones (T joint on a box corner)
+CORNER4 = "Corner4"  # Four members, none collinear
+
+DEFAULT_KITS = {
+    SPLICE: "Straight connector:1;T-nut:4;Bolt:4",
+    CORNER: "Corner bracket:1;T-nut:2;Bolt:2",
+    T_JOINT: "Corner bracket:2;T-nut:4;Bolt:4",
+    CORNER3: "Corner bracket:3;T-nut:6;Bolt:6",
+    CROSS: "Corner bracket:4;T-nut:8;Bolt:8",
+    T_CORNER: "Corner bracket:3;T-nut:6;Bolt:6",
+    CORNER4: "Corner bracket:4;T-nut:8;Bolt:8",
+}
+
+
+def classify_nodes(model: FrameModel) -> tuple[np.ndarray, list[str]]:
+    """
+    Return the points where at least two member ends meet (indices of model.end_node), and
+    their joint type. Points of more than 4 ends are "Node<number of ends>", they have no
+    default hardware.
+    """
+    n_nodes = int(model.end_node.max()) + 1 if len(model.end_node) else 0
+    degree = np.bincount(model.end_node, minlength=n_nodes)
+    j = model.joints
+    collinear = (j.angle <= 1e-6) | (j.angle >= 180 - 1e-6)
+    straight = np.bincount(j.node[collinear], minlength=n_nodes)
+
+    nodes = np.flatnonzero(degree > 1)
+    d, s = degree[nodes], straight[nodes]
+    types = np.select(
+        [
+            (d == 2) & (s > 0),
+            d == 2,
+            (d == 3) & (s > 0),
+            d == 3,
+            (d == 4) & (s > 1),
+            (d == 4) & (s == 1),
+            d == 4,
+        ],
+        [SPLICE, CORNER, T_JOINT, CORNER3, CROSS, T_CORNER, CORNER4],
+        "",
+    )
+    return nodes, [t or f"Node{k}" for t, k in zip(types.tolist(), d.tolist())]
+
+
+def parse_kit(text: str) -> list[tuple[str, float]]:
+    items = []
+    for entry in text.split(";"):
+        if not entry.strip():
+            continue
+        name, _, quantity = entry.rpartition(":")
+        if not name:
+            name, quantity = quantity, "1"
+        items.append((name.strip(), float(quantity)))
+    return items
@@ -0,0 +1,198 @@
+"""
+Profile library index.
+
+Library files are read directly from the .FCStd archive (Document.xml and the saved thumbnail),
+so they can be scanned in a worker thread without opening them in FreeCAD.
+Results are cached on disk and only files whose modification time changed are read again.
+"""
+
+import hashlib
+import json
+import math
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+import FreeCAD as App
+from PySide.QtCore import QThread, Signal
+from freecad.easy_profile_frame import RESSOURCESPATH
+from .utils import GetParams
+
+LIB_PATH = os.path.join(RESSOURCESPATH, "PartLib")
+CACHE_VERSION = 1
+
+
+def normalize_path(path: str) -> str:
+    """Index keys and library directories are compared as absolute, normalized paths."""
+    return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
+
+
+def LibraryPaths() -> list[str]:
+    """The bundled library followed by the user directories ("LibraryPaths" parameter, separated by ';')."""
+    paths = [normalize_path(LIB_PATH)]
+    for path in GetParams().GetString("LibraryPaths", "").split(";"):
+        path = path.strip()
+        if not path:
+            continue
+        path = normalize_path(path)
+        if os.path.isdir(path) and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def cache_dir() -> str:
+    path = os.path.join(App.getUserCachePath(), "EasyProfileFrame")
+    os.makedirs(os.path.join(path, "thumbnails"), exist_ok=True)
+    return path
+
+
+def _arc_points(cx, cy, r, start, end):
+    """End points and axis extremes of an arc, enough for a bounding box."""
+    if end < start:
+        end += 2 * math.pi
+    angles = [start, end]
+    k = math.ceil(start / (math.pi / 2))
+    while k * math.pi / 2 <= end:
+        angles.append(k * math.pi / 2)
+        k += 1
+    return [(cx + r * math.cos(a), cy + r * math.sin(a)) for a in angles]
+
+
+def _geometry_points(geometry: ET.Element) -> list[tuple[float, float]]:
+    construction = geometry.find("Construction")
+    if construction is not None and construction.get("value") == "1":
+        return []
+    points = []
+    for elem in geometry:
+        a = elem.attrib
+        if elem.tag == "LineSegment":
+            points.append((float(a["StartX"]), float(a["StartY"])))
+            points.append((float(a["EndX"]), float(a["EndY"])))
+        elif elem.tag == "Circle":
+            cx, cy, r = float(a["CenterX"]), float(a["CenterY"]), float(a["Radius"])
+            points += [(cx - r, cy - r), (cx + r, cy + r)]
+        elif elem.tag == "ArcOfCircle":
+            points += _arc_points(
+                float(a["CenterX"]),
+                float(a["CenterY"]),
+                float(a["Radius"]),
+                float(a["StartAngle"]),
+                float(a["EndAngle"]),
+            )
+        elif elem.tag == "Point":
+            points.append((float(a["X"]), float(a["Y"])))
+    return points
+
+
+def read_library_file(path: str, thumbnail_dir: str) -> dict:
+    """
+    Read the profile sketches of a library file: {"mtime", "profiles", "thumbnail"}.
+    profiles: [{"name", "label", "bound_box": [XMin, XMax, YMin, YMax]}]
+    """
+    entry = {"mtime": os.path.getmtime(path), "profiles": [], "thumbnail": None}
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read("Document.xml"))
+        sketches = {
+            obj.get("name")
+            for obj in root.iterfind("Objects/Object")
+            if obj.get("type") == "Sketcher::SketchObject"
+        }
+        for obj in root.iterfind("ObjectData/Object"):
+            name = obj.get("name")
+            if name not in sketches:
+                continue
+            label = name
+            points = []
+            for prop in obj.iterfind("Properties/Property"):
+                if prop.get("name") == "Label":
+                    label = prop.find("String").get("value")
+                elif prop.get("name") == "Geometry":
+                    for geometry in prop.iterfind("GeometryList/Geometry"):
+                        points += _geometry_points(geometry)
+            bound_box = None
+            if points:
+                xs = [p[0] for p in points]
+                ys = [p[1] for p in points]
+                bound_box = [min(xs), max(xs), min(ys), max(ys)]
+            entry["profiles"].append(
+                {"name": name, "label": label, "bound_box": bound_box}
+            )
+
+        if "thumbnails/Thumbnail.png" in archive.namelist():
+            thumbnail = os.path.join(
+                thumbnail_dir, hashlib.md5(path.encode()).hexdigest() + ".png"
+            )
+            with open(thumbnail, "wb") as f:
+                f.write(archive.read("thumbnails/Thumbnail.png"))
+            entry["thumbnail"] = thumbnail
+    return entry
+
+
+class LibraryIndex:
+    """On-disk cache of the library files, {path: entry}, see read_library_file."""
+
+    def __init__(self):
+        self.path = os.path.join(cache_dir(), "library.json")
+        self.entries: dict[str, dict] = {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.entries = {
+                    normalize_path(path): entry for path, entry in data["entries"].items()
+                }
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+
+    def files(self, paths: list[str]) -> list[str]:
+        """Cached files that are in the library directories."""
+        paths = {normalize_path(path) for path in paths}
+        return sorted(
+            file for file in self.entries if os.path.dirname(file) in paths
+        )
+
+
+class LibraryScanner(QThread):
+    """Scan library directories in the background, emitting the files that changed."""
+
+    fileScanned = Signal(str, dict)  # path, entry
+    fileRemoved = Signal(str)
+    scanFailed = Signal(str, str)  # path, error
+
+    def __init__(self, paths: list[str], cached: dict[str, dict], parent=None):
+        super().__init__(parent)
+        self.paths = [normalize_path(path) for path in paths]
+        self.cached = {
+            normalize_path(path): entry["mtime"] for path, entry in cached.items()
+        }
+        self.thumbnail_dir = os.path.join(cache_dir(), "thumbnails")
+
+    def run(self):
+        found = set()
+        for directory in self.paths:
+            try:
+                names = sorted(os.listdir(directory))
+            except OSError as e:
+                self.scanFailed.emit(directory, str(e))
+                continue
+            for name in names:
+                if self.isInterruptionRequested():
+                    return
+                if not name.endswith(".FCStd"):
+                    continue
+                path = os.path.join(directory, name)
+                found.add(path)
+                try:
+                    if self.cached.get(path) == os.path.getmtime(path):
+                        continue
+                    self.fileScanned.emit(
+                        path, read_library_file(path, self.thumbnail_dir)
+                    )
+                except (OSError, zipfile.BadZipFile, ET.ParseError, KeyError) as e:
+                    self.scanFailed.emit(path, str(e))
+        for path in self.cached:
+            if path not in found and os.path.dirname(path) in self.paths:
+                self.fileRemoved.emit(path)
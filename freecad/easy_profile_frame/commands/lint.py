@@ -0,0 +1,163 @@
+"""
+Lint of a frame over its joint graph: ends joined to nothing, joints left without end treatment,
+members shorter than their extensions and ends with conflicting treatments.
+
+The checks run on a FrameModel loaded with the current properties of the members, all of them
+are vectorized.
+"""
+
+import os
+import numpy as np
+import FreeCAD as App
+import FreeCADGui as Gui
+from freecad.easy_profile_frame import ICONPATH
+from .frame_model import FrameModel, NO_PROCESSING
+from .gui_utils import AddSelections
+from .utils import GetProfileFrames, MemberFrameModel
+
+translate = App.Qt.translate
+
+ZERO_LENGTH = "ZeroLength"
+DANGLING_END = "DanglingEnd"
+UNPROCESSED_JOINT = "UnprocessedJoint"
+TOO_SHORT = "TooShort"
+CONFLICTING_ENDS = "ConflictingEnds"
+
+MESSAGES = {
+    ZERO_LENGTH: "has a zero length edge",
+    DANGLING_END: "end is not joined to another member",
+    UNPROCESSED_JOINT: "joint has no miter nor extension",
+    TOO_SHORT: "is shorter than its negative extensions",
+    CONFLICTING_ENDS: "end has conflicting treatments",
+}
+# Free ends are expected in open frames, the other issues are reported as warnings.
+INFO = {DANGLING_END}
+
+# (member index, end index or None for the member, issue)
+Issue = tuple[int, int | None, str]
+
+
+def lint_frame(
+    model: FrameModel,
+    lengths: np.ndarray,
+    expressions: np.ndarray,
+    joint_type: str | None = None,
+) -> list[Issue]:
+    """
+    model holds the current end treatments of the members (no nan extensions).
+    lengths: (n,) edge lengths. expressions: (n, 2) True where the extension is set by an
+    expression (auto align). joint_type: the joint type the frame was drawn with, if known.
+    """
+    tolerance = model.tolerance
+    issues: list[Issue] = []
+    n = len(model)
+    if n == 0:
+        return issues
+    j = model.joints
+    chamfered = model.chamfer_angle > 0
+    extended = np.abs(model.extension) > tolerance
+    # End arrays flattened as member * 2 + end
+    chamfered_ends = chamfered.reshape(-1)
+    treated_ends = chamfered_ends | extended.reshape(-1)
+    ends_a = j.member_a * 2 + j.end_a
+    ends_b = j.member_b * 2 + j.end_b
+
+    for i in np.flatnonzero(lengths <= tolerance).tolist():
+        issues.append((i, None, ZERO_LENGTH))
+
+    joint_count = np.bincount(np.concatenate([ends_a, ends_b]), minlength=2 * n)
+    for e in np.flatnonzero(joint_count == 0).tolist():
+        issues.append((e // 2, e % 2, DANGLING_END))
+
+    # Collinear members continue each other, there is nothing to process.
+    bent = (j.angle > 1e-6) & (j.angle < 180 - 1e-6)
+    # A frame drawn without processing has untreated joints on purpose.
+    if joint_type != NO_PROCESSING:
+        unprocessed = bent & ~treated_ends[ends_a] & ~treated_ends[ends_b]
+        # Once per joint point, on the first end of its first unprocessed pair
+        _, first = np.unique(j.node[unprocessed], return_index=True)
+        for k in np.flatnonzero(unprocessed)[np.sort(first)].tolist():
+            issues.append((int(j.member_a[k]), int(j.end_a[k]), UNPROCESSED_JOINT))
+
+    negative = np.minimum(np.where(chamfered, 0, model.extension), 0).sum(1)
+    too_short = (lengths > tolerance) & (lengths + negative <= tolerance)
+    for i in np.flatnonzero(too_short).tolist():
+        issues.append((i, None, TOO_SHORT))
+
+    # A chamfer ignores the extension expression, and a miter doesn't fit an extended member.
+    # Ends in several bent joints (box corners) are fine as long as their treatments agree.
+    conflicting = (chamfered & expressions).reshape(-1)
+    mixed = bent & (
+        chamfered_ends[ends_a] != chamfered_ends[ends_b]
+    ) & treated_ends[ends_a] & treated_ends[ends_b]
+    conflicting[ends_a[mixed]] = True
+    conflicting[ends_b[mixed]] = True
+    for e in np.flatnonzero(conflicting).tolist():
+        issues.append((e // 2, e % 2, CONFLICTING_ENDS))
+
+    issues.sort(key=lambda issue: (issue[0], -1 if issue[1] is None else issue[1]))
+    return issues
+
+
+def LintMembers(
+    members: list[App.DocumentObject], joint_type: str | None = None
+) -> list[Issue]:
+    """Lint members with their current properties, issues refer to the index in members."""
+    model, lengths = MemberFrameModel(members)
+    expressions = np.zeros((len(members), 2), dtype=bool)
+    for i, obj in enumerate(members):
+        engine = dict(obj.ExpressionEngine)
+        for end, side in enumerate("LR"):
+            model.chamfer_angle[i, end] = getattr(obj, f"ChamferAngle{side}").Value
+            model.chamfer_direction[i, end] = getattr(obj, f"ChamferDirection{side}")
+            model.extension[i, end] = getattr(obj, f"ExtendedLength{side}").Value
+            expressions[i, end] = f"ExtendedLength{side}" in engine
+    return lint_frame(model, np.array(lengths, dtype=float), expressions, joint_type)
+
+
+def FormatLintReport(members: list[App.DocumentObject], issues: list[Issue]) -> str:
+    lines = []
+    for i, end, issue in issues:
+        where = members[i].Label if end is None else f"{members[i].Label} ({'LR'[end]})"
+        lines.append(f"{issue}: {where} {MESSAGES[issue]}")
+    return "\n".join(lines)
+
+
+def PrintLintReport(members: list[App.DocumentObject], issues: list[Issue]):
+    for issue in issues:
+        line = FormatLintReport(members, [issue]) + " \n"
+        if issue[2] in INFO:
+            App.Console.PrintMessage(line)
+        else:
+            App.Console.PrintWarning(line)
+
+
+class LintFrameCommand:
+    """Check the selected members (or the whole frame) for joint and length issues"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Lint frame",
+            "ToolTip": "Report free ends, unprocessed joints, too short members and conflicting end treatments",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        doc = App.ActiveDocument
+        members = GetProfileFrames(Gui.Selection.getSelectionEx(), doc)
+        issues = LintMembers(members)
+        if not issues:
+            App.Console.PrintMessage(f"No issue found in {len(members)} members \n")
+            return
+        PrintLintReport(members, issues)
+        AddSelections(
+            doc,
+            [members[i].Name for i, _, issue in issues if issue not in INFO],
+            clear=True,
+        )
+
+
+Gui.addCommand("EPF_LintFrame", LintFrameCommand())
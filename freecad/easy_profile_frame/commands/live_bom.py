@@ -0,0 +1,139 @@
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+from PySide.QtCore import QTimer
+from freecad.easy_profile_frame import ICONPATH
+from .bom import Bom, WriteBom
+from .memory_profile import MemoryStage
+from .utils import GetParams, GetProfileFrames, Transaction
+from .invalidation import invalidation
+
+translate = App.Qt.translate
+
+# Member properties shown in the BOM
+WATCHED_PROPERTIES = {
+    "Label",
+    "Length",
+    "ChamferAngleL",
+    "ChamferAngleR",
+    "Sketch",
+    "EdgeName",
+}
+
+
+def IsLiveBom(obj: App.DocumentObject) -> bool:
+    return obj.TypeId == "Spreadsheet::Sheet" and hasattr(obj, "LiveBomMembers")
+
+
+def GetLiveBom(doc: App.Document):
+    return next((obj for obj in doc.Objects if IsLiveBom(obj)), None)
+
+
+def CreateLiveBom(doc: App.Document, members: list[App.DocumentObject]):
+    """Bind the live BOM of the document to members. There is only one live BOM per document."""
+    sheet = GetLiveBom(doc)
+    if sheet is None:
+        sheet = doc.addObject("Spreadsheet::Sheet", "LiveBom")
+        sheet.Label = "Live BOM of frame"
+        sheet.addProperty(
+            "App::PropertyLinkListGlobal",
+            "LiveBomMembers",
+            "LiveBom",
+            "Members listed in this BOM",
+        )
+    sheet.LiveBomMembers = members
+    live_bom_updater.rewrite(sheet)
+    return sheet
+
+
+class LiveBomUpdater:
+    """
+    Rewrite only the rows of the members that changed, using the invalidation service.
+    Changes are collected and written after a short delay, so a recompute of many members
+    results in a single write.
+    """
+
+    def __init__(self):
+        # {(doc, sheet): {member}}, None when the whole sheet has to be written
+        self.dirty: dict[tuple[str, str], set[str] | None] = {}
+        self.shape: dict[tuple[str, str], tuple[int, int, int]] = {}
+        self.timer = None
+
+    def evict(self, key: tuple[str, str, str | None]):
+        """key: (doc, sheet, member), member is None when the member list changed."""
+        doc_name, sheet_name, member = key
+        sheet_key = (doc_name, sheet_name)
+        if member is None:
+            self.dirty[sheet_key] = None
+        else:
+            changed = self.dirty.setdefault(sheet_key, set())
+            if changed is not None:
+                changed.add(member)
+        self.schedule()
+
+    def schedule(self):
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.flush)
+        if not self.timer.isActive():
+            self.timer.start(GetParams().GetInt("LiveBomDelay", 500))
+
+    def flush(self):
+        dirty, self.dirty = self.dirty, {}
+        for (doc_name, sheet_name), members in dirty.items():
+            doc = App.listDocuments().get(doc_name)
+            sheet = doc.getObject(sheet_name) if doc is not None else None
+            if sheet is None or not IsLiveBom(sheet):
+                continue
+            self.rewrite(sheet, members)
+
+    def rewrite(self, sheet, changed: set[str] | None = None):
+        """Write the rows of the changed members, or the whole sheet if the layout changed."""
+        members = [obj for obj in sheet.LiveBomMembers if obj is not None]
+        key = (sheet.Document.Name, sheet.Name)
+        self.dirty.pop(key, None)
+        with MemoryStage("Live BOM", sheet.Document):
+            bom = Bom(members)
+            shape = (len(members), len(bom.profiles), len(bom.assemblies))
+            if changed is None or self.shape.get(key) != shape:
+                sheet.clearAll()
+                WriteBom(sheet, bom)
+            else:
+                rows = [i for i, obj in enumerate(members) if obj.Name in changed]
+                WriteBom(sheet, bom, rows)
+            self.shape[key] = shape
+            sheet.recompute()
+
+        # Bound members are removed from the list when they are deleted
+        invalidation.depend(sheet, "live_bom", key + (None,), {"LiveBomMembers"})
+        for obj in members:
+            invalidation.depend(
+                obj, "live_bom", key + (obj.Name,), WATCHED_PROPERTIES
+            )
+
+
+live_bom_updater = LiveBomUpdater()
+invalidation.register_cache("live_bom", live_bom_updater.evict)
+
+
+class LiveBomCommand:
+    """Create or rebind the live BOM of the document"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "Workbench_Spreadsheet.svg"),
+            "MenuText": "Live BOM",
+            "ToolTip": "Create a BOM that updates itself when members change",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        doc = App.ActiveDocument
+        with Transaction(doc, translate("Command", "Live BOM")):
+            CreateLiveBom(doc, GetProfileFrames(Gui.Selection.getSelectionEx(), doc))
+
+
+Gui.addCommand("EPF_LiveBom", LiveBomCommand())
@@ -0,0 +1,147 @@
+import FreeCAD as App
+import Part
+from .profile_cache import ProfileSection
+from .utils import GetParams, IsProfileFrame
+
+# Ordered from the most detailed to the least detailed.
+DETAIL_LEVELS = ["Full", "Contour", "BoundBox", "CenterLine"]
+DETAIL_MODES = DETAIL_LEVELS + ["Auto"]
+
+# Updated by CameraDetailWatcher, None when there is no 3D view.
+_camera_position: App.Vector | None = None
+
+
+def member_count(obj) -> int:
+    """Number of members in the same Part as obj."""
+    parent = obj.getParentGeoFeatureGroup()
+    if parent is None:
+        return 1
+    return len(parent.Group)
+
+
+def resolve_detail(obj) -> str:
+    """Resolve the "Auto" display detail by member count and camera distance."""
+    if obj.DisplayDetail != "Auto":
+        return obj.DisplayDetail
+    params = GetParams()
+    level = 0
+
+    count = member_count(obj)
+    if count >= params.GetInt("LodBoundBoxCount", 1000):
+        level = 2
+    elif count >= params.GetInt("LodContourCount", 200):
+        level = 1
+
+    if _camera_position is not None:
+        distance = (obj.getGlobalPlacement().Base - _camera_position).Length
+        if distance >= params.GetFloat("LodCenterLineDistance", 50000):
+            level = max(level, 3)
+        elif distance >= params.GetFloat("LodBoundBoxDistance", 20000):
+            level = max(level, 2)
+        elif distance >= params.GetFloat("LodContourDistance", 5000):
+            level = max(level, 1)
+    return DETAIL_LEVELS[level]
+
+
+def make_detail_shape(
+    section: ProfileSection, detail: str, z_start: float, z_end: float
+) -> Part.Shape:
+    """
+    Build a simplified member from the cached cross-section.
+    The member goes from z_start to z_end along the Z axis of the profile sketch.
+    """
+    bb = section.bound_box
+    if detail == "Contour":
+        shape = section.contour_face.extrude(App.Vector(0, 0, z_end - z_start))
+        shape.translate(App.Vector(0, 0, z_start))
+        return shape
+    if detail == "BoundBox":
+        return Part.makeBox(
+            bb.XLength, bb.YLength, z_start - z_end, App.Vector(bb.XMin, bb.YMin, z_end)
+        )
+    if detail == "CenterLine":
+        center = bb.Center
+        return Part.makeLine(
+            App.Vector(center.x, center.y, z_start),
+            App.Vector(center.x, center.y, z_end),
+        )
+    raise ValueError(f"Unknown display detail: {detail}")
+
+
+def update_auto_members(doc: App.Document):
+    for obj in doc.Objects:
+        if IsProfileFrame(obj) and obj.DisplayDetail == "Auto":
+            obj.Proxy.update_display(obj)
+
+
+class CameraDetailWatcher:
+    """
+    Track the camera of the active view and switch "Auto" members when it stops moving.
+    Once following, it is a GUI document observer and moves to the view of each activated
+    document.
+    """
+
+    def __init__(self):
+        self.view = None
+        self.callback = None
+        self.document: str | None = None
+
+    def follow(self):
+        # This module is also loaded without the GUI
+        import FreeCADGui as Gui
+
+        Gui.addDocumentObserver(self)
+        if Gui.ActiveDocument is not None:
+            self.slotActivateDocument(Gui.ActiveDocument)
+
+    def unfollow(self):
+        import FreeCADGui as Gui
+
+        Gui.removeDocumentObserver(self)
+        self.detach()
+
+    def slotActivateDocument(self, doc):
+        view = doc.ActiveView
+        if view is None or not hasattr(view, "addEventCallback"):
+            return  # Not a 3D view
+        self.attach(view)
+        self.document = doc.Document.Name
+
+    def slotDeletedDocument(self, doc):
+        if doc.Document.Name == self.document:
+            self.detach()
+
+    def attach(self, view):
+        self.detach()
+        self.view = view
+        self.callback = view.addEventCallback("SoEvent", self.on_event)
+
+    def detach(self):
+        global _camera_position
+        if self.view is not None and self.callback is not None:
+            try:
+                self.view.removeEventCallback("SoEvent", self.callback)
+            except Exception:
+                pass  # The view has been closed.
+        self.view = None
+        self.callback = None
+        self.document = None
+        _camera_position = None
+
+    def on_event(self, info):
+        # Only check when the user finished a zoom or a drag, not on every mouse move.
+        if info["Type"] == "SoMouseWheelEvent" or (
+            info["Type"] == "SoMouseButtonEvent" and info["State"] == "UP"
+        ):
+            self.update()
+
+    def update(self):
+        global _camera_position
+        position = App.Vector(*self.view.getCameraNode().position.getValue())
+        if _camera_position is not None and (
+            position - _camera_position
+        ).Length < GetParams().GetFloat("LodCameraTolerance", 100):
+            return
+        _camera_position = position
+        if App.ActiveDocument is not None:
+            update_auto_members(App.ActiveDocument)
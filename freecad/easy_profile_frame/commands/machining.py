@@ -0,0 +1,147 @@
+"""
+End machining of auto aligned butt joints: tap holes in the core of the butting member and
+access holes in the side of the through member, for the bolt and its key.
+
+Hole patterns are defined per profile model in the "HolePatterns" parameter group, e.g.
+"points=0,0 10,0;tap=5,15;access=8" (hole positions in the profile plane, tap diameter and depth,
+access hole diameter). The tools are built once per (profile, pattern) and moved in place, each
+member is drilled with a single cut.
+
+Holes of a member are stored in its Holes property, one per line:
+    "Tap L", "Tap R": tap holes in the left or right end face
+    "Access L 1 20": access hole near the left end, toward the side opposite to direction 1~4,
+                     20 mm from the end face
+"""
+
+import FreeCAD as App
+import Part
+from .profile_cache import ProfileSection
+from .utils import GetParams
+
+# Direction (1~4, see ProfileFrameObject.ChamferDirectionL) to angle around Z in degrees
+DIRECTION_ANGLES = {1: 0, 2: 270, 3: 180, 4: 90}
+
+
+class HolePattern:
+    __slots__ = ("key", "points", "tap_diameter", "tap_depth", "access_diameter")
+
+    def __init__(self, text: str):
+        self.key = text
+        self.points: list[tuple[float, float]] = [(0.0, 0.0)]
+        self.tap_diameter = 0.0
+        self.tap_depth = 0.0
+        self.access_diameter = 0.0
+        for entry in text.split(";"):
+            name, _, value = entry.partition("=")
+            name = name.strip()
+            if name == "points":
+                self.points = [
+                    tuple(float(c) for c in point.split(",")) for point in value.split()
+                ]
+            elif name == "tap":
+                diameter, _, depth = value.partition(",")
+                self.tap_diameter = float(diameter)
+                self.tap_depth = float(depth or 0)
+            elif name == "access":
+                self.access_diameter = float(value)
+
+
+def GetHolePattern(model: str | None) -> HolePattern | None:
+    text = GetParams().GetGroup("HolePatterns").GetString(model or "", "")
+    if not text.strip():
+        return None
+    try:
+        return HolePattern(text)
+    except ValueError:
+        App.Console.PrintWarning(f"Invalid hole pattern of {model}: {text} \n")
+        return None
+
+
+_tools: dict[tuple, Part.Shape] = {}
+
+
+def _tap_tool(section: ProfileSection, pattern: HolePattern) -> Part.Shape | None:
+    """Tap holes in the left end face (z = 0), going into the member (-Z)."""
+    if pattern.tap_diameter <= 0 or pattern.tap_depth <= 0:
+        return None
+    return Part.makeCompound(
+        [
+            Part.makeCylinder(
+                pattern.tap_diameter / 2,
+                pattern.tap_depth,
+                App.Vector(x, y, -pattern.tap_depth),
+                App.Vector(0, 0, 1),
+            )
+            for x, y in pattern.points
+        ]
+    )
+
+
+def _access_tool(section: ProfileSection, pattern: HolePattern) -> Part.Shape | None:
+    """Access hole at z = 0, from the axis of the profile through its -X side."""
+    if pattern.access_diameter <= 0:
+        return None
+    return Part.makeCylinder(
+        pattern.access_diameter / 2,
+        section.bound_box.DiagonalLength,
+        App.Vector(0, 0, 0),
+        App.Vector(-1, 0, 0),
+    )
+
+
+def get_tool(section: ProfileSection, pattern: HolePattern, kind: str) -> Part.Shape | None:
+    """Canonical tool of a hole kind, shared by every member, copy it before moving it."""
+    key = (section.key, pattern.key, kind)
+    if key not in _tools:
+        make = _tap_tool if kind == "Tap" else _access_tool
+        _tools[key] = make(section, pattern)
+    return _tools[key]
+
+
+_HOLE_SYNTAX = 'expected "Tap <L|R>" or "Access <L|R> <direction 1~4> <distance>"'
+
+
+def parse_hole(hole: str) -> tuple[str, str, int, float]:
+    """(kind, side, direction, distance) of a hole of the Holes property, raise ValueError."""
+    parts = hole.split()
+    if len(parts) < 2 or parts[1] not in ("L", "R"):
+        raise ValueError(_HOLE_SYNTAX)
+    kind, side, *args = parts
+    if kind == "Tap" and not args:
+        return kind, side, 0, 0.0
+    if kind == "Access" and len(args) == 2:
+        direction, distance = int(args[0]), float(args[1])
+        if direction in DIRECTION_ANGLES:
+            return kind, side, direction, distance
+    raise ValueError(_HOLE_SYNTAX)
+
+
+def hole_tool(
+    section: ProfileSection, pattern: HolePattern, hole: str, length: float
+) -> Part.Shape | None:
+    """
+    Tool of one hole of the Holes property, placed on a member of `length`.
+    Invalid entries are skipped with a warning.
+    """
+    try:
+        kind, side, direction, distance = parse_hole(hole)
+    except ValueError as e:
+        App.Console.PrintWarning(f'Hole "{hole}" is skipped: {e} \n')
+        return None
+    tool = get_tool(section, pattern, kind)
+    if tool is None:
+        return None
+    tool = tool.copy()
+    if kind == "Tap":
+        if side == "R":
+            # Moved to the right end face, at z = -length
+            tool.translate(App.Vector(0, 0, pattern.tap_depth - length))
+        return tool
+    # The tool is drilled away from the butting member, which lies toward the direction
+    tool.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1), DIRECTION_ANGLES[direction])
+    tool.translate(App.Vector(0, 0, -distance if side == "L" else distance - length))
+    return tool
+
+
+def clear_tools():
+    _tools.clear()
@@ -0,0 +1,157 @@
+"""
+Joints of ProfileFrameObject members: the frame model of members from their edges, profiles and
+angles, and the solved end treatments written back to them.
+"""
+
+import numpy as np
+import FreeCAD as App
+from freecad.easy_profile_frame.typing import Edge
+from .frame_model import AUTO_ALIGN_A, MITER_CUT, NO_PROCESSING, FrameModel
+from .profile_cache import get_section
+from .sweep_cache import attached_frame
+from .utils import GetObject, GetParams, IsProfileFrame, MemberFrameModel
+
+_SIDES = ("L", "R")
+
+
+def MemberAxes(
+    edge_sketch: App.DocumentObject, sub_name: str, angle: float
+) -> tuple[tuple, tuple]:
+    """Local X and Y axes of a member attached on edge_sketch.sub_name, rotated by angle (deg)."""
+    offset = App.Placement(App.Vector(), App.Rotation(App.Vector(0, 0, 1), angle))
+    rotation = attached_frame(edge_sketch, sub_name, offset).Rotation
+    return (
+        tuple(rotation.multVec(App.Vector(1, 0, 0))),
+        tuple(rotation.multVec(App.Vector(0, 1, 0))),
+    )
+
+
+def JointModel(
+    edges: list[tuple[App.DocumentObject, str]],
+    sizes: list[tuple[float, float]],
+    angles: list[float],
+) -> FrameModel:
+    """
+    Model of members on edges ((sketch, "EdgeN")), with the width and height of their profiles
+    and their angles. The members don't need to be recomputed, or even to exist.
+    """
+    shapes: list[Edge] = [sketch.getSubObject(sub_name) for sketch, sub_name in edges]
+    axes = [MemberAxes(*edge, angle) for edge, angle in zip(edges, angles)]
+    return FrameModel(
+        [tuple(e.Vertexes[0].Point) for e in shapes],
+        [tuple(e.Vertexes[-1].Point) for e in shapes],
+        sizes,
+        profile=np.arange(len(shapes)),
+        tangents=[tuple(e.tangentAt(e.FirstParameter)) for e in shapes],
+        x_axes=[x for x, _ in axes],
+        y_axes=[y for _, y in axes],
+    )
+
+
+def MembersJointModel(members: list[App.DocumentObject]) -> FrameModel:
+    """JointModel of existing members."""
+    edges, sizes = [], []
+    for obj in members:
+        sketch_name, sub_name = obj.EdgeName.split(":")
+        edges.append((GetObject(obj.Document, sketch_name), sub_name))
+        bound_box = get_section(obj.getObject(obj.Sketch)).bound_box
+        sizes.append((bound_box.XLength, bound_box.YLength))
+    return JointModel(edges, sizes, [obj.Angle.getValueAs("deg").Value for obj in members])
+
+
+def ButtJointHoles(model: FrameModel, count: int) -> list[list[str]]:
+    """Holes property of each member, for the butt joints of auto align."""
+    holes: list[list[str]] = [[] for _ in range(count)]
+    if model.butt_joints is None or not GetParams().GetBool("AutoAlignHoles", False):
+        return holes
+    for through, through_end, butt, butt_end, direction, distance in zip(
+        *(a.tolist() for a in model.butt_joints)
+    ):
+        holes[butt].append(f"Tap {_SIDES[butt_end]}")
+        if direction:
+            holes[through].append(f"Access {_SIDES[through_end]} {direction} {distance:g}")
+    return holes
+
+
+def _hole_side(hole: str) -> int | None:
+    words = hole.split()
+    return _SIDES.index(words[1]) if len(words) > 1 and words[1] in _SIDES else None
+
+
+def ApplyFrameModel(
+    model: FrameModel, members: list[App.DocumentObject], ends: np.ndarray | None = None
+):
+    """
+    Write the solved end treatments to the members, only the changed properties are set and
+    nothing is recomputed. ends: (n, 2) the ends to write, all of them by default, the holes of
+    the other ends are kept.
+    """
+    if ends is None:
+        ends = np.ones((len(members), 2), dtype=bool)
+    holes = ButtJointHoles(model, len(members))
+    for i, obj in enumerate(members):
+        kept = [h for h in obj.Holes if (side := _hole_side(h)) is not None and not ends[i, side]]
+        member_holes = kept + [h for h in holes[i] if ends[i, _hole_side(h)]]
+        if obj.Holes != member_holes:
+            obj.Holes = member_holes
+        for end, side in enumerate(_SIDES):
+            if not ends[i, end]:
+                continue
+            angle = float(model.chamfer_angle[i, end])
+            if getattr(obj, f"ChamferAngle{side}").Value != angle:
+                setattr(obj, f"ChamferAngle{side}", angle)
+            direction = int(model.chamfer_direction[i, end])
+            if direction and getattr(obj, f"ChamferDirection{side}") != direction:
+                setattr(obj, f"ChamferDirection{side}", direction)
+            extension = model.extension[i, end]
+            if not np.isnan(extension):
+                # Allow negative value
+                expression = str(float(extension))
+                prop = f"ExtendedLength{side}"
+                if (prop, expression) not in obj.ExpressionEngine:
+                    obj.setExpression(prop, expression)
+
+
+def _extension_expressions(obj: App.DocumentObject) -> dict[int, float]:
+    """Extensions bound by auto align, by end."""
+    values = {}
+    for prop, expression in obj.ExpressionEngine:
+        if prop in ("ExtendedLengthL", "ExtendedLengthR"):
+            try:
+                values[_SIDES.index(prop[-1])] = float(expression)
+            except ValueError:
+                continue
+    return values
+
+
+def ResolveJoints(
+    members: list[App.DocumentObject], doc: App.Document
+) -> list[App.DocumentObject]:
+    """
+    Solve again the joints at the ends of members, with the members of the document meeting them
+    there. The joint type is the one the members were drawn with, told from their treatments.
+    Return the members whose treatments may have changed, they are not recomputed.
+    """
+    frames = [obj for obj in doc.Objects if IsProfileFrame(obj) and obj.EdgeName]
+    index = {obj.Name: i for i, obj in enumerate(frames)}
+    edited = [index[obj.Name] for obj in members if obj.Name in index]
+    if not edited:
+        return []
+    around, ends = MemberFrameModel(frames)[0].neighbourhood(edited)
+    neighbours = [frames[i] for i in around]
+
+    expressions = [_extension_expressions(obj) for obj in neighbours]
+    if any(obj.ChamferAngleL > 0 or obj.ChamferAngleR > 0 for obj in neighbours):
+        joint_type = MITER_CUT
+    elif any(expressions):
+        joint_type = AUTO_ALIGN_A
+    else:
+        joint_type = NO_PROCESSING
+    shortened = np.zeros((len(neighbours), 2), dtype=bool)
+    for i, values in enumerate(expressions):
+        for end, value in values.items():
+            shortened[i, end] = value < 0
+
+    model = MembersJointModel(neighbours).solve(joint_type, shortened)
+    ApplyFrameModel(model, neighbours, ends)
+    return neighbours
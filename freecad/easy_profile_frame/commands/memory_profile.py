@@ -0,0 +1,147 @@
+"""
+Opt-in memory instrumentation, enabled by the "MemoryProfiling" parameter.
+
+Each instrumented stage (drawing members, writing a BOM) takes a tracemalloc snapshot, counts
+the document objects by type, the undo steps and the entries of the workbench caches before and
+after, then reports the growth. tracemalloc only sees Python allocations, the geometry kept by
+OpenCASCADE shows up in the object counts. Helper objects that no member references any more
+are flagged after each stage.
+"""
+
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+import FreeCAD as App
+from . import machining, profile_cache, sweep_cache
+from .invalidation import invalidation
+from .utils import GetParams, IsProfileFrame
+
+# Stage name: (runs, traced bytes grown in total)
+_totals: dict[str, tuple[int, int]] = {}
+_started_tracing = False
+
+
+def IsProfiling() -> bool:
+    return GetParams().GetBool("MemoryProfiling", False)
+
+
+def cache_sizes() -> dict[str, int]:
+    return {
+        "Invalidation entries": sum(len(e) for e in invalidation.dependents.values()),
+        "Profile sections": len(profile_cache._sections),
+        "Sweeps": len(sweep_cache._sweeps),
+        "Hole tools": len(machining._tools),
+    }
+
+
+def member_helpers(obj: App.DocumentObject) -> set[str]:
+    """Names of the objects of a member that it uses, or keeps for reuse (parked chamfers)."""
+    proxy = obj.Proxy
+    roots = [
+        obj.Sketch,
+        proxy.tip_name,
+        proxy.sketchR[1] if proxy.sketchR else None,
+        f"frame_pad_{obj.Name}",
+        f"frame_sweep_{obj.Name}",
+        f"frame_holes_{obj.Name}",
+    ]
+    for side in ("L", "R"):
+        name = f"Chamfer_{obj.Name}_{side}"
+        roots += [
+            f"frame_Chamfer_extend_{name}",
+            f"chamferCuttingSketch_{name}",
+            f"Chamfer_{name}",
+        ]
+    used: set[str] = set()
+    stack = [obj.getObject(name) for name in roots if name]
+    while stack:
+        helper = stack.pop()
+        if helper is None or helper.Name in used:
+            continue
+        used.add(helper.Name)
+        stack.extend(helper.OutList)
+    return used
+
+
+def FindOrphans(doc: App.Document) -> list[tuple[App.DocumentObject, str]]:
+    """Helper objects no member references any more, with the reason."""
+    orphans = []
+    wires = set()
+    for obj in doc.Objects:
+        if not IsProfileFrame(obj):
+            continue
+        if not obj.EdgeName:
+            orphans.append((obj, "parked member, removed when the task panel closes"))
+            continue
+        wires.add(obj.EdgeName.split(":")[0])
+        used = member_helpers(obj)
+        orphans += [
+            (helper, f"unused by {obj.Label}")
+            for helper in obj.Group
+            if helper.Name not in used
+        ]
+    # Edges written by the task panel and the frame spec import
+    for obj in doc.Objects:
+        if (
+            obj.TypeId == "Part::Feature"
+            and (obj.Name.endswith("_Wires") or obj.Name.startswith("FrameSpecWires"))
+            and obj.Name not in wires
+        ):
+            orphans.append((obj, "edges used by no member"))
+    return orphans
+
+
+def _snapshot(doc: App.Document) -> tuple:
+    traces = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    return traces, Counter(obj.TypeId for obj in doc.Objects), doc.UndoCount, cache_sizes()
+
+
+def _size(size: int) -> str:
+    return f"{size / 1024:+.1f} KiB" if abs(size) < 1024**2 else f"{size / 1024**2:+.2f} MiB"
+
+
+def _changes(before: dict, after: dict) -> str:
+    changes = [(key, after.get(key, 0) - before.get(key, 0)) for key in {**before, **after}]
+    return ", ".join(f"{key} {diff:+d}" for key, diff in sorted(changes) if diff) or "none"
+
+
+def PrintStageReport(name: str, before: tuple, after: tuple, orphans: list):
+    stats = after[0].compare_to(before[0], "lineno")
+    grown = sum(stat.size_diff for stat in stats)
+    runs, total = _totals.get(name, (0, 0))
+    _totals[name] = (runs + 1, total + grown)
+    App.Console.PrintMessage(
+        f"Memory [{name}]: {_size(grown)} traced "
+        f"({runs + 1} runs, {_size(total + grown)} in total), "
+        f"undo steps {after[2] - before[2]:+d} \n"
+        f"  objects: {_changes(before[1], after[1])} \n"
+        f"  caches: {_changes(before[3], after[3])} \n"
+    )
+    for stat in stats[: GetParams().GetInt("MemoryProfilingTop", 5)]:
+        if stat.size_diff > 0:
+            App.Console.PrintMessage(f"    {stat.traceback[0]}: {_size(stat.size_diff)} \n")
+    for obj, reason in orphans:
+        App.Console.PrintWarning(f"  orphaned {obj.Label} ({obj.Name}): {reason} \n")
+
+
+@contextmanager
+def MemoryStage(name: str, doc: App.Document):
+    """Report the memory growth of the block when profiling is enabled."""
+    global _started_tracing
+    if not IsProfiling():
+        if _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+        yield
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    before = _snapshot(doc)
+    yield
+    PrintStageReport(name, before, _snapshot(doc), FindOrphans(doc))
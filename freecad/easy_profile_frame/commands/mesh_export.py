@@ -0,0 +1,219 @@
+"""
+Export of a frame as an instanced glTF binary (.glb) for web viewers.
+
+Members are grouped by part fingerprint (see export_parts), each distinct part is tessellated
+once and every member is a node referencing its mesh with its own transform. The size of the
+file and the export time grow with the number of distinct parts, not with the number of members.
+"""
+
+import json
+import os
+import struct
+import numpy as np
+import FreeCAD as App
+import FreeCADGui as Gui
+import Part
+from PySide.QtWidgets import QFileDialog, QInputDialog
+from freecad.easy_profile_frame import ICONPATH
+from .export_parts import PartFingerprint
+from .modules import GetMemberInstances
+from .utils import GetParams, MemberShape
+
+translate = App.Qt.translate
+
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+_FLOAT = 5126
+_UNSIGNED_INT = 5125
+
+# FreeCAD is Z up in mm, glTF is Y up in meters
+_ROOT_ROTATION = [-(0.5**0.5), 0.0, 0.0, 0.5**0.5]
+_ROOT_SCALE = [0.001] * 3
+
+
+def tessellate(obj: App.DocumentObject, tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Vertices (k, 3) and triangles (t, 3) of a member, in its own coordinates."""
+    shape: Part.Shape = MemberShape(obj).copy()
+    shape.Placement = App.Placement()
+    points, triangles = shape.tessellate(tolerance)
+    return (
+        np.array([tuple(p) for p in points], dtype=np.float32).reshape(-1, 3),
+        np.array(triangles, dtype=np.uint32).reshape(-1, 3),
+    )
+
+
+class GltfBuilder:
+    """Meshes and nodes of a glTF 2.0 document, with a single binary buffer."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.buffer_views: list[dict] = []
+        self.accessors: list[dict] = []
+        self.meshes: list[dict] = []
+        self.nodes: list[dict] = [
+            {"name": "Frame", "rotation": _ROOT_ROTATION, "scale": _ROOT_SCALE, "children": []}
+        ]
+
+    def _accessor(self, data: np.ndarray, target: int, component_type: int, kind: str) -> int:
+        # Every component is 4 bytes long, the views stay aligned
+        self.buffer_views.append(
+            {
+                "buffer": 0,
+                "byteOffset": len(self.buffer),
+                "byteLength": data.nbytes,
+                "target": target,
+            }
+        )
+        self.buffer += data.tobytes()
+        accessor = {
+            "bufferView": len(self.buffer_views) - 1,
+            "componentType": component_type,
+            "count": len(data) if kind == "VEC3" else data.size,
+            "type": kind,
+        }
+        if kind == "VEC3":
+            accessor["min"] = data.min(axis=0).tolist()
+            accessor["max"] = data.max(axis=0).tolist()
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def add_mesh(self, name: str, vertices: np.ndarray, triangles: np.ndarray) -> int:
+        position = self._accessor(vertices, _ARRAY_BUFFER, _FLOAT, "VEC3")
+        indices = self._accessor(
+            triangles.ravel(), _ELEMENT_ARRAY_BUFFER, _UNSIGNED_INT, "SCALAR"
+        )
+        self.meshes.append(
+            {
+                "name": name,
+                "primitives": [
+                    {"attributes": {"POSITION": position}, "indices": indices, "material": 0}
+                ],
+            }
+        )
+        return len(self.meshes) - 1
+
+    def add_instance(self, name: str, mesh: int, placement: App.Placement):
+        self.nodes[0]["children"].append(len(self.nodes))
+        self.nodes.append(
+            {
+                "name": name,
+                "mesh": mesh,
+                "translation": list(placement.Base),
+                "rotation": list(placement.Rotation.Q),  # (x, y, z, w) in both
+            }
+        )
+
+    def write_glb(self, path: str):
+        document = {
+            "asset": {"version": "2.0", "generator": "EasyProfileFrame"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": self.nodes,
+            "meshes": self.meshes,
+            "materials": [
+                {
+                    "name": "Aluminium",
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": [0.8, 0.8, 0.82, 1.0],
+                        "metallicFactor": 0.6,
+                        "roughnessFactor": 0.4,
+                    },
+                }
+            ],
+            "accessors": self.accessors,
+            "bufferViews": self.buffer_views,
+            "buffers": [{"byteLength": len(self.buffer)}],
+        }
+        text = json.dumps(document, separators=(",", ":")).encode()
+        text += b" " * (-len(text) % 4)
+        binary = bytes(self.buffer) + b"\0" * (-len(self.buffer) % 4)
+        with open(path, "wb") as f:
+            f.write(struct.pack("<III", _GLB_MAGIC, 2, 12 + 8 + len(text) + 8 + len(binary)))
+            f.write(struct.pack("<II", len(text), _CHUNK_JSON))
+            f.write(text)
+            f.write(struct.pack("<II", len(binary), _CHUNK_BIN))
+            f.write(binary)
+
+
+def ExportMesh(
+    instances: list[tuple[App.DocumentObject, App.Placement]],
+    path: str,
+    tolerance: float | None = None,
+) -> tuple[int, int]:
+    """
+    Write the member instances (see GetMemberInstances) to a .glb file, tolerance is the
+    tessellation deviation in mm. Return the number of meshes and of instances.
+    Nothing is written without any mesh, glTF doesn't allow an empty buffer.
+    """
+    if tolerance is None:
+        tolerance = GetParams().GetFloat("MeshTolerance", 0.1)
+    builder = GltfBuilder()
+    meshes: dict[tuple, int | None] = {}
+    fingerprints: dict[str, tuple] = {}
+    for obj, placement in instances:
+        fingerprint = fingerprints.get(obj.FullName)
+        if fingerprint is None:
+            fingerprint = fingerprints[obj.FullName] = PartFingerprint(obj)
+        if fingerprint not in meshes:
+            vertices, triangles = tessellate(obj, tolerance)
+            if len(triangles):
+                name = f"{obj.Proxy.sketchLableL or 'part'}_{fingerprint[1]:g}"
+                meshes[fingerprint] = builder.add_mesh(name, vertices, triangles)
+            else:
+                App.Console.PrintWarning(f"{obj.Label} has no shape to export \n")
+                meshes[fingerprint] = None
+        mesh = meshes[fingerprint]
+        if mesh is not None:
+            builder.add_instance(obj.Label, mesh, placement)
+    if not builder.meshes:
+        App.Console.PrintWarning("No member to export \n")
+        return 0, 0
+    builder.write_glb(path)
+    return len(builder.meshes), len(builder.nodes) - 1
+
+
+class ExportMeshCommand:
+    """Export the frame as instanced meshes for web viewers"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Export mesh",
+            "ToolTip": "Export the frame as a glTF file, each distinct member is tessellated once",
+        }
+
+    def IsActive(self):
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        path, _ = QFileDialog.getSaveFileName(
+            Gui.getMainWindow(),
+            translate("Export", "Export mesh"),
+            "",
+            translate("Export", "glTF binary (*.glb)"),
+        )
+        if not path:
+            return
+        if not path.lower().endswith(".glb"):
+            path += ".glb"
+        tolerance, ok = QInputDialog.getDouble(
+            Gui.getMainWindow(),
+            translate("Export", "Export mesh"),
+            translate("Export", "Tessellation tolerance (mm):"),
+            GetParams().GetFloat("MeshTolerance", 0.1),
+            0.001,
+            10.0,
+            3,
+        )
+        if not ok:
+            return
+        instances = GetMemberInstances(Gui.Selection.getSelectionEx(), App.ActiveDocument)
+        meshes, nodes = ExportMesh(instances, path, tolerance)
+        if nodes:
+            App.Console.PrintMessage(f"{nodes} members exported as {meshes} meshes to {path} \n")
+
+
+Gui.addCommand("EPF_ExportMesh", ExportMeshCommand())
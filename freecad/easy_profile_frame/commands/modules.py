@@ -0,0 +1,194 @@
+"""
+Frame modules: an App::Part of members, created once and placed many times with App::Link.
+Instances share the geometry of the module, the BOM multiplies member counts instead.
+"""
+
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+from PySide.QtWidgets import QInputDialog
+from freecad.easy_profile_frame import ICONPATH
+from freecad.easy_profile_frame.typing import SelectionObject, AppPart
+from .utils import IsProfileFrame, Transaction
+
+translate = App.Qt.translate
+
+
+def IsFrameModuleTemplate(obj: App.DocumentObject) -> bool:
+    """Templates are only counted through their instances."""
+    return getattr(obj, "FrameModuleTemplate", False)
+
+
+def CreateFrameModule(part: AppPart, template: bool = True) -> AppPart:
+    if not hasattr(part, "FrameModuleTemplate"):
+        part.addProperty(
+            "App::PropertyBool",
+            "FrameModuleTemplate",
+            "EasyProfileFrame",
+            "Only count the members of this Part through its links in the BOM",
+        )
+    part.FrameModuleTemplate = template
+    return part
+
+
+def PlaceModule(
+    module: AppPart,
+    placements: list[App.Placement],
+    doc: App.Document | None = None,
+    name: str = "FrameModule",
+) -> App.DocumentObject:
+    """Place instances of a module with one App::Link (a link array for several placements)."""
+    if doc is None:
+        doc = module.Document
+    link = doc.addObject("App::Link", name)
+    link.LinkedObject = module
+    link.Label = f"{module.Label}_{name}"
+    if len(placements) == 1:
+        link.Placement = placements[0]
+    else:
+        link.ShowElement = False
+        link.ElementCount = len(placements)
+        link.PlacementList = placements
+    return link
+
+
+def _group(obj: App.DocumentObject) -> list[App.DocumentObject]:
+    """
+    Children of a Part or a group (App::DocumentObjectGroup, and any other group extension),
+    templates excepted.
+    """
+    if IsProfileFrame(obj) or not obj.hasExtension("App::GroupExtension"):
+        return []
+    return [sub for sub in obj.Group if not IsFrameModuleTemplate(sub)]
+
+
+def _walk(obj: App.DocumentObject, multiplier: int, counts: dict, stack: set):
+    if obj is None or obj.FullName in stack:
+        return
+    if IsProfileFrame(obj):
+        if obj.EdgeName:
+            member, count = counts.get(obj.FullName, (obj, 0))
+            counts[obj.FullName] = (member, count + multiplier)
+        return
+    stack.add(obj.FullName)
+    if obj.isDerivedFrom("App::Link"):
+        _walk(obj.LinkedObject, multiplier * max(obj.ElementCount, 1), counts, stack)
+    else:
+        for sub in _group(obj):
+            _walk(sub, multiplier, counts, stack)
+    stack.discard(obj.FullName)
+
+
+def GetMemberCounts(
+    selected_objects: list[SelectionObject], doc: App.Document
+) -> tuple[list[App.DocumentObject], list[int]]:
+    """
+    Like GetProfileFrames, but App::Links are followed and instance counts are returned with
+    the members, without expanding the instances themselves.
+    """
+    counts: dict[str, tuple[App.DocumentObject, int]] = {}
+    for sel in selected_objects:
+        _walk(sel.Object, 1, counts, set())
+    if not counts:
+        for obj in doc.RootObjects:
+            if not IsFrameModuleTemplate(obj):
+                _walk(obj, 1, counts, set())
+    objs = [member for member, _ in counts.values()]
+    return objs, [count for _, count in counts.values()]
+
+
+def _walk_instances(
+    obj: App.DocumentObject,
+    frame: App.Placement,
+    instances: list,
+    stack: set,
+    own_placement: bool = True,
+):
+    if obj is None or obj.FullName in stack:
+        return
+    # A link replaces the placement of the linked object, unless LinkTransform is set.
+    # Plain groups have no placement.
+    placement = getattr(obj, "Placement", None)
+    local = frame.multiply(placement) if own_placement and placement is not None else frame
+    if IsProfileFrame(obj):
+        if obj.EdgeName:
+            instances.append((obj, local))
+        return
+    stack.add(obj.FullName)
+    if obj.isDerivedFrom("App::Link"):
+        elements = obj.PlacementList if obj.ElementCount else [App.Placement()]
+        for element in elements:
+            _walk_instances(
+                obj.LinkedObject, local.multiply(element), instances, stack, obj.LinkTransform
+            )
+    else:
+        for sub in _group(obj):
+            _walk_instances(sub, local, instances, stack)
+    stack.discard(obj.FullName)
+
+
+def GetMemberInstances(
+    selected_objects: list[SelectionObject], doc: App.Document
+) -> list[tuple[App.DocumentObject, App.Placement]]:
+    """
+    Like GetMemberCounts, but every instance is returned with its global placement.
+    """
+    instances: list[tuple[App.DocumentObject, App.Placement]] = []
+    for sel in selected_objects:
+        # Placement of the container of the selected object
+        if hasattr(sel.Object, "Placement"):
+            frame = sel.Object.getGlobalPlacement().multiply(sel.Object.Placement.inverse())
+        else:
+            parent = sel.Object.getParentGeoFeatureGroup()
+            frame = parent.getGlobalPlacement() if parent is not None else App.Placement()
+        _walk_instances(sel.Object, frame, instances, set())
+    if not instances:
+        for obj in doc.RootObjects:
+            if not IsFrameModuleTemplate(obj):
+                _walk_instances(obj, App.Placement(), instances, set())
+    return instances
+
+
+class PlaceModuleCommand:
+    """Place a row of instances of the selected Part"""
+
+    def GetResources(self):
+        return {
+            "Pixmap": os.path.join(ICONPATH, "MakerWorkbench_Aluproft_Cmd.svg"),
+            "MenuText": "Place frame module",
+            "ToolTip": "Place linked instances of the selected Part, counted in the BOM without copying it",
+        }
+
+    def IsActive(self):
+        selection = Gui.Selection.getSelection()
+        return len(selection) == 1 and selection[0].TypeId == "App::Part"
+
+    def Activated(self):
+        module: AppPart = Gui.Selection.getSelection()[0]
+        count, ok = QInputDialog.getInt(
+            Gui.getMainWindow(),
+            translate("Modules", "Place frame module"),
+            translate("Modules", "Number of instances:"),
+            2,
+            1,
+            10000,
+        )
+        if not ok:
+            return
+        # Side by side along X, the placements can be edited afterwards
+        step = module.Shape.BoundBox.XLength if not module.Shape.isNull() else 0
+        placements = [
+            App.Placement(
+                module.Placement.Base + App.Vector(step * (i + 1), 0, 0),
+                module.Placement.Rotation,
+            )
+            for i in range(count)
+        ]
+        doc = module.Document
+        with Transaction(doc, translate("Command", "Place frame module")):
+            CreateFrameModule(module, template=False)
+            PlaceModule(module, placements, doc)
+            doc.recompute()
+
+
+Gui.addCommand("EPF_PlaceModule", PlaceModuleCommand())
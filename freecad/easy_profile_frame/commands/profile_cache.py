@@ -0,0 +1,74 @@
+import FreeCAD as App
+import Part
+from freecad.easy_profile_frame.typing import SketchObject
+from .invalidation import invalidation
+
+
+class ProfileSection:
+    """
+    Cross-section data of a profile sketch, shared by every member using the same profile.
+    All the shapes are in the local coordinates of the sketch.
+    """
+
+    __slots__ = ("key", "outer_wire", "contour_face", "bound_box", "area", "perimeter")
+
+    def __init__(self, key: tuple, shape: Part.Shape):
+        self.key = key
+        wires = [w for w in shape.Wires if w.isClosed()] or shape.Wires
+        # The outer contour is the wire with the largest extent.
+        self.outer_wire: Part.Wire = max(wires, key=lambda w: w.BoundBox.DiagonalLength)
+        self.contour_face = Part.Face(self.outer_wire)
+        self.bound_box: App.BoundBox = shape.BoundBox
+        # Section properties, in mm² and mm. Holes and slots are subtracted from the area.
+        try:
+            self.area: float = Part.makeFace(
+                [w for w in shape.Wires if w.isClosed()], "Part::FaceMakerBullseye"
+            ).Area
+        except Part.OCCError:
+            self.area = self.contour_face.Area
+        self.perimeter: float = shape.Length
+
+
+_sections: dict[tuple, ProfileSection] = {}
+
+
+def local_shape(sketch: SketchObject) -> Part.Shape:
+    """Return the shape of a sketch without its placement."""
+    shape = sketch.Shape.copy()
+    shape.Placement = App.Placement()
+    return shape
+
+
+def section_key(shape: Part.Shape) -> tuple:
+    """
+    Copies of the same library sketch have different names, so the key is computed from the geometry.
+    """
+    bb = shape.BoundBox
+    return (
+        len(shape.Edges),
+        round(shape.Length, 6),
+        round(bb.XMin, 6),
+        round(bb.XMax, 6),
+        round(bb.YMin, 6),
+        round(bb.YMax, 6),
+    )
+
+
+def get_section(sketch: SketchObject) -> ProfileSection:
+    shape = local_shape(sketch)
+    key = section_key(shape)
+    section = _sections.get(key)
+    if section is None:
+        section = ProfileSection(key, shape)
+        _sections[key] = section
+    # The key follows the geometry, the dependency only drops sections of edited sketches so
+    # they don't pile up. Shape would fire on every recompute.
+    invalidation.depend(sketch, "sections", key, {"Geometry"})
+    return section
+
+
+def clear_sections():
+    _sections.clear()
+
+
+invalidation.register_cache("sections", lambda key: _sections.pop(key, None))
@@ -0,0 +1,64 @@
+"""
+Sweeps of profiles along curved edges (arcs, splines).
+
+The path is expressed in the local coordinates of the member, so identical bends give the
+same key wherever they are, and the swept solid is computed once then shared by placement.
+"""
+
+from collections import OrderedDict
+import FreeCAD as App
+import Part
+from freecad.easy_profile_frame.typing import Edge
+from .profile_cache import section_key
+from .utils import GetParams
+
+_sweeps: "OrderedDict[tuple, Part.Shape]" = OrderedDict()
+
+
+def IsCurved(edge: Edge) -> bool:
+    return not isinstance(edge.Curve, (Part.Line, Part.LineSegment))
+
+
+def attached_frame(
+    support: App.DocumentObject, sub_name: str, offset: App.Placement
+) -> App.Placement:
+    """Placement of a member attached NormalToEdge on support.sub_name, with its offset."""
+    engine = Part.AttachEngine("Attacher::AttachEngine3D")
+    engine.Mode = "NormalToEdge"
+    engine.References = [(support, sub_name)]
+    engine.AttachmentOffset = offset
+    return engine.calculateAttachedPlacement(App.Placement())
+
+
+def curve_key(edge: Edge) -> tuple:
+    """Geometry of the path, points on it are enough to tell bends apart."""
+    points = edge.discretize(16)
+    return (
+        type(edge.Curve).__name__,
+        round(edge.Length, 6),
+        tuple((round(p.x, 6), round(p.y, 6), round(p.z, 6)) for p in points),
+    )
+
+
+def get_sweep(profile: Part.Shape, path: Edge) -> Part.Shape:
+    """
+    Solid of profile (in the XY plane of the member) swept along path (in member coordinates).
+    The returned shape is shared, copy it before changing it.
+    """
+    key = (section_key(profile), curve_key(path))
+    solid = _sweeps.get(key)
+    if solid is not None:
+        _sweeps.move_to_end(key)
+        return solid
+    face = Part.makeFace(
+        [w for w in profile.Wires if w.isClosed()], "Part::FaceMakerBullseye"
+    )
+    solid = Part.Wire(path).makePipe(face)
+    _sweeps[key] = solid
+    while len(_sweeps) > GetParams().GetInt("SweepCacheSize", 256):
+        _sweeps.popitem(last=False)
+    return solid
+
+
+def clear_sweeps():
+    _sweeps.clear()
@@ -8,19 +8,111 @@ from freecad.easy_profile_frame.typing import (
 import Part
 import FreeCAD as App
 from typing import Any
+from contextlib import contextmanager
 import math
+from .wire_preprocess import preprocess_segments
+from .invalidation import invalidation
+from .frame_model import FrameModel
+
+PARAM_PATH = "User parameter:BaseApp/Preferences/Mod/EasyProfileFrame"
+
+
+def GetParams():
+    """Return the parameter group of this workbench."""
+    return App.ParamGet(PARAM_PATH)
+
+
+@contextmanager
+def Transaction(doc: App.Document, name: str, undo: bool = True):
+    """
+    Group every change made in the block into one undo step.
+    If `undo` is False, no transaction is opened (e.g. for real time preview). UndoMode is left
+    alone: switching it off would clear the whole undo history of the document.
+    """
+    if not undo:
+        yield
+        return
+    doc.openTransaction(name)
+    try:
+        yield
+    except Exception:
+        doc.abortTransaction()
+        raise
+    doc.commitTransaction()
+
+
+def IsProfileFrame(obj: App.DocumentObject) -> bool:
+    return (
+        hasattr(obj, "Proxy")
+        and hasattr(obj.Proxy, "Type")
+        and obj.Proxy.Type == "ProfileFrameObject"
+    )
+
+
+def MemberShape(obj: App.DocumentObject) -> Part.Shape:
+    """Full detail shape of a member in its own coordinates, whatever its display detail is."""
+    tip = obj.getObject(obj.Proxy.tip_name) if obj.Proxy.tip_name else None
+    return (tip if tip is not None else obj).Shape
+
+
+def MemberFrameModel(
+    members: list[App.DocumentObject], tolerance: float = 1e-7
+) -> tuple[FrameModel, list[float]]:
+    """Frame model of existing members from their edges, with the edge lengths."""
+    starts, ends, tangents, lengths = [], [], [], []
+    for obj in members:
+        sketch_name, sub_name = obj.EdgeName.split(":")
+        edge: Edge = GetObject(obj.Document, sketch_name).getSubObject(sub_name)
+        starts.append(tuple(edge.Vertexes[0].Point))
+        ends.append(tuple(edge.Vertexes[-1].Point))
+        tangents.append(tuple(edge.tangentAt(edge.FirstParameter)))
+        lengths.append(edge.Length)
+    model = FrameModel(starts, ends, [(0, 0)], tangents=tangents, tolerance=tolerance)
+    return model, lengths
+
+
+def GetProfileFrames(
+    selected_objects: list[SelectionObject], doc: App.Document, fallback: bool = True
+) -> list[App.DocumentObject]:
+    """
+    Return the selected members and the members of the selected Parts.
+    If nothing relevant is selected, return all the members of the document (unless fallback is
+    False).
+    """
+    objs = []
+    for obj in selected_objects:
+        if IsProfileFrame(obj.Object):
+            objs.append(obj.Object)
+        if obj.Object.TypeId == "App::Part":
+            for subobj in obj.Object.Group:
+                if IsProfileFrame(subobj):
+                    objs.append(subobj)
+    if not objs and fallback:
+        for obj in doc.Objects:
+            if IsProfileFrame(obj):
+                objs.append(obj)
+    # Members without an edge are parked by the task panel for reuse.
+    return [obj for obj in objs if obj.EdgeName]
+
+
+def IsWireElement(obj: App.DocumentObject, sub_name: str) -> bool:
+    """
+    Check a selected element by its name only, without materializing the sub shape.
+    """
+    if (
+        obj.TypeId == "Sketcher::SketchObject"
+        or obj.TypeId == "Part::Part2DObjectPython"
+    ):
+        return True
+    # Only the last part of a sub-object path is the element name
+    element = sub_name.split(".")[-1]
+    return element == "" or element.startswith("Edge")
 
 
 def IsAllWires(objects: list[SelectionObject]) -> bool:
     for obj in objects:
-        if (
-            obj.Object.TypeId == "Sketcher::SketchObject"
-            or obj.Object.TypeId == "Part::Part2DObjectPython"
-        ):
-            continue
-        sub_objs: tuple[Part.Shape] = obj.SubObjects
-        for subobj in sub_objs:
-            if not isinstance(subobj, Part.Edge):
+        for sub_name in obj.SubElementNames:
+            if not IsWireElement(obj.Object, sub_name):
                 return False
     return True
 
@@ -28,7 +120,7 @@ def IsAllWires(objects: list[SelectionObject]) -> bool:
 def GetAllWireNames(objects: list[SelectionObject]) -> list[str]:
     """
     This might return an object like 'Sketch' or 'Line' or a subobject like 'Sketch:Edge1'.
-    You might need to get subobject by `FreeCAD.ActiveDocument.getObject("Sketch").getSubObject("Edge1")`.
+    You might need to get subobject by `GetObject(doc, "Sketch").getSubObject("Edge1")`.
     """
     wires: list[str] = []
     for obj in objects:
@@ -46,23 +138,101 @@ def GetAllWireNames(objects: list[SelectionObject]) -> list[str]:
     return wires
 
 
-def GetSubEdges(names: list[str]) -> list[str]:
+_objects: dict[tuple[str, str], App.DocumentObject] = {}
+
+
+def GetObject(doc: App.Document, name: str) -> App.DocumentObject | None:
     """
-    Return {name: Part.Edge}.
+    `doc.getObject(name)` with a per-document cache.
+    Always resolve through the owning document, never through the active one.
+    """
+    key = (doc.Name, name)
+    obj = _objects.get(key)
+    if obj is None:
+        obj = doc.getObject(name)
+        if obj is None:
+            return None
+        _objects[key] = obj
+        # No property: only evicted when the object is deleted
+        invalidation.depend(obj, "objects", key, set())
+    return obj
+
+
+invalidation.register_cache("objects", lambda key: _objects.pop(key, None))
+
+
+def GetSubEdges(names: list[str], doc: App.Document) -> list[str]:
+    """
+    Expand whole objects into their edges, and drop sub-elements that aren't edges.
     """
     objs = []
     for n in names:
         if ":" in n:
             parent, subobj = n.split(":")
-            obj = App.ActiveDocument.getObject(parent).getSubObject(subobj)
+            obj = GetObject(doc, parent).getSubObject(subobj)
             if isinstance(obj, Part.Edge):
                 objs.append(n)
         else:
-            for i, edge in enumerate(App.ActiveDocument.getObject(n).Shape.Edges):
+            for i, edge in enumerate(GetObject(doc, n).Shape.Edges):
                 objs.append(f"{n}:Edge{i+1}")
     return objs
 
 
+def PreprocessEdges(
+    names: list[str], doc: App.Document, wires_name: str, tolerance: float = 1e-6
+) -> dict[str, str]:
+    """
+    Merge overlapping collinear edges and split edges at interior intersections.
+    Edges that are left as they are keep their names, new edges are stored in a hidden
+    compound named `wires_name`, and referenced as "wires_name:EdgeN".
+    Only straight edges are processed.
+    Return {origin: edge name}. The origin of a kept edge is its name, the origin of a new edge
+    is made of the names of the edges it comes from and its rank among their pieces
+    ("Sketch:Edge1+Sketch:Edge2#1"), see EdgeOrigins. Origins don't change when other edges are
+    added or removed, unlike the indices of the new edges.
+    """
+    segments = []
+    line_names = []
+    result = {}
+    for n in names:
+        parent, subobj = n.split(":")
+        edge = GetObject(doc, parent).getSubObject(subobj)
+        if isinstance(edge.Curve, Part.Line):
+            segments.append(
+                (tuple(edge.Vertexes[0].Point), tuple(edge.Vertexes[-1].Point))
+            )
+            line_names.append(n)
+        else:
+            result[n] = n
+
+    # Pieces of each group of source edges, in order
+    pieces: dict[str, list] = {}
+    for segment, origin, sources in preprocess_segments(segments, tolerance):
+        if origin is not None:
+            result[line_names[origin]] = line_names[origin]
+        else:
+            key = "+".join(sorted(line_names[i] for i in sources))
+            pieces.setdefault(key, []).append(segment)
+
+    wires = doc.getObject(wires_name)
+    if pieces or wires is not None:
+        wires = GetExistent(wires_name, "Part::Feature", doc)
+        # Sorted by origin, so redrawing the same wires gives the same edges
+        new_edges = []
+        for key in sorted(pieces):
+            for rank, (a, b) in enumerate(pieces[key], 1):
+                new_edges.append(Part.LineSegment(App.Vector(*a), App.Vector(*b)).toShape())
+                result[f"{key}#{rank}"] = f"{wires.Name}:Edge{len(new_edges)}"
+        wires.Shape = Part.Compound(new_edges)
+        wires.Visibility = False
+    return result
+
+
+def EdgeOrigins(origin: str) -> list[str]:
+    """Names of the edges an origin of PreprocessEdges comes from."""
+    return origin.rpartition("#")[0].split("+") if "#" in origin else [origin]
+
+
 def GetExistent(name: str, obj_type: str, doc: App.Document | Body | AppPart) -> Any:
     """Get an object from a document if it exists, otherwise create a new one."""
     obj = doc.getObject(name)
@@ -85,6 +255,27 @@ def CopyObj(source: App.DocumentObject | Feature, target: Body | AppPart) -> Any
     return obj
 
 
+def CopyGeometry(source: App.DocumentObject, target: App.DocumentObject):
+    """
+    Replace the geometry and constraints of the sketch target by the ones of source, keeping the
+    target object (and the features linked to it). Constraints on external geometry are dropped,
+    the copies have no external references.
+    """
+    target.deleteAllGeometry()
+    for i, geometry in enumerate(source.Geometry):
+        target.addGeometry(geometry, source.getConstruction(i))
+    target.addConstraint(
+        [
+            c
+            for c in source.Constraints
+            # GeoUndef is -2000, -1 and -2 are the sketch axes
+            if not any(-2000 < g <= -3 for g in (c.First, c.Second, c.Third))
+        ]
+    )
+    if target.MapMode == "Deactivated":
+        target.Placement = source.Placement
+
+
 def calculate_edges_angle(edge1: Edge, edge2: Edge):
     """
     Calculate the angle between two Part.Edge objects.
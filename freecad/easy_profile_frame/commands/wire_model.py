@@ -0,0 +1,91 @@
+from PySide.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class WireListModel(QAbstractListModel):
+    """
+    Ordered set of wires shown in the task panel.
+    A wire is (object name, edge name), the edge name is "" when a whole object is selected.
+    A whole object supersedes its own edges.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, str]] = []
+        self._index: set[tuple[str, str]] = set()
+
+    @staticmethod
+    def parse(name: str) -> tuple[str, str]:
+        obj, _, edge = name.partition(":")
+        return (obj, edge)
+
+    @staticmethod
+    def format(wire: tuple[str, str]) -> str:
+        return f"{wire[0]}:{wire[1]}" if wire[1] else wire[0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.format(self._rows[index.row()])
+        return None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, wire: tuple[str, str]):
+        return wire in self._index
+
+    def wires(self) -> list[tuple[str, str]]:
+        return list(self._rows)
+
+    def names(self) -> list[str]:
+        """Names in the "Sketch:EdgeN" form used by GetSubEdges."""
+        return [self.format(w) for w in self._rows]
+
+    def add_names(self, names: list[str]):
+        new: list[tuple[str, str]] = []
+        whole_objects: set[str] = set()
+        for name in names:
+            wire = self.parse(name)
+            if wire in self._index:
+                continue
+            if wire[1] and (wire[0], "") in self._index:
+                continue  # The whole object is already listed
+            self._index.add(wire)
+            new.append(wire)
+            if not wire[1]:
+                whole_objects.add(wire[0])
+        if not new:
+            return
+
+        if whole_objects:
+            # Edges of the new whole objects have to go, rebuild the list once.
+            self.beginResetModel()
+            self._rows = [
+                w
+                for w in self._rows + new
+                if not (w[1] and w[0] in whole_objects)
+            ]
+            self._index = set(self._rows)
+            self.endResetModel()
+        else:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self._rows.extend(new)
+            self.endInsertRows()
+
+    def remove_rows(self, rows: list[int]):
+        if not rows:
+            return
+        removed = set(rows)
+        self.beginResetModel()
+        self._rows = [w for i, w in enumerate(self._rows) if i not in removed]
+        self._index = set(self._rows)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._index = set()
+        self.endResetModel()
@@ -0,0 +1,211 @@
+"""
+Geometric clean up of the input wires, before members are created from them:
+overlapping collinear segments are merged, and segments are split where another one
+meets or crosses their interior (T-junctions and crossings).
+
+This module works on plain coordinate tuples and doesn't depend on FreeCAD.
+"""
+
+import math
+
+Point = tuple[float, float, float]
+Segment = tuple[Point, Point]
+
+
+def _sub(a: Point, b: Point) -> Point:
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _dot(a: Point, b: Point) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _length(a: Point) -> float:
+    return math.sqrt(_dot(a, a))
+
+
+def _lerp(a: Point, d: Point, t: float) -> Point:
+    return (a[0] + d[0] * t, a[1] + d[1] * t, a[2] + d[2] * t)
+
+
+def _line_key(seg: Segment, tol: float):
+    """Key shared by all the segments lying on the same infinite line, and the unit direction."""
+    a, b = seg
+    d = _sub(b, a)
+    length = _length(d)
+    d = (d[0] / length, d[1] / length, d[2] / length)
+    # Same orientation for both directions of the line
+    for c in d:
+        if abs(c) > 1e-9:
+            if c < 0:
+                d = (-d[0], -d[1], -d[2])
+            break
+    t = _dot(a, d)
+    foot = (a[0] - d[0] * t, a[1] - d[1] * t, a[2] - d[2] * t)
+    key = (
+        tuple(round(c, 6) for c in d),
+        tuple(round(c / tol) for c in foot),
+    )
+    return key, d
+
+
+def merge_collinear(
+    segments: list[Segment], tol: float
+) -> list[tuple[Segment, int | None, tuple[int, ...]]]:
+    """
+    Merge overlapping collinear segments. Segments touching at their ends are kept apart.
+    Return (segment, index of the source segment or None if it is a new segment, indices of
+    the segments it was merged from).
+    """
+    groups: dict[tuple, list[tuple[float, float, int]]] = {}
+    directions: dict[tuple, Point] = {}
+    for i, seg in enumerate(segments):
+        if _length(_sub(seg[1], seg[0])) <= tol:
+            continue  # Zero-length
+        key, d = _line_key(seg, tol)
+        directions.setdefault(key, d)
+        d = directions[key]
+        t0, t1 = _dot(seg[0], d), _dot(seg[1], d)
+        groups.setdefault(key, []).append((min(t0, t1), max(t0, t1), i))
+
+    result: list[tuple[Segment, int | None, tuple[int, ...]]] = []
+    for key, intervals in groups.items():
+        intervals.sort()
+        merged: list[list] = []  # [start, end, source indices]
+        for start, end, i in intervals:
+            if merged and start < merged[-1][1] - tol:
+                merged[-1][1] = max(merged[-1][1], end)
+                merged[-1][2].append(i)
+            else:
+                merged.append([start, end, [i]])
+        bounds = {i: (start, end) for start, end, i in intervals}
+        d = directions[key]
+        for start, end, sources in merged:
+            # Keep the source segment if it already covers the merged one
+            origin = next(
+                (
+                    i
+                    for i in sources
+                    if abs(bounds[i][0] - start) <= tol and abs(bounds[i][1] - end) <= tol
+                ),
+                None,
+            )
+            if origin is not None:
+                result.append((segments[origin], origin, (origin,)))
+            else:
+                base = segments[sources[0]]
+                foot = _lerp(base[0], d, -_dot(base[0], d))
+                result.append(
+                    ((_lerp(foot, d, start), _lerp(foot, d, end)), None, tuple(sorted(sources)))
+                )
+    return result
+
+
+def _closest_params(s1: Segment, s2: Segment):
+    """Parameters (0~1) of the closest points of two segments, None if they are parallel."""
+    u = _sub(s1[1], s1[0])
+    v = _sub(s2[1], s2[0])
+    w = _sub(s1[0], s2[0])
+    a, b, c = _dot(u, u), _dot(u, v), _dot(v, v)
+    d, e = _dot(u, w), _dot(v, w)
+    denom = a * c - b * b
+    if denom <= 1e-12 * a * c:
+        return None
+    s = min(max((b * e - c * d) / denom, 0.0), 1.0)
+    t = (b * s + e) / c
+    if t < 0.0:
+        t = 0.0
+        s = min(max(-d / a, 0.0), 1.0)
+    elif t > 1.0:
+        t = 1.0
+        s = min(max((b - d) / a, 0.0), 1.0)
+    return s, t
+
+
+def _cells(seg: Segment, cell: float):
+    lo = [math.floor(min(seg[0][k], seg[1][k]) / cell) for k in range(3)]
+    hi = [math.floor(max(seg[0][k], seg[1][k]) / cell) for k in range(3)]
+    for x in range(lo[0], hi[0] + 1):
+        for y in range(lo[1], hi[1] + 1):
+            for z in range(lo[2], hi[2] + 1):
+                yield (x, y, z)
+
+
+def split_at_intersections(segments: list[Segment], tol: float) -> list[list[Segment]]:
+    """
+    Split segments where another segment touches or crosses their interior.
+    Return the pieces of each segment, in order. Candidate pairs come from a spatial hash.
+    """
+    if not segments:
+        return []
+    cell = max(sum(_length(_sub(b, a)) for a, b in segments) / len(segments), tol)
+    grid: dict[tuple[int, int, int], list[int]] = {}
+    for i, seg in enumerate(segments):
+        for key in _cells(seg, cell):
+            grid.setdefault(key, []).append(i)
+
+    splits: list[list[tuple[float, Point]]] = [[] for _ in segments]
+    checked: set[tuple[int, int]] = set()
+    for members in grid.values():
+        for n, i in enumerate(members):
+            for j in members[n + 1 :]:
+                pair = (i, j) if i < j else (j, i)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                s1, s2 = segments[i], segments[j]
+                params = _closest_params(s1, s2)
+                if params is None:
+                    continue
+                s, t = params
+                p = _lerp(s1[0], _sub(s1[1], s1[0]), s)
+                q = _lerp(s2[0], _sub(s2[1], s2[0]), t)
+                if _length(_sub(p, q)) > tol:
+                    continue
+                len1 = _length(_sub(s1[1], s1[0]))
+                len2 = _length(_sub(s2[1], s2[0]))
+                inner1 = tol < s * len1 < len1 - tol
+                inner2 = tol < t * len2 < len2 - tol
+                # Snap to the exact end point of the other segment, so joints can be matched.
+                if inner1 and not inner2:
+                    splits[i].append((s, s2[0] if t * len2 <= tol else s2[1]))
+                elif inner2 and not inner1:
+                    splits[j].append((t, s1[0] if s * len1 <= tol else s1[1]))
+                elif inner1 and inner2:
+                    splits[i].append((s, p))
+                    splits[j].append((t, p))
+
+    result: list[list[Segment]] = []
+    for seg, points in zip(segments, splits):
+        if not points:
+            result.append([seg])
+            continue
+        points.sort()
+        chain = [seg[0]] + [p for _, p in points] + [seg[1]]
+        result.append(
+            [
+                (chain[k], chain[k + 1])
+                for k in range(len(chain) - 1)
+                if _length(_sub(chain[k + 1], chain[k])) > tol
+            ]
+        )
+    return result
+
+
+def preprocess_segments(
+    segments: list[Segment], tol: float = 1e-6
+) -> list[tuple[Segment, int | None, tuple[int, ...]]]:
+    """
+    Merge then split the segments.
+    Return (segment, index of the source segment or None if it is a new segment, indices of
+    the segments it comes from). The pieces of a split segment follow each other, in order.
+    """
+    merged = merge_collinear(segments, tol)
+    pieces = split_at_intersections([seg for seg, _, _ in merged], tol)
+    result = []
+    for (_, origin, sources), parts in zip(merged, pieces):
+        if len(parts) == 1 and origin is not None:
+            result.append((parts[0], origin, sources))
+        else:
+            result.extend((part, None, sources) for part in parts)
+    return result
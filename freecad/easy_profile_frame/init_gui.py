@@ -19,7 +19,20 @@ class EasyProfileFrame(Gui.Workbench):
     MenuText = translate("Workbench", "Easy profile frame")
     ToolTip = translate("Workbench", "a simple Easy profile frame")
     # Icon = os.path.join(ICONPATH, "cool.svg")
-    toolbox = ["EPF_CreateProfilesBySketcher", "EPF_GenerateBom"]
+    toolbox = [
+        "EPF_CreateProfilesBySketcher",
+        "EPF_BulkEdit",
+        "EPF_SwapProfile",
+        "EPF_PlaceModule",
+        "EPF_GenerateBom",
+        "EPF_LiveBom",
+        "EPF_ExportParts",
+        "EPF_ExportMesh",
+        "EPF_ExportFrameSpec",
+        "EPF_ImportFrameSpec",
+        "EPF_CheckInterference",
+        "EPF_LintFrame",
+    ]
 
     def GetClassName(self):
         return "Gui::PythonWorkbench"
@@ -31,7 +44,15 @@ class EasyProfileFrame(Gui.Workbench):
         """
         # Register commands
         import freecad.easy_profile_frame.commands.create_profiles
-        import freecad.easy_profile_frame.commands.generate_bom  # noqa: F401
+        import freecad.easy_profile_frame.commands.bulk_edit
+        import freecad.easy_profile_frame.commands.generate_bom
+        import freecad.easy_profile_frame.commands.modules
+        import freecad.easy_profile_frame.commands.live_bom
+        import freecad.easy_profile_frame.commands.export_parts
+        import freecad.easy_profile_frame.commands.mesh_export
+        import freecad.easy_profile_frame.commands.frame_spec
+        import freecad.easy_profile_frame.commands.interference
+        import freecad.easy_profile_frame.commands.lint  # noqa: F401
 
         App.Console.PrintMessage(
             translate("Log", "Switching to easy_profile_frame") + "\n"
@@ -41,6 +62,10 @@ class EasyProfileFrame(Gui.Workbench):
         self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Tools"), self.toolbox)
         self.appendMenu(QT_TRANSLATE_NOOP("Workbench", "Tools"), self.toolbox)
 
+        from freecad.easy_profile_frame.commands.lod import CameraDetailWatcher
+
+        self.detail_watcher = CameraDetailWatcher()
+
     def Activated(self):
         """
         code which should be computed when a user switch to this workbench
@@ -48,6 +73,7 @@ class EasyProfileFrame(Gui.Workbench):
         App.Console.PrintMessage(
             translate("Log", "Workbench easy_profile_frame activated.") + "\n"
         )
+        self.detail_watcher.follow()
 
     def Deactivated(self):
         """
@@ -56,6 +82,7 @@ class EasyProfileFrame(Gui.Workbench):
         App.Console.PrintMessage(
             translate("Log", "Workbench easy_profile_frame de-activated.") + "\n"
         )
+        self.detail_watcher.unfollow()
 
 
 Gui.addWorkbench(EasyProfileFrame())
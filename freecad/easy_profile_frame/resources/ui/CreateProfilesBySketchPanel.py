@@ -41,6 +41,7 @@ from PySide.QtGui import (
     QTransform,
 )
 from PySide.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -49,8 +50,7 @@ from PySide.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QRadioButton,
     QSizePolicy,
@@ -76,8 +76,10 @@ class Ui_Form(object):
 
         self.verticalLayout_2.addWidget(self.label_5)
 
-        self.wire_list = QListWidget(self.frame_wire_selector)
+        self.wire_list = QListView(self.frame_wire_selector)
         self.wire_list.setObjectName("wire_list")
+        self.wire_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.wire_list.setUniformItemSizes(True)
 
         self.verticalLayout_2.addWidget(self.wire_list)
 
@@ -0,0 +1,49 @@
+import numpy as np
+from freecad.easy_profile_frame.commands.frame_model import (
+    AUTO_ALIGN_A,
+    AUTO_ALIGN_B,
+    FrameModel,
+    rescale_extension,
+    rescale_hole,
+    rotate_chamfer_direction,
+)
+
+
+def test_rotate_chamfer_direction():
+    assert rotate_chamfer_direction(1, 90) == 2
+    assert rotate_chamfer_direction(4, 90) == 1
+    assert rotate_chamfer_direction(3, -180) == 1
+
+
+def test_rescale_extension():
+    old, new = (30, 20), (40, 45)
+    assert rescale_extension(15, old, new) == 20
+    assert rescale_extension(-10, old, new) == -22.5
+    # Not half a side of the profile: left as is
+    assert rescale_extension(7, old, new) is None
+
+
+def test_rescale_hole():
+    old, new = (30, 30), (40, 40)
+    assert rescale_hole("Access L 1 15", old, new) == "Access L 1 20"
+    assert rescale_hole("Tap R", old, new) == "Tap R"
+    assert rescale_hole("Access R 2 7", old, new) == "Access R 2 7"
+
+
+# An L of two members and a third one continuing the second
+CHAIN = ([(0, 0, 0), (100, 0, 0), (100, 100, 0)], [(100, 0, 0), (100, 100, 0), (100, 200, 0)])
+
+
+def test_neighbourhood():
+    model = FrameModel(*CHAIN, [(20, 20)])
+    around, ends = model.neighbourhood([0])
+    assert around.tolist() == [0, 1]
+    assert ends.tolist() == [[True, True], [True, False]]
+
+
+def test_auto_align_keeps_the_shortened_members():
+    shortened = FrameModel(*CHAIN, [(20, 20)]).solve(AUTO_ALIGN_B).extension < 0
+    model = FrameModel(*CHAIN, [(20, 20)]).solve(AUTO_ALIGN_A, shortened)
+    assert np.array_equal(model.extension < 0, shortened)
+    through, _, butt, *_ = model.butt_joints
+    assert (through.tolist(), butt.tolist()) == ([0], [1])
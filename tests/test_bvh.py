@@ -0,0 +1,27 @@
+import numpy as np
+from freecad.easy_profile_frame.commands.bvh import AabbTree
+
+
+def brute_force(lower, upper) -> set:
+    n = len(lower)
+    return {
+        (i, j)
+        for i in range(n)
+        for j in range(i + 1, n)
+        if np.all(lower[i] <= upper[j]) and np.all(lower[j] <= upper[i])
+    }
+
+
+def test_self_pairs_match_brute_force():
+    rng = np.random.default_rng(0)
+    for n, leaf_size in ((0, 4), (1, 4), (7, 1), (200, 4), (300, 16)):
+        lower = rng.uniform(0, 100, (n, 3))
+        upper = lower + rng.uniform(0, 10, (n, 3))
+        pairs = AabbTree(lower, upper, leaf_size).self_pairs()
+        assert {tuple(p) for p in pairs.tolist()} == brute_force(lower, upper)
+        assert len(pairs) == len({tuple(p) for p in pairs.tolist()})
+
+
+def test_touching_boxes_overlap():
+    tree = AabbTree([(0, 0, 0), (1, 0, 0), (3, 0, 0)], [(1, 1, 1), (2, 1, 1), (4, 1, 1)])
+    assert tree.self_pairs().tolist() == [[0, 1]]
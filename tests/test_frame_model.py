@@ -0,0 +1,81 @@
+import numpy as np
+from freecad.easy_profile_frame.commands.frame_model import (
+    AUTO_ALIGN_A,
+    MITER_CUT,
+    NO_PROCESSING,
+    FrameModel,
+)
+
+# Square frame of 100 mm in the XY plane, members in turn
+SQUARE = [
+    ((0, 0, 0), (100, 0, 0)),
+    ((100, 0, 0), (100, 100, 0)),
+    ((100, 100, 0), (0, 100, 0)),
+    ((0, 100, 0), (0, 0, 0)),
+]
+
+
+def square(size=(20, 20)) -> FrameModel:
+    return FrameModel([s for s, _ in SQUARE], [e for _, e in SQUARE], [size])
+
+
+def test_find_joints_square():
+    j = square().joints
+    assert len(j) == 4
+    pairs = sorted(zip(j.member_a.tolist(), j.member_b.tolist()))
+    assert pairs == [(0, 1), (0, 3), (1, 2), (2, 3)]
+    assert np.allclose(j.angle, 90)
+    # Each corner is its own point
+    assert len(set(j.node.tolist())) == 4
+
+
+def test_find_joints_tolerance_and_collinear():
+    model = FrameModel(
+        [(0, 0, 0), (10 + 1e-9, 0, 0), (50, 0, 0)],
+        [(10, 0, 0), (20, 0, 0), (60, 0, 0)],
+        [(20, 20)],
+        tolerance=1e-6,
+    )
+    j = model.joints
+    assert (j.member_a.tolist(), j.member_b.tolist()) == ([0], [1])
+    assert (j.end_a.tolist(), j.end_b.tolist()) == ([1], [0])
+    assert np.allclose(j.angle, 0)
+
+
+def test_members_touching_at_both_ends_keep_the_first_joint():
+    model = FrameModel([(0, 0, 0), (0, 0, 0)], [(10, 0, 0), (10, 0, 0)], [(20, 20)])
+    j = model.joints
+    assert len(j) == 1
+    assert (j.end_a[0], j.end_b[0]) == (0, 0)
+
+
+def test_find_joints_high_degree_node():
+    # Five members starting from the same point
+    ends = [(10, 0, 0), (0, 10, 0), (0, 0, 10), (-10, 0, 0), (0, -10, 0)]
+    model = FrameModel([(0, 0, 0)] * 5, ends, [(20, 20)])
+    assert len(model.joints) == 10
+    assert len(set(model.joints.node.tolist())) == 1
+
+
+def test_miter_cut_square():
+    model = square().solve(MITER_CUT)
+    assert np.allclose(model.chamfer_angle, 45)
+    assert np.all(model.chamfer_direction != 0)
+
+
+def test_auto_align_square():
+    model = square((20, 30)).solve(AUTO_ALIGN_A)
+    j = model.joints
+    ext_a = model.extension[j.member_a, j.end_a]
+    ext_b = model.extension[j.member_b, j.end_b]
+    # One member of each joint is shortened by as much as the other is extended
+    assert np.allclose(ext_a + ext_b, 0)
+    assert np.all(ext_a < 0)
+    assert set(np.round(np.abs(ext_a), 6).tolist()) <= {10.0, 15.0}
+    assert len(model.butt_joints[0]) == 4
+
+
+def test_no_processing_resets_treatments():
+    model = square().solve(MITER_CUT).solve(NO_PROCESSING)
+    assert np.all(model.chamfer_angle == 0)
+    assert model.butt_joints is None
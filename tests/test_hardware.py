@@ -0,0 +1,38 @@
+from freecad.easy_profile_frame.commands import joint_types
+from freecad.easy_profile_frame.commands.frame_model import FrameModel
+
+
+def classify(starts, ends) -> list[str]:
+    return sorted(joint_types.classify_nodes(FrameModel(starts, ends, [(20, 20)]))[1])
+
+
+def test_corner_and_splice():
+    assert classify(
+        [(0, 0, 0), (10, 0, 0), (20, 0, 0)], [(10, 0, 0), (20, 0, 0), (20, 10, 0)]
+    ) == [joint_types.CORNER, joint_types.SPLICE]
+
+
+def test_t_joint_cross_and_box_corner():
+    origin = [(0, 0, 0)] * 3
+    assert classify(origin, [(10, 0, 0), (-10, 0, 0), (0, 10, 0)]) == [joint_types.T_JOINT]
+    assert classify(origin, [(10, 0, 0), (0, 10, 0), (0, 0, 10)]) == [joint_types.CORNER3]
+    assert classify(
+        [(0, 0, 0)] * 4, [(10, 0, 0), (-10, 0, 0), (0, 10, 0), (0, -10, 0)]
+    ) == [joint_types.CROSS]
+    assert classify(
+        [(0, 0, 0)] * 4, [(10, 0, 0), (-10, 0, 0), (0, 10, 0), (0, 0, 10)]
+    ) == [joint_types.T_CORNER]
+
+
+def test_unclassified_nodes():
+    ends = [(10, 0, 0), (-10, 0, 0), (0, 10, 0), (0, -10, 0), (0, 0, 10)]
+    assert classify([(0, 0, 0)] * 5, ends) == ["Node5"]
+
+
+def test_parse_kit():
+    assert joint_types.parse_kit("Bracket:2; T-nut:4;Bolt") == [
+        ("Bracket", 2.0),
+        ("T-nut", 4.0),
+        ("Bolt", 1.0),
+    ]
+    assert joint_types.parse_kit("") == []
@@ -0,0 +1,72 @@
+from freecad.easy_profile_frame.commands.wire_preprocess import (
+    merge_collinear,
+    preprocess_segments,
+    split_at_intersections,
+)
+
+TOL = 1e-6
+
+
+def close(a, b) -> bool:
+    return all(abs(x - y) <= 1e-6 for x, y in zip(a, b))
+
+
+def same_segment(seg, expected) -> bool:
+    return (close(seg[0], expected[0]) and close(seg[1], expected[1])) or (
+        close(seg[0], expected[1]) and close(seg[1], expected[0])
+    )
+
+
+def test_merge_overlapping_collinear():
+    result = merge_collinear([((0, 0, 0), (10, 0, 0)), ((5, 0, 0), (15, 0, 0))], TOL)
+    assert len(result) == 1
+    seg, origin, sources = result[0]
+    assert origin is None
+    assert sources == (0, 1)
+    assert same_segment(seg, ((0, 0, 0), (15, 0, 0)))
+
+
+def test_merge_keeps_covering_source_and_touching_segments():
+    segments = [((0, 0, 0), (10, 0, 0)), ((2, 0, 0), (8, 0, 0)), ((10, 0, 0), (20, 0, 0))]
+    result = merge_collinear(segments, TOL)
+    assert sorted(origin for _, origin, _ in result) == [0, 2]
+
+
+def test_merge_drops_zero_length():
+    assert merge_collinear([((1, 1, 1), (1, 1, 1))], TOL) == []
+
+
+def test_split_t_junction():
+    pieces = split_at_intersections(
+        [((0, 0, 0), (10, 0, 0)), ((5, 0, 0), (5, 10, 0))], TOL
+    )
+    assert len(pieces[0]) == 2
+    assert same_segment(pieces[0][0], ((0, 0, 0), (5, 0, 0)))
+    assert same_segment(pieces[0][1], ((5, 0, 0), (10, 0, 0)))
+    assert len(pieces[1]) == 1
+
+
+def test_split_crossing():
+    pieces = split_at_intersections(
+        [((0, 0, 0), (10, 0, 0)), ((5, -5, 0), (5, 5, 0))], TOL
+    )
+    assert [len(p) for p in pieces] == [2, 2]
+
+
+def test_preprocess_keeps_untouched_sources():
+    segments = [((0, 0, 0), (10, 0, 0)), ((0, 5, 0), (10, 5, 0))]
+    assert preprocess_segments(segments, TOL) == [
+        (segments[0], 0, (0,)),
+        (segments[1], 1, (1,)),
+    ]
+
+
+def test_preprocess_pieces_keep_their_sources():
+    segments = [((0, 0, 0), (10, 0, 0)), ((5, 0, 0), (5, 10, 0))]
+    result = preprocess_segments(segments, TOL)
+    assert [(origin, sources) for _, origin, sources in result] == [
+        (None, (0,)),
+        (None, (0,)),
+        (1, (1,)),
+    ]
+    assert same_segment(result[0][0], ((0, 0, 0), (5, 0, 0)))